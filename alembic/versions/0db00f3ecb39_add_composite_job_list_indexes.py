@@ -0,0 +1,52 @@
+"""add_composite_job_list_indexes
+
+Revision ID: 0db00f3ecb39
+Revises: 556295a40b3b
+Create Date: 2026-10-17 09:12:41.220418
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from storytime.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "0db00f3ecb39"
+down_revision: str | None = "556295a40b3b"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Job list: WHERE user_id = ? [AND status = ?] ORDER BY created_at DESC
+    create_index_concurrently(
+        "ix_jobs_user_created", "jobs", ["user_id", sa.text("created_at DESC")]
+    )
+    create_index_concurrently(
+        "ix_jobs_user_status_created", "jobs", ["user_id", "status", sa.text("created_at DESC")]
+    )
+    # Nothing orders jobs by created_at without filtering on user_id first
+    drop_index_concurrently("ix_jobs_created_at", "jobs")
+
+    # Recent progress: WHERE user_id = ? ORDER BY last_played_at DESC LIMIT n
+    drop_index_concurrently("idx_progress_user_updated", "playback_progress")
+    create_index_concurrently(
+        "idx_progress_user_last_played",
+        "playback_progress",
+        ["user_id", sa.text("last_played_at DESC")],
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("idx_progress_user_last_played", table_name="playback_progress")
+    op.create_index(
+        "idx_progress_user_updated", "playback_progress", ["user_id", "updated_at"], unique=False
+    )
+    op.create_index(op.f("ix_jobs_created_at"), "jobs", ["created_at"], unique=False)
+    op.drop_index("ix_jobs_user_status_created", table_name="jobs")
+    op.drop_index("ix_jobs_user_created", table_name="jobs")
@@ -0,0 +1,53 @@
+"""use_jsonb_columns
+
+Revision ID: 4f8b6e2d0c19
+Revises: e2c4a9b17f35
+Create Date: 2026-10-17 12:15:08.402117
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "4f8b6e2d0c19"
+down_revision: str | None = "e2c4a9b17f35"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+JSON_COLUMNS = {
+    "jobs": ["config", "result_data"],
+    "job_steps": ["step_metadata"],
+    "vector_store_files": ["file_metadata"],
+    "tutor_conversations": ["messages", "session_metadata"],
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, columns in JSON_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=postgresql.JSONB(),
+                existing_type=sa.JSON(),
+                postgresql_using=f"{column}::jsonb",
+            )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, columns in JSON_COLUMNS.items():
+        for column in columns:
+            op.alter_column(
+                table,
+                column,
+                type_=sa.JSON(),
+                existing_type=postgresql.JSONB(),
+                postgresql_using=f"{column}::json",
+            )
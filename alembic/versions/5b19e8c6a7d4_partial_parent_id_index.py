@@ -0,0 +1,38 @@
+"""partial_parent_id_index
+
+Revision ID: 5b19e8c6a7d4
+Revises: d3a70e5f92b6
+Create Date: 2026-10-17 13:58:30.671293
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from storytime.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "5b19e8c6a7d4"
+down_revision: str | None = "d3a70e5f92b6"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Build the replacement first so child lookups are never left without an index
+    create_index_concurrently(
+        "ix_jobs_parent_id_partial",
+        "jobs",
+        ["parent_id"],
+        postgresql_where=sa.text("parent_id IS NOT NULL"),
+    )
+    drop_index_concurrently("ix_jobs_parent_id", "jobs")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_jobs_parent_id"), "jobs", ["parent_id"], unique=False)
+    op.drop_index("ix_jobs_parent_id_partial", table_name="jobs")
@@ -0,0 +1,39 @@
+"""partial_active_jobs_index
+
+Revision ID: 7a3e91c4d2f0
+Revises: 0db00f3ecb39
+Create Date: 2026-10-17 09:40:03.518774
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from storytime.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "7a3e91c4d2f0"
+down_revision: str | None = "0db00f3ecb39"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Only queued and running jobs are ever looked up by status alone; settled jobs
+    # (the vast majority of rows) stay out of the index entirely.
+    create_index_concurrently(
+        "ix_jobs_active",
+        "jobs",
+        ["status", "created_at"],
+        postgresql_where=sa.text("status IN ('PENDING', 'PROCESSING')"),
+    )
+    drop_index_concurrently("ix_jobs_status", "jobs")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_jobs_status"), "jobs", ["status"], unique=False)
+    op.drop_index("ix_jobs_active", table_name="jobs")
@@ -0,0 +1,33 @@
+"""drop_users_updated_at
+
+Revision ID: 8e4d1a6c05b3
+Revises: f1c8b2e94a60
+Create Date: 2026-10-17 15:33:09.841572
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "8e4d1a6c05b3"
+down_revision: str | None = "f1c8b2e94a60"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.drop_column("users", "updated_at", if_exists=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.add_column(
+        "users",
+        sa.Column("updated_at", sa.DateTime(), server_default=sa.func.now(), nullable=False),
+    )
+    op.alter_column("users", "updated_at", server_default=None)
@@ -0,0 +1,29 @@
+"""drop_redundant_jobs_user_index
+
+Revision ID: 91d0f5a7c3e8
+Revises: 4f8b6e2d0c19
+Create Date: 2026-10-17 12:31:44.905263
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from storytime.migration_helpers import drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "91d0f5a7c3e8"
+down_revision: str | None = "4f8b6e2d0c19"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # ix_jobs_user_created leads with user_id and serves every user_id lookup
+    drop_index_concurrently("ix_jobs_user_id", "jobs")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_jobs_user_id"), "jobs", ["user_id"], unique=False)
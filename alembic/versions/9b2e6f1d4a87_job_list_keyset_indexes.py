@@ -0,0 +1,49 @@
+"""job_list_keyset_indexes
+
+Revision ID: 9b2e6f1d4a87
+Revises: 8e4d1a6c05b3
+Create Date: 2026-10-17 16:48:12.305871
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from storytime.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "9b2e6f1d4a87"
+down_revision: str | None = "8e4d1a6c05b3"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Job list keyset pagination: WHERE user_id = ? [AND status = ?]
+    #   AND (created_at, id) < (?, ?) ORDER BY created_at DESC, id DESC
+    # Build the replacements first so the list query is never left without an index
+    create_index_concurrently(
+        "ix_jobs_user_created_id",
+        "jobs",
+        ["user_id", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    create_index_concurrently(
+        "ix_jobs_user_status_created_id",
+        "jobs",
+        ["user_id", "status", sa.text("created_at DESC"), sa.text("id DESC")],
+    )
+    drop_index_concurrently("ix_jobs_user_created", "jobs")
+    drop_index_concurrently("ix_jobs_user_status_created", "jobs")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(
+        "ix_jobs_user_status_created", "jobs", ["user_id", "status", sa.text("created_at DESC")]
+    )
+    op.create_index("ix_jobs_user_created", "jobs", ["user_id", sa.text("created_at DESC")])
+    op.drop_index("ix_jobs_user_status_created_id", table_name="jobs")
+    op.drop_index("ix_jobs_user_created_id", table_name="jobs")
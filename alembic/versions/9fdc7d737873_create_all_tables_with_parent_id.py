@@ -1,7 +1,7 @@
 """Create all tables with parent_id
 
 Revision ID: 9fdc7d737873
-Revises: d5a58121007b
+Revises:
 Create Date: 2025-06-21 22:46:26.936233
 
 """
@@ -0,0 +1,117 @@
+"""fold_user_vector_stores_into_users
+
+Revision ID: a6f2d4b83e17
+Revises: 5b19e8c6a7d4
+Create Date: 2026-10-17 14:40:12.583906
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+from storytime.migration_helpers import batched_update, get_foreign_keys
+
+# revision identifiers, used by Alembic.
+revision: str = "a6f2d4b83e17"
+down_revision: str | None = "5b19e8c6a7d4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+BACKFILL_USERS = """
+WITH batch AS (
+    SELECT u.id, uvs.openai_vector_store_id
+    FROM users u JOIN user_vector_stores uvs ON uvs.user_id = u.id
+    WHERE u.openai_vector_store_id IS NULL
+    LIMIT :batch_size
+    FOR UPDATE OF u
+)
+UPDATE users SET openai_vector_store_id = batch.openai_vector_store_id
+FROM batch WHERE users.id = batch.id
+"""
+
+BACKFILL_FILES = """
+WITH batch AS (
+    SELECT f.id, uvs.user_id
+    FROM vector_store_files f JOIN user_vector_stores uvs ON uvs.id = f.user_vector_store_id
+    WHERE f.user_id IS NULL
+    LIMIT :batch_size
+    FOR UPDATE OF f
+)
+UPDATE vector_store_files SET user_id = batch.user_id
+FROM batch WHERE vector_store_files.id = batch.id
+"""
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # user_vector_stores is 1:1 with users (unique on user_id); keep the id on users instead
+    op.add_column("users", sa.Column("openai_vector_store_id", sa.String(), nullable=True))
+    op.add_column(
+        "vector_store_files",
+        sa.Column("user_id", postgresql.UUID(as_uuid=False), nullable=True),
+    )
+
+    batched_update(BACKFILL_USERS)
+    batched_update(BACKFILL_FILES)
+
+    op.alter_column("vector_store_files", "user_id", nullable=False)
+    op.create_foreign_key(
+        "vector_store_files_user_id_fkey", "vector_store_files", "users", ["user_id"], ["id"]
+    )
+    op.create_index(
+        op.f("ix_vector_store_files_user_id"), "vector_store_files", ["user_id"], unique=False
+    )
+
+    for fk in get_foreign_keys(
+        "vector_store_files", expected=[("user_vector_store_id", "user_vector_stores")]
+    ):
+        if fk["referred_table"] == "user_vector_stores":
+            op.drop_constraint(fk["name"], "vector_store_files", type_="foreignkey")
+    op.drop_column("vector_store_files", "user_vector_store_id")
+    op.drop_table("user_vector_stores")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_table(
+        "user_vector_stores",
+        sa.Column("id", postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column("user_id", postgresql.UUID(as_uuid=False), nullable=False),
+        sa.Column("openai_vector_store_id", sa.String(), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=False),
+        sa.Column("updated_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("user_id", name="unique_user_vector_store"),
+    )
+    op.execute(
+        "INSERT INTO user_vector_stores "
+        "(id, user_id, openai_vector_store_id, created_at, updated_at) "
+        "SELECT gen_random_uuid(), id, openai_vector_store_id, now(), now() "
+        "FROM users WHERE openai_vector_store_id IS NOT NULL"
+    )
+
+    op.add_column(
+        "vector_store_files",
+        sa.Column("user_vector_store_id", postgresql.UUID(as_uuid=False), nullable=True),
+    )
+    op.execute(
+        "UPDATE vector_store_files f SET user_vector_store_id = uvs.id "
+        "FROM user_vector_stores uvs WHERE uvs.user_id = f.user_id"
+    )
+    op.alter_column("vector_store_files", "user_vector_store_id", nullable=False)
+    op.create_foreign_key(
+        "vector_store_files_user_vector_store_id_fkey",
+        "vector_store_files",
+        "user_vector_stores",
+        ["user_vector_store_id"],
+        ["id"],
+    )
+
+    op.drop_index(op.f("ix_vector_store_files_user_id"), table_name="vector_store_files")
+    op.drop_constraint("vector_store_files_user_id_fkey", "vector_store_files", type_="foreignkey")
+    op.drop_column("vector_store_files", "user_id")
+    op.drop_column("users", "openai_vector_store_id")
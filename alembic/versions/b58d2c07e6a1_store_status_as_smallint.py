@@ -0,0 +1,105 @@
+"""store_status_as_smallint
+
+Revision ID: b58d2c07e6a1
+Revises: 7a3e91c4d2f0
+Create Date: 2026-10-17 10:21:57.064310
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "b58d2c07e6a1"
+down_revision: str | None = "7a3e91c4d2f0"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Must match JOB_STATUS_CODES / STEP_STATUS_CODES in storytime.database
+JOB_STATUSES = ("PENDING", "PROCESSING", "COMPLETED", "FAILED", "CANCELLED")
+STEP_STATUSES = ("PENDING", "RUNNING", "COMPLETED", "FAILED")
+
+
+def _to_code(column: str, names: Sequence[str]) -> str:
+    whens = " ".join(f"WHEN '{name}' THEN {code}" for code, name in enumerate(names))
+    return f"CASE {column} {whens} END"
+
+
+def _to_name(column: str, names: Sequence[str], enum_name: str) -> str:
+    whens = " ".join(f"WHEN {code} THEN '{name}'" for code, name in enumerate(names))
+    return f"(CASE {column} {whens} END)::{enum_name}"
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # The partial index predicate compares against enum literals, so it cannot survive
+    # the type change; ix_jobs_user_status_created is rebuilt automatically.
+    op.drop_index("ix_jobs_active", table_name="jobs")
+
+    op.alter_column(
+        "jobs",
+        "status",
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=_to_code("status", JOB_STATUSES),
+    )
+    op.alter_column(
+        "job_steps",
+        "status",
+        type_=sa.SmallInteger(),
+        existing_nullable=False,
+        postgresql_using=_to_code("status", STEP_STATUSES),
+    )
+    op.execute("DROP TYPE jobstatus")
+    op.execute("DROP TYPE stepstatus")
+
+    op.create_check_constraint(
+        "ck_jobs_status", "jobs", f"status BETWEEN 0 AND {len(JOB_STATUSES) - 1}"
+    )
+    op.create_check_constraint(
+        "ck_job_steps_status", "job_steps", f"status BETWEEN 0 AND {len(STEP_STATUSES) - 1}"
+    )
+    op.create_index(
+        "ix_jobs_active",
+        "jobs",
+        ["status", "created_at"],
+        unique=False,
+        postgresql_where=sa.text("status IN (0, 1)"),
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index("ix_jobs_active", table_name="jobs")
+    op.drop_constraint("ck_job_steps_status", "job_steps", type_="check")
+    op.drop_constraint("ck_jobs_status", "jobs", type_="check")
+
+    jobstatus = sa.Enum(*JOB_STATUSES, name="jobstatus")
+    stepstatus = sa.Enum(*STEP_STATUSES, name="stepstatus")
+    jobstatus.create(op.get_bind())
+    stepstatus.create(op.get_bind())
+
+    op.alter_column(
+        "jobs",
+        "status",
+        type_=jobstatus,
+        existing_nullable=False,
+        postgresql_using=_to_name("status", JOB_STATUSES, "jobstatus"),
+    )
+    op.alter_column(
+        "job_steps",
+        "status",
+        type_=stepstatus,
+        existing_nullable=False,
+        postgresql_using=_to_name("status", STEP_STATUSES, "stepstatus"),
+    )
+    op.create_index(
+        "ix_jobs_active",
+        "jobs",
+        ["status", "created_at"],
+        unique=False,
+        postgresql_where=sa.text("status IN ('PENDING', 'PROCESSING')"),
+    )
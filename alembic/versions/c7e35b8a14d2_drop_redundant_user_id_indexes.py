@@ -0,0 +1,37 @@
+"""drop_redundant_user_id_indexes
+
+Revision ID: c7e35b8a14d2
+Revises: 91d0f5a7c3e8
+Create Date: 2026-10-17 12:48:19.337520
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+from storytime.migration_helpers import drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "c7e35b8a14d2"
+down_revision: str | None = "91d0f5a7c3e8"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Each index duplicates, or is a left prefix of, a unique constraint or composite index
+REDUNDANT_INDEXES = {
+    "ix_user_vector_stores_user_id": "user_vector_stores",  # unique_user_vector_store
+    "ix_playback_progress_user_id": "playback_progress",  # unique_user_job_progress
+    "ix_tutor_conversations_user_id": "tutor_conversations",  # idx_tutor_conv_user_job
+}
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for index, table in REDUNDANT_INDEXES.items():
+        drop_index_concurrently(index, table)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for index, table in REDUNDANT_INDEXES.items():
+        op.create_index(index, table, ["user_id"], unique=False)
@@ -0,0 +1,54 @@
+"""store_progress_as_basis_points
+
+Revision ID: d3a70e5f92b6
+Revises: c7e35b8a14d2
+Create Date: 2026-10-17 13:26:52.118374
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision: str = "d3a70e5f92b6"
+down_revision: str | None = "c7e35b8a14d2"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# (table, column, check constraint) for every 0.0-1.0 fraction column
+FRACTION_COLUMNS = [
+    ("jobs", "progress", "ck_jobs_progress"),
+    ("job_steps", "progress", "ck_job_steps_progress"),
+    ("playback_progress", "percentage_complete", "ck_playback_progress_percentage"),
+]
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table, column, check in FRACTION_COLUMNS:
+        op.alter_column(
+            table,
+            column,
+            type_=sa.SmallInteger(),
+            existing_type=sa.Float(),
+            existing_nullable=False,
+            postgresql_using=f"round(least(greatest({column}, 0), 1) * 10000)::smallint",
+        )
+        op.create_check_constraint(check, table, f"{column} BETWEEN 0 AND 10000")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table, column, check in FRACTION_COLUMNS:
+        op.drop_constraint(check, table, type_="check")
+        op.alter_column(
+            table,
+            column,
+            type_=sa.Float(),
+            existing_type=sa.SmallInteger(),
+            existing_nullable=False,
+            postgresql_using=f"{column} / 10000.0",
+        )
@@ -0,0 +1,84 @@
+"""use_native_uuid_ids
+
+Revision ID: e2c4a9b17f35
+Revises: b58d2c07e6a1
+Create Date: 2026-10-17 11:02:36.781945
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+from alembic import op
+from storytime.migration_helpers import get_foreign_keys
+
+# revision identifiers, used by Alembic.
+revision: str = "e2c4a9b17f35"
+down_revision: str | None = "b58d2c07e6a1"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+# Every id-shaped column; OpenAI ids and chapter ids are not UUIDs and stay as strings.
+ID_COLUMNS = {
+    "users": ["id"],
+    "jobs": ["id", "user_id", "parent_id"],
+    "job_steps": ["id", "job_id"],
+    "playback_progress": ["id", "user_id", "job_id"],
+    "user_vector_stores": ["id", "user_id"],
+    "vector_store_files": ["id", "user_vector_store_id", "job_id"],
+    "tutor_conversations": ["id", "user_id", "job_id"],
+}
+
+# Foreign keys at this revision as (column, referred table); reflected when online, used
+# as-is when writing an offline (--sql) script.
+FOREIGN_KEYS = {
+    "jobs": [("parent_id", "jobs"), ("user_id", "users")],
+    "job_steps": [("job_id", "jobs")],
+    "playback_progress": [("job_id", "jobs"), ("user_id", "users")],
+    "user_vector_stores": [("user_id", "users")],
+    "vector_store_files": [("user_vector_store_id", "user_vector_stores"), ("job_id", "jobs")],
+    "tutor_conversations": [("job_id", "jobs"), ("user_id", "users")],
+}
+
+
+def _drop_foreign_keys() -> list[tuple[str, dict]]:
+    """Drop every FK between the tables above and return them for re-creation."""
+    foreign_keys = [
+        (table, fk)
+        for table in ID_COLUMNS
+        for fk in get_foreign_keys(table, expected=FOREIGN_KEYS.get(table, ()))
+    ]
+    for table, fk in foreign_keys:
+        op.drop_constraint(fk["name"], table, type_="foreignkey")
+    return foreign_keys
+
+
+def _create_foreign_keys(foreign_keys: list[tuple[str, dict]]) -> None:
+    for table, fk in foreign_keys:
+        op.create_foreign_key(
+            fk["name"],
+            table,
+            fk["referred_table"],
+            fk["constrained_columns"],
+            fk["referred_columns"],
+        )
+
+
+def _alter_ids(type_: sa.types.TypeEngine, cast: str) -> None:
+    foreign_keys = _drop_foreign_keys()
+    for table, columns in ID_COLUMNS.items():
+        for column in columns:
+            op.alter_column(table, column, type_=type_, postgresql_using=f"{column}::{cast}")
+    _create_foreign_keys(foreign_keys)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    _alter_ids(postgresql.UUID(as_uuid=False), "uuid")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    _alter_ids(sa.String(), "varchar")
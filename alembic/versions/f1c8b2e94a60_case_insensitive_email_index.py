@@ -0,0 +1,36 @@
+"""case_insensitive_email_index
+
+Revision ID: f1c8b2e94a60
+Revises: a6f2d4b83e17
+Create Date: 2026-10-17 15:07:45.219830
+
+"""
+
+from collections.abc import Sequence
+
+import sqlalchemy as sa
+
+from alembic import op
+from storytime.migration_helpers import create_index_concurrently, drop_index_concurrently
+
+# revision identifiers, used by Alembic.
+revision: str = "f1c8b2e94a60"
+down_revision: str | None = "a6f2d4b83e17"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    # Login and signup look emails up with lower(email) = lower(:email). Fails if existing
+    # rows differ only by case; merge those accounts before upgrading.
+    create_index_concurrently(
+        "ix_users_email_lower", "users", [sa.text("lower(email)")], unique=True
+    )
+    drop_index_concurrently("ix_users_email", "users")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
+    op.drop_index("ix_users_email_lower", table_name="users")
@@ -158,10 +158,11 @@ export const CreateJobRequestSchema = z.object({
 // List responses
 export const JobListResponseSchema = z.object({
   jobs: z.array(JobResponseSchema),
-  total: z.number().int(),
+  total: z.number().int().nullable(),
   page: z.number().int(),
   page_size: z.number().int(),
-  total_pages: z.number().int(),
+  total_pages: z.number().int().nullable(),
+  next_cursor: z.string().nullable(),
 });
 
 // Export inferred types
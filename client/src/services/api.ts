@@ -131,18 +131,19 @@ class ApiClient {
     status?: string;
     job_type?: string;
   }): Promise<PaginatedResponse<JobResponse>> {
+    // The job list UI pages by number, so ask for the (otherwise skipped) total count
     const response = await this.client.get<JobListResponse>(
       '/api/v1/jobs',
-      { params }
+      { params: { ...params, include_total: true } }
     );
 
     // Transform backend response to match client interface
     return {
       items: response.data.jobs,
-      total: response.data.total,
+      total: response.data.total ?? 0,
       page: response.data.page,
       limit: response.data.page_size,
-      pages: response.data.total_pages,
+      pages: response.data.total_pages ?? 0,
     };
   }
 
@@ -6,16 +6,23 @@ This script exports the OpenAPI schema from the FastAPI app to openapi.json
 for use by the frontend client code generation tools.
 
 Usage:
-    python generate_openapi.py
+    python generate_openapi.py [--pretty]
+
+Alongside openapi.json it writes a gzipped copy, openapi.json.gz, for distribution.
+Pass --pretty for an indented, human-readable openapi.json.
 
 The generated openapi.json file can then be used by the frontend:
     cd client && npm run generate-api
 """
 
-import json
+import argparse
+import gzip
+import os
 import sys
 from pathlib import Path
 
+import orjson
+
 # Add src directory to path to import the app
 sys.path.insert(0, str(Path(__file__).parent / "src"))
 
@@ -29,17 +36,28 @@ except ImportError as e:
     sys.exit(1)
 
 
-def generate_openapi_schema():
-    """Generate and save OpenAPI schema to openapi.json."""
+def _write_atomic(path: Path, data: bytes, compress: bool = False) -> None:
+    """Write data beside path, then swap it in so readers never see a partial file."""
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    if compress:
+        with gzip.open(tmp_path, "wb", compresslevel=3) as f:
+            f.write(data)
+    else:
+        tmp_path.write_bytes(data)
+    os.replace(tmp_path, path)
+
+
+def generate_openapi_schema(pretty: bool = False):
+    """Generate and save OpenAPI schema to openapi.json and openapi.json.gz."""
     try:
         # Get the OpenAPI schema from the FastAPI app
         openapi_schema = app.openapi()
+        data = orjson.dumps(openapi_schema, option=orjson.OPT_INDENT_2 if pretty else 0)
 
         # Write to openapi.json in the root directory
         output_path = Path(__file__).parent / "openapi.json"
-
-        with open(output_path, "w") as f:
-            json.dump(openapi_schema, f, indent=2)
+        _write_atomic(output_path, data)
+        _write_atomic(output_path.with_suffix(".json.gz"), data, compress=True)
 
         print(f"✅ OpenAPI schema exported to {output_path}")
         print(f"   Total endpoints: {len(openapi_schema.get('paths', {}))}")
@@ -54,4 +72,6 @@ def generate_openapi_schema():
 
 
 if __name__ == "__main__":
-    generate_openapi_schema()
+    parser = argparse.ArgumentParser(description="Export the FastAPI OpenAPI schema.")
+    parser.add_argument("--pretty", action="store_true", help="indent openapi.json")
+    generate_openapi_schema(pretty=parser.parse_args().pretty)
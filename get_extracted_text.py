@@ -1,10 +1,32 @@
 #!/usr/bin/env python3
 """Retrieve the extracted text from DigitalOcean Spaces for comparison."""
 
+import argparse
 import boto3
 import os
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from dotenv import load_dotenv
 
+# Job ID from the successful extraction
+DEFAULT_JOB_ID = "b93ab642-996b-4943-bf8d-5b22558aa942"
+
+parser = argparse.ArgumentParser(description=__doc__)
+parser.add_argument(
+    'job_ids',
+    nargs='*',
+    default=[DEFAULT_JOB_ID],
+    help=f'Job IDs whose input.txt to download (default: {DEFAULT_JOB_ID})'
+)
+parser.add_argument(
+    '--range-size',
+    type=int,
+    default=8,
+    help='Size in MiB of each ranged GET issued in parallel (default: 8)'
+)
+args = parser.parse_args()
+
 # Load environment variables
 load_dotenv('.env.docker')
 
@@ -15,36 +37,59 @@ spaces_region = os.getenv("DO_SPACES_REGION", "nyc3")
 spaces_bucket = os.getenv("DO_SPACES_BUCKET", "storytime")
 spaces_endpoint = os.getenv("DO_SPACES_ENDPOINT", "https://nyc3.digitaloceanspaces.com")
 
-# Job ID from the successful extraction
-job_id = "b93ab642-996b-4943-bf8d-5b22558aa942"
-text_key = f"jobs/{job_id}/input.txt"
-
-# Initialize S3 client for DigitalOcean Spaces
+# One S3 client for DigitalOcean Spaces, shared by every download so its pooled
+# connections (and their TLS sessions) are reused across jobs
 s3 = boto3.client(
     's3',
     endpoint_url=spaces_endpoint,
     aws_access_key_id=spaces_key,
     aws_secret_access_key=spaces_secret,
-    region_name=spaces_region
+    region_name=spaces_region,
+    config=Config(max_pool_connections=32, retries={'mode': 'adaptive', 'max_attempts': 5})
 )
 
-try:
-    # Download the text file
-    response = s3.get_object(Bucket=spaces_bucket, Key=text_key)
-    content = response['Body'].read().decode('utf-8')
+# Large files are fetched as concurrent ranged GETs rather than one serial stream
+transfer_config = TransferConfig(
+    multipart_threshold=args.range_size * 1024 * 1024,
+    multipart_chunksize=args.range_size * 1024 * 1024,
+    max_concurrency=16,
+    use_threads=True
+)
 
-    # Save to local file for comparison
+
+def download(job_id):
+    """Download one job's extracted text to a local file and return its path."""
     output_file = f"extracted_content_{job_id}.txt"
-    with open(output_file, 'w', encoding='utf-8') as f:
-        f.write(content)
+    s3.download_file(spaces_bucket, f"jobs/{job_id}/input.txt", output_file, Config=transfer_config)
+    return output_file
+
+
+def fetch(job_ids):
+    """Download several jobs' extracted text concurrently; return {job_id: path or error}."""
+    results = {}
+    with ThreadPoolExecutor(max_workers=min(len(job_ids), 8)) as executor:
+        futures = {executor.submit(download, job_id): job_id for job_id in job_ids}
+        for future in as_completed(futures):
+            try:
+                results[futures[future]] = future.result()
+            except Exception as e:
+                results[futures[future]] = e
+    return results
+
 
-    print(f"✅ Extracted text saved to: {output_file}")
+for job_id, result in fetch(args.job_ids).items():
+    if isinstance(result, Exception):
+        print(f"❌ Error retrieving text for {job_id}: {result}")
+        continue
+
+    with open(result, encoding='utf-8') as f:
+        content = f.read()
+
+    print(f"✅ Extracted text saved to: {result}")
     print(f"📊 Total length: {len(content)} characters")
     print(f"📊 Word count: {len(content.split())} words")
-    print("\n📝 First 1000 characters:\n")
-    print("-" * 80)
-    print(content[:1000])
-    print("-" * 80)
-
-except Exception as e:
-    print(f"❌ Error retrieving text: {e}")
\ No newline at end of file
+    if len(args.job_ids) == 1:
+        print("\n📝 First 1000 characters:\n")
+        print("-" * 80)
+        print(content[:1000])
+        print("-" * 80)
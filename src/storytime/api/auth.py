@@ -1,22 +1,26 @@
-import uuid
-from collections.abc import AsyncGenerator
-from datetime import datetime, timedelta
-
-import jwt
+import asyncio
+import time
+from datetime import datetime
 from typing import Optional
 
-from fastapi import APIRouter, Depends, HTTPException, WebSocket, status
+from fastapi import APIRouter, Depends, HTTPException, Response, WebSocket, status
 from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
 from jwt import InvalidTokenError
 from pydantic import BaseModel, EmailStr
-from sqlalchemy import select
+from sqlalchemy import bindparam, func, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from storytime.api.settings import get_settings
-from storytime.database import AsyncSessionLocal, User
+from storytime.api.utils import model_response
+from storytime.auth_tokens import bearer_token, create_access_token, decode_access_token
+from storytime.database import AsyncSessionLocal, User, get_db, new_id
+
+# Security scheme. Missing credentials are rejected by get_current_user itself, with the
+# same 401 as an invalid token, rather than by HTTPBearer raising a 403 for every probe.
+security = HTTPBearer(auto_error=False)
 
-# Security scheme
-security = HTTPBearer()
+# Case-insensitive email lookup, built once; register and login only bind the email
+USER_BY_EMAIL = select(User).where(func.lower(User.email) == func.lower(bindparam("email")))
 
 
 # Pydantic models for API
@@ -41,21 +45,55 @@ class Token(BaseModel):
     token_type: str
 
 
-# JWT utilities
 settings = get_settings()
 
 
-def create_access_token(data: dict, expires_delta: timedelta | None = None):
-    """Create a JWT access token."""
-    to_encode = data.copy()
-    if expires_delta:
-        expire = datetime.utcnow() + expires_delta
-    else:
-        expire = datetime.utcnow() + timedelta(hours=24)
-
-    to_encode.update({"exp": expire})
-    encoded_jwt = jwt.encode(to_encode, settings.jwt_secret_key, algorithm="HS256")
-    return encoded_jwt
+# Authenticated users by ID, so repeat requests from a caller skip the users query. The
+# cached instances are detached from any session; only their column attributes are read.
+# A write to a users row shows up here once the entry expires, up to USER_CACHE_TTL
+# later. Rows only change when a Celery worker attaches a vector store, in another process
+# whose cache this one cannot clear, and that column is read from the database instead.
+USER_CACHE_TTL = 30  # seconds
+USER_CACHE_SIZE = 10_000
+_user_cache: dict[str, tuple[User, float]] = {}
+# Lookups in flight by user ID: parallel requests from one client (a page fanning out its
+# API calls) wait for the first lookup instead of each querying the same row
+_user_loads: dict[str, asyncio.Future[User | None]] = {}
+
+
+async def get_user_by_id(user_id: str, session: AsyncSession) -> User | None:
+    """Return the user with this ID, from the user cache or else the database."""
+    cached = _user_cache.get(user_id)
+    if cached is not None:
+        user, valid_until = cached
+        if time.time() < valid_until:
+            return user
+        del _user_cache[user_id]
+
+    pending = _user_loads.get(user_id)
+    if pending is not None:
+        await asyncio.wait([pending])
+        if not pending.cancelled() and pending.exception() is None:
+            return pending.result()
+        # That lookup failed or was cancelled with its request; do our own below
+        return await get_user_by_id(user_id, session)
+
+    load = _user_loads[user_id] = asyncio.get_running_loop().create_future()
+    try:
+        user = await session.get(User, user_id)
+        if user is not None:
+            # Detach it so a later rollback or expiry in this session cannot invalidate the
+            # copy other requests will read
+            session.expunge(user)
+            if len(_user_cache) >= USER_CACHE_SIZE:
+                del _user_cache[next(iter(_user_cache))]
+            _user_cache[user_id] = (user, time.time() + USER_CACHE_TTL)
+        load.set_result(user)
+        return user
+    finally:
+        del _user_loads[user_id]
+        if not load.done():
+            load.cancel()
 
 
 async def verify_token(token: str) -> User | None:
@@ -66,7 +104,7 @@ async def verify_token(token: str) -> User | None:
 
     try:
         logger.info(f"Decoding token with secret key length: {len(settings.jwt_secret_key)}")
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=["HS256"])
+        payload = decode_access_token(token)
         user_id: str = payload.get("sub")
         logger.info(f"Token decoded successfully, user_id: {user_id}")
         if user_id is None:
@@ -76,10 +114,9 @@ async def verify_token(token: str) -> User | None:
         logger.error(f"JWT decode error: {e}")
         return None
 
-    # Get user from database
+    # Get user from the user cache or the database
     async with AsyncSessionLocal() as session:
-        result = await session.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+        user = await get_user_by_id(user_id, session)
         if user:
             logger.info(f"User found: {user.email}")
         else:
@@ -88,45 +125,38 @@ async def verify_token(token: str) -> User | None:
     return user
 
 
-async def get_current_user(
-    credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(lambda: AsyncSessionLocal()),
-) -> User:
-    """Get the current authenticated user from JWT token."""
-    credentials_exception = HTTPException(
+def _credentials_error() -> HTTPException:
+    """Build the 401 raised for missing, invalid or unknown-user credentials."""
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
 
+
+async def get_current_user(
+    credentials: HTTPAuthorizationCredentials | None = Depends(security),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    """Get the current authenticated user from JWT token."""
+    if credentials is None:
+        raise _credentials_error()
+
     try:
-        payload = jwt.decode(credentials.credentials, settings.jwt_secret_key, algorithms=["HS256"])
-        user_id: str = payload.get("sub")
-        if user_id is None:
-            raise credentials_exception
+        payload = decode_access_token(credentials.credentials)
     except InvalidTokenError as e:
-        raise credentials_exception from e
+        raise _credentials_error() from e
 
-    # Get user from database
-    async with db as session:
-        result = await session.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+    # Get user from the user cache or the database
+    user_id: str | None = payload.get("sub")
+    user = await get_user_by_id(user_id, db) if user_id is not None else None
 
     if user is None:
-        raise credentials_exception
+        raise _credentials_error()
 
     return user
 
 
-async def get_db() -> AsyncGenerator[AsyncSession, None]:
-    """Database dependency."""
-    async with AsyncSessionLocal() as session:
-        try:
-            yield session
-        finally:
-            await session.close()
-
-
 # Router
 router = APIRouter(prefix="/api/v1/auth", tags=["authentication"])
 
@@ -142,7 +172,7 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
         )
 
     # Check if user already exists
-    result = await db.execute(select(User).where(User.email == user_data.email))
+    result = await db.execute(USER_BY_EMAIL, {"email": user_data.email})
     existing_user = result.scalar_one_or_none()
 
     if existing_user:
@@ -150,9 +180,10 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
             status_code=status.HTTP_400_BAD_REQUEST, detail="Email already registered"
         )
 
-    # Create new user
-    hashed_password = User.hash_password(user_data.password)
-    new_user = User(id=str(uuid.uuid4()), email=user_data.email, hashed_password=hashed_password)
+    # Create new user; bcrypt is deliberately slow and releases the GIL, so hash in a worker
+    # thread rather than stalling every other request on the event loop
+    hashed_password = await asyncio.to_thread(User.hash_password, user_data.password)
+    new_user = User(id=new_id(), email=user_data.email, hashed_password=hashed_password)
 
     db.add(new_user)
     await db.commit()
@@ -165,11 +196,18 @@ async def register(user_data: UserCreate, db: AsyncSession = Depends(get_db)):
 async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
     """Authenticate user and return JWT token."""
 
-    # Get user from database
-    result = await db.execute(select(User).where(User.email == user_data.email))
+    # Look the user up by email
+    result = await db.execute(USER_BY_EMAIL, {"email": user_data.email})
     user = result.scalar_one_or_none()
 
-    if not user or not user.verify_password(user_data.password):
+    if user is not None:
+        authenticated = await asyncio.to_thread(user.verify_password, user_data.password)
+    else:
+        # Run a bcrypt check anyway so an unknown email takes as long as a wrong password
+        # and response times do not reveal which emails have accounts
+        authenticated = await asyncio.to_thread(User.dummy_verify_password)
+
+    if not authenticated:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -183,10 +221,12 @@ async def login(user_data: UserLogin, db: AsyncSession = Depends(get_db)):
 
 
 @router.get("/me", response_model=UserResponse)
-async def get_me(current_user: User = Depends(get_current_user)):
+async def get_me(current_user: User = Depends(get_current_user)) -> Response:
     """Get current user information."""
-    return UserResponse(
-        id=current_user.id, email=current_user.email, created_at=current_user.created_at
+    return model_response(
+        UserResponse(
+            id=current_user.id, email=current_user.email, created_at=current_user.created_at
+        )
     )
 
 
@@ -198,29 +238,21 @@ async def get_current_user_websocket(
     Authenticate user from WebSocket connection.
     Returns None if authentication fails (allows handling in endpoint).
     """
-    # Try to get token from query parameters or headers
-    token = None
-    
-    # Check query parameters first (common for WebSocket connections)
-    if "token" in websocket.query_params:
-        token = websocket.query_params["token"]
-    # Check Authorization header
-    elif "authorization" in websocket.headers:
-        auth = websocket.headers["authorization"]
-        if auth.startswith("Bearer "):
-            token = auth[7:]
-    
+    # Check query parameters first (common for WebSocket connections), then the
+    # Authorization header
+    token = websocket.query_params.get("token")
+    if token is None:
+        token = bearer_token(websocket.headers.get("authorization"))
+
     if not token:
         return None
     
     try:
-        payload = jwt.decode(token, get_settings().jwt_secret_key, algorithms=["HS256"])
+        payload = decode_access_token(token)
         user_id: str = payload.get("sub")
         if user_id is None:
             return None
     except InvalidTokenError:
         return None
     
-    result = await db.execute(select(User).where(User.id == user_id))
-    user = result.scalar_one_or_none()
-    return user
+    return await get_user_by_id(user_id, db)
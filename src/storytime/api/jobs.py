@@ -1,17 +1,24 @@
 """Unified job management API endpoints."""
 
+import base64
+import binascii
 import logging
+import uuid
 from datetime import datetime
-from uuid import uuid4
 
-from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query
-from sqlalchemy import func, select, update
+import orjson
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Query, Response
+from fastapi.responses import StreamingResponse
+from sqlalchemy import func, select, tuple_, update
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import noload, raiseload, selectinload
 
 from storytime.api.auth import get_current_user
-from storytime.database import Job, JobStatus, JobStep, User, get_db
-from storytime.infrastructure.spaces import SpacesClient
+from storytime.api.settings import get_settings
+from storytime.database import AsyncSessionLocal, Job, JobStatus, JobStep, User, get_db, new_id
+from storytime.infrastructure.spaces import get_spaces_client
 from storytime.models import (
+    JOB_STEPS_ADAPTER,
     BookChaptersResponse,
     CreateJobRequest,
     JobAudioResponse,
@@ -23,10 +30,10 @@ from storytime.models import (
     JobType,
     MessageResponse,
 )
-from storytime.services.content_analyzer import ContentAnalyzer
+from storytime.services.content_analyzer import get_content_analyzer
 from storytime.worker.tasks import process_job
 
-from .utils import get_user_job
+from .utils import check_job_id, get_user_job, model_response
 
 # JobProcessor is now simplified and always available
 
@@ -34,6 +41,11 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/jobs", tags=["Jobs"])
 
+# Rows fetched per round trip while streaming a job list from a server-side cursor
+JOB_STREAM_BATCH_SIZE = 50
+# Pasted text longer than this is stored in Spaces rather than in the job's config JSONB
+INLINE_CONTENT_MAX_CHARS = 16 * 1024
+
 
 @router.post("", response_model=JobResponse)
 async def create_job(
@@ -57,7 +69,7 @@ async def create_job(
         job_type = request.job_type
         if not job_type:
             logger.info("Job type not specified, analyzing content for auto-detection")
-            content_analyzer = ContentAnalyzer()
+            content_analyzer = get_content_analyzer()
 
             if content_analyzer.is_available():
                 try:
@@ -67,7 +79,7 @@ async def create_job(
                         analysis_content = request.content
                     elif request.file_key:
                         # Load content from file storage for analysis
-                        spaces_client = SpacesClient()
+                        spaces_client = get_spaces_client()
                         analysis_content = await spaces_client.download_text_file(request.file_key)
                     elif request.url:
                         # For URLs, we'll analyze after scraping during job processing
@@ -94,26 +106,39 @@ async def create_job(
         if not job_type:
             job_type = JobType.TEXT_TO_AUDIO
 
+        # Large pasted text is stored in Spaces and referenced like an uploaded file, so the
+        # jobs row every job query reads stays small; the worker already downloads
+        # input_file_key. If the upload fails the text simply stays inline.
+        job_id = new_id()
+        content = request.content
+        input_file_key = request.file_key
+        if content and len(content) > INLINE_CONTENT_MAX_CHARS:
+            content_key = f"jobs/{job_id}/input.txt"
+            if await get_spaces_client().upload_text_file(content_key, content):
+                content, input_file_key = None, content_key
+
         # Create job record
         job = Job(
-            id=str(uuid4()),
+            id=job_id,
             user_id=current_user.id,
             title=request.title,
             description=request.description,
             status=JobStatus.PENDING,
             progress=0.0,
             config={
-                "content": request.content,
+                "content": content,
                 "url": str(request.url) if request.url else None,
                 "voice_config": request.voice_config.model_dump() if request.voice_config else None,
                 "job_type": job_type.value,
             },
-            input_file_key=request.file_key,
+            input_file_key=input_file_key,
+            # A new job has no steps yet; marking the collection loaded lets the response
+            # below be built from this instance
+            steps=[],
         )
 
         db.add(job)
         await db.commit()
-        await db.refresh(job)
 
         # Schedule job processing in Celery (if available)
         def _enqueue_job(job_id: str) -> None:
@@ -125,8 +150,9 @@ async def create_job(
 
         background_tasks.add_task(_enqueue_job, job.id)
 
-        # Return job response
-        return await _get_job_response(job.id, db)
+        # Return job response. Every column was set here or by a Python-side default, so
+        # there is nothing to read back from the database.
+        return _build_job_response(job)
 
     except Exception as e:
         logger.error(f"Failed to create job: {e!s}", exc_info=True)
@@ -135,12 +161,18 @@ async def create_job(
 
 @router.get("", response_model=JobListResponse)
 async def list_jobs(
-    page: int = Query(1, ge=1, description="Page number"),
+    page: int = Query(1, ge=1, description="Page number (ignored when cursor is given)"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
+    cursor: str | None = Query(
+        None, description="next_cursor from the previous page; continues after its last job"
+    ),
     status: JobStatus | None = Query(None, description="Filter by job status"),
+    include_total: bool = Query(
+        False, description="Also count every matching job to fill total and total_pages"
+    ),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
-) -> JobListResponse:
+) -> Response:
     """List jobs for the current user with filtering and pagination."""
     logger.info(f"Listing jobs for user {current_user.id}")
 
@@ -151,47 +183,105 @@ async def list_jobs(
         if status:
             query = query.where(Job.status == status)
 
-        # Get total count
-        count_query = select(func.count()).select_from(query.subquery())
-        total_result = await db.execute(count_query)
-        total = total_result.scalar() or 0
-
-        # Apply pagination and ordering
-        offset = (page - 1) * page_size
-        query = query.order_by(Job.created_at.desc()).offset(offset).limit(page_size)
-
-        # Execute query
-        result = await db.execute(query)
+        # The count re-runs the whole filter, so it is only paid for when asked for;
+        # next_cursor already tells a client whether more pages follow
+        total = total_pages = None
+        if include_total:
+            count_query = select(func.count()).select_from(query.subquery())
+            total = (await db.execute(count_query)).scalar() or 0
+            total_pages = (total + page_size - 1) // page_size
+
+        # Apply pagination and ordering. A cursor seeks straight past the previous page on
+        # the (user_id, created_at, id) index instead of scanning and discarding an offset.
+        query = query.order_by(Job.created_at.desc(), Job.id.desc())
+        if cursor:
+            query = query.where(_after_cursor(cursor))
+        else:
+            query = query.offset((page - 1) * page_size)
+        # One extra row tells whether another page follows
+        query = query.limit(page_size + 1)
+
+        # Execute query; steps for the whole page arrive in one extra SELECT
+        result = await db.execute(query.options(*_job_options(include_relationships=False)))
         jobs = result.scalars().all()
+        next_cursor = _encode_cursor(jobs[page_size - 1]) if len(jobs) > page_size else None
+        jobs = jobs[:page_size]
 
         # Convert to response models (without full relationships for performance)
-        job_responses = []
-        for job in jobs:
-            job_response = await _get_job_response(job.id, db, include_relationships=False)
-            job_responses.append(job_response)
-
-        total_pages = (total + page_size - 1) // page_size
-
-        return JobListResponse(
-            jobs=job_responses, total=total, page=page, page_size=page_size, total_pages=total_pages
+        job_responses = [_build_job_response(job) for job in jobs]
+
+        return model_response(
+            JobListResponse(
+                jobs=job_responses,
+                total=total,
+                page=page,
+                page_size=page_size,
+                total_pages=total_pages,
+                next_cursor=next_cursor,
+            )
         )
 
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Failed to list jobs: {e!s}", exc_info=True)
         raise HTTPException(status_code=500, detail=f"Failed to list jobs: {e!s}") from e
 
 
+@router.get(
+    "/stream",
+    response_class=StreamingResponse,
+    responses={
+        200: {
+            "description": "One JobResponse JSON object per line",
+            "content": {"application/x-ndjson": {}},
+        }
+    },
+)
+async def stream_jobs(
+    status: JobStatus | None = Query(None, description="Filter by job status"),
+    current_user: User = Depends(get_current_user),
+) -> StreamingResponse:
+    """Stream all of the current user's jobs, newest first, as newline-delimited JSON.
+
+    Rows come from a server-side cursor and each is sent as soon as it is built, so a full
+    job history is never held in memory at once; list_jobs stays the paged variant.
+    """
+    logger.info(f"Streaming jobs for user {current_user.id}")
+
+    query = select(Job).where(Job.user_id == current_user.id)
+    if status:
+        query = query.where(Job.status == status)
+    query = (
+        query.order_by(Job.created_at.desc(), Job.id.desc())
+        .options(*_job_options(include_relationships=False))
+        .execution_options(yield_per=JOB_STREAM_BATCH_SIZE)
+    )
+
+    async def generate():
+        # Its own session: the request's get_db session is closed before a streamed body
+        # is sent, and this one must live until the last row is written
+        async with AsyncSessionLocal() as session:
+            jobs = await session.stream_scalars(query)
+            async for job in jobs:
+                yield _build_job_response(job).model_dump_json() + "\n"
+                # Drop the job and its steps from the identity map once sent
+                session.expunge(job)
+
+    return StreamingResponse(generate(), media_type="application/x-ndjson")
+
+
 @router.get("/{job_id}", response_model=JobResponse)
 async def get_job(
     job_id: str, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
-) -> JobResponse:
+) -> Response:
     """Get detailed job information including steps."""
     logger.info(f"Getting job {job_id} for user {current_user.id}")
 
     try:
         # Verify job exists and belongs to user
         await get_user_job(job_id, current_user.id, db)
-        return await _get_job_response(job_id, db)
+        return model_response(await _get_job_response(job_id, db))
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
@@ -210,25 +300,27 @@ async def cancel_job(
     logger.info(f"Cancelling job {job_id} for user {current_user.id}")
 
     try:
-        # Verify job exists and belongs to user
-        job = await get_user_job(job_id, current_user.id, db)
-
-        # Only allow cancellation of pending or processing jobs
-        if job.status not in [JobStatus.PENDING, JobStatus.PROCESSING]:
-            raise HTTPException(
-                status_code=400, detail=f"Cannot cancel job with status {job.status}"
-            )
+        check_job_id(job_id)
 
-        # Update job status to cancelled
-        await db.execute(
+        # Cancel in one statement: ownership and the pending/processing precondition are
+        # checked by the same UPDATE, so a job finishing concurrently cannot be overwritten
+        now = func.timezone("utc", func.now())  # timestamps are stored as naive UTC
+        result = await db.execute(
             update(Job)
-            .where(Job.id == job_id)
-            .values(
-                status=JobStatus.CANCELLED,
-                updated_at=datetime.utcnow(),
-                completed_at=datetime.utcnow(),
+            .where(
+                Job.id == job_id,
+                Job.user_id == current_user.id,
+                Job.status.in_([JobStatus.PENDING, JobStatus.PROCESSING]),
             )
+            .values(status=JobStatus.CANCELLED, updated_at=now, completed_at=now)
+            .returning(Job.id)
         )
+        if result.first() is None:
+            # Nothing was cancelled; tell a missing job (404) from a finished one (400)
+            job = await get_user_job(job_id, current_user.id, db)
+            raise HTTPException(
+                status_code=400, detail=f"Cannot cancel job with status {job.status}"
+            )
         await db.commit()
 
         return MessageResponse(message="Job cancelled successfully")
@@ -245,7 +337,7 @@ async def cancel_job(
 @router.get("/{job_id}/steps", response_model=list[JobStepResponse])
 async def get_job_steps(
     job_id: str, current_user: User = Depends(get_current_user), db: AsyncSession = Depends(get_db)
-) -> list[JobStepResponse]:
+) -> Response:
     """Get detailed step information for a job."""
     logger.info(f"Getting steps for job {job_id} for user {current_user.id}")
 
@@ -259,23 +351,11 @@ async def get_job_steps(
         )
         steps = result.scalars().all()
 
-        return [
-            JobStepResponse(
-                id=step.id,
-                step_name=step.step_name,
-                step_order=step.step_order,
-                status=step.status,
-                progress=step.progress,
-                error_message=step.error_message,
-                step_metadata=step.step_metadata,
-                created_at=step.created_at,
-                updated_at=step.updated_at,
-                started_at=step.started_at,
-                completed_at=step.completed_at,
-                duration=step.duration,
-            )
-            for step in steps
-        ]
+        step_responses = JOB_STEPS_ADAPTER.validate_python(steps, from_attributes=True)
+        return Response(
+            JOB_STEPS_ADAPTER.dump_json(step_responses, by_alias=True),
+            media_type="application/json",
+        )
 
     except ValueError as e:
         raise HTTPException(status_code=404, detail=str(e)) from e
@@ -307,7 +387,7 @@ async def get_job_audio(
             raise HTTPException(status_code=404, detail="No audio output available for this job")
 
         # Get presigned URLs for both download and streaming
-        spaces_client = SpacesClient()
+        spaces_client = get_spaces_client()
         download_url = await spaces_client.get_presigned_download_url(job.output_file_key)
         streaming_url = await spaces_client.get_streaming_url(job.output_file_key)
 
@@ -350,7 +430,7 @@ async def get_book_chapters(
         # Get aggregated chapter results using unified processor
         from storytime.services.job_processor import JobProcessor
 
-        job_processor = JobProcessor(db, SpacesClient())
+        job_processor = JobProcessor(db, get_spaces_client())
         results = await job_processor.aggregate_chapter_results(job_id)
 
         return BookChaptersResponse(**results)
@@ -367,59 +447,85 @@ async def get_book_chapters(
 # Helper functions
 
 
+def _encode_cursor(job: Job) -> str:
+    """Encode the list position just after this job as an opaque cursor."""
+    position = orjson.dumps([job.created_at.isoformat(), job.id])
+    return base64.urlsafe_b64encode(position).decode().rstrip("=")
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime, str]:
+    """Decode a cursor from _encode_cursor into (created_at, id), or raise a 400."""
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        created_at, job_id = orjson.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(created_at), str(uuid.UUID(job_id))
+    except (AttributeError, binascii.Error, orjson.JSONDecodeError, TypeError, ValueError) as e:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from e
+
+
+def _after_cursor(cursor: str):
+    """Return the WHERE clause selecting jobs listed after the cursor's position.
+
+    The position is compared as a plain tuple so each bind takes its column's type; a
+    tuple_() on the right would bind the id as VARCHAR, which Postgres cannot compare
+    with a uuid column.
+    """
+    return tuple_(Job.created_at, Job.id) < _decode_cursor(cursor)
+
+
+def _job_options(*, include_relationships: bool) -> list:
+    """Loader options that fetch a job's steps (and its parent and children) in bulk.
+
+    Each collection comes from one SELECT ... WHERE id IN (...) for the whole result, so a
+    page of jobs costs a fixed number of queries rather than several per job. A relationship
+    that _build_job_response starts reading must be added here; with DB_RAISE_ON_LAZY_LOAD
+    set, any relationship not listed raises on access instead of silently lazy-loading.
+    """
+    strict = [raiseload("*")] if get_settings().db_raise_on_lazy_load else []
+    job_only = [selectinload(Job.steps), noload(Job.children), *strict]
+    if not include_relationships:
+        return job_only
+    return [
+        selectinload(Job.steps),
+        selectinload(Job.parent).options(*job_only),
+        selectinload(Job.children).options(*job_only),
+        *strict,
+    ]
+
+
 async def _get_job_response(
     job_id: str, db: AsyncSession, include_relationships: bool = True
 ) -> JobResponse:
     """Get job with steps and relationships as response model."""
-    # Get job
-    result = await db.execute(select(Job).where(Job.id == job_id))
+    result = await db.execute(
+        select(Job)
+        .where(Job.id == job_id)
+        .options(*_job_options(include_relationships=include_relationships))
+        # The job may already be in the session from the ownership check; reload it so
+        # the eager loaders above populate it
+        .execution_options(populate_existing=True)
+    )
     job = result.scalar_one_or_none()
 
     if not job:
         raise ValueError(f"Job {job_id} not found")
 
-    # Get job steps
-    steps_result = await db.execute(
-        select(JobStep).where(JobStep.job_id == job_id).order_by(JobStep.step_order)
+    if not include_relationships:
+        return _build_job_response(job)
+
+    children = sorted(job.children, key=lambda child: child.created_at)
+    return _build_job_response(
+        job,
+        parent=_build_job_response(job.parent) if job.parent else None,
+        children=[_build_job_response(child) for child in children],
     )
-    steps = steps_result.scalars().all()
-
-    # Get parent job if exists
-    parent_job = None
-    if include_relationships and job.parent_id:
-        parent_result = await db.execute(select(Job).where(Job.id == job.parent_id))
-        parent_db = parent_result.scalar_one_or_none()
-        if parent_db:
-            parent_job = await _get_job_response(parent_db.id, db, include_relationships=False)
-
-    # Get child jobs
-    children_jobs = []
-    if include_relationships:
-        children_result = await db.execute(
-            select(Job).where(Job.parent_id == job_id).order_by(Job.created_at)
-        )
-        children_db = children_result.scalars().all()
-        for child_db in children_db:
-            child_job = await _get_job_response(child_db.id, db, include_relationships=False)
-            children_jobs.append(child_job)
-
-    step_responses = [
-        JobStepResponse(
-            id=step.id,
-            step_name=step.step_name,
-            step_order=step.step_order,
-            status=step.status,
-            progress=step.progress,
-            error_message=step.error_message,
-            step_metadata=step.step_metadata,
-            created_at=step.created_at,
-            updated_at=step.updated_at,
-            started_at=step.started_at,
-            completed_at=step.completed_at,
-            duration=step.duration,
-        )
-        for step in steps
-    ]
+
+
+def _build_job_response(
+    job: Job, parent: JobResponse | None = None, children: list[JobResponse] | None = None
+) -> JobResponse:
+    """Build the response model for a job whose steps are already loaded."""
+    step_responses = JOB_STEPS_ADAPTER.validate_python(job.steps, from_attributes=True)
 
     # Convert config and result_data to typed models
     config = None
@@ -453,6 +559,6 @@ async def _get_job_response(
         completed_at=job.completed_at,
         duration=job.duration,
         steps=step_responses,
-        children=children_jobs,
-        parent=parent_job,
+        children=children or [],
+        parent=parent,
     )
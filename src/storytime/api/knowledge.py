@@ -4,12 +4,12 @@ import logging
 from typing import Annotated
 
 from fastapi import APIRouter, Depends, HTTPException, status
-from openai import OpenAI
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from storytime.api.auth import get_current_user
 from storytime.api.settings import get_settings
 from storytime.database import User, get_db
+from storytime.infrastructure.openai_client import get_openai_client
 from storytime.models import (
     AskJobQuestionRequest,
     SearchJobRequest,
@@ -34,7 +34,7 @@ async def get_responses_api_service(
             detail="OpenAI API key not configured",
         )
 
-    openai_client = OpenAI(api_key=settings.openai_api_key)
+    openai_client = get_openai_client(settings.openai_api_key)
     return ResponsesAPIVectorStoreService(openai_client, db)
 
 
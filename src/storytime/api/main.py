@@ -1,13 +1,16 @@
+import asyncio
 import logging
 import os
 
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import FileResponse
+from fastapi.responses import FileResponse, ORJSONResponse
 from fastapi.staticfiles import StaticFiles
 
+from storytime.database import calibrate_password_hashing, engine
 from storytime.mcp.auth.oauth import router as oauth_router
 from storytime.mcp.http_server import router as mcp_router
+from storytime.migrations import migration_state, run_migrations, start_background_migrations
 
 from .auth import router as auth_router
 from .jobs import router as jobs_router
@@ -29,7 +32,9 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 # Create FastAPI app first
-app = FastAPI(title="Storytime API", version="0.1.0")
+# Responses are serialized with orjson rather than the stdlib json encoder; job listings,
+# chapter lists and knowledge search results are the JSON-bound paths
+app = FastAPI(title="Storytime API", version="0.1.0", default_response_class=ORJSONResponse)
 
 # Add HTTP-based MCP server
 app.include_router(mcp_router)
@@ -69,6 +74,20 @@ app.include_router(websocket_router)
 @app.on_event("startup")
 async def startup_event():
     """Initialize services on startup."""
+    if settings.migration_mode == "async":
+        start_background_migrations()
+    elif settings.migration_mode == "sync":
+        await asyncio.to_thread(run_migrations)
+    else:
+        # Migrations are applied out of band; don't report them as pending forever
+        migration_state["status"] = "skipped"
+
+    # Fit the bcrypt cost to this host (or apply PASSWORD_HASH_ROUNDS) before serving logins
+    rounds = await asyncio.to_thread(
+        calibrate_password_hashing, settings.password_hash_target_ms, settings.password_hash_rounds
+    )
+    logger.info(f"Password hashing uses bcrypt with {rounds} rounds")
+
     # Auto-start voice assistant in production
     if settings.env == "production":
         try:
@@ -83,8 +102,12 @@ async def startup_event():
 
 @app.get("/api/health", tags=["Utility"])
 async def health() -> dict[str, str]:
-    """Return basic service health status."""
-    return {"status": "ok"}
+    """Return basic service health status, including the DB connection pool's usage."""
+    return {
+        "status": "ok",
+        "db_migration": migration_state["status"],
+        "db_pool": engine.pool.status(),
+    }
 
 
 @app.get("/up", tags=["Utility"])
@@ -1,7 +1,6 @@
 """Playback progress tracking API endpoints."""
 
 import logging
-import uuid
 from datetime import datetime
 
 from fastapi import APIRouter, Depends
@@ -9,8 +8,9 @@ from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from storytime.api.auth import get_current_user
-from storytime.database import PlaybackProgress, User, get_db
+from storytime.database import PlaybackProgress, User, get_db, new_id
 from storytime.models import (
+    PLAYBACK_PROGRESS_ADAPTER,
     MessageResponse,
     PlaybackProgressResponse,
     ResumeInfoResponse,
@@ -88,7 +88,7 @@ async def update_progress(
 
     # Use PostgreSQL's INSERT ... ON CONFLICT DO UPDATE for atomic upsert
     stmt = insert(PlaybackProgress).values(
-        id=str(uuid.uuid4()),
+        id=new_id(),
         user_id=current_user.id,
         job_id=job_id,
         position_seconds=request.position_seconds,
@@ -214,23 +214,7 @@ async def get_recent_progress(
     )
     progress_records = result.scalars().all()
 
-    return [
-        PlaybackProgressResponse(
-            id=progress.id,
-            user_id=progress.user_id,
-            job_id=progress.job_id,
-            position_seconds=progress.position_seconds,
-            duration_seconds=progress.duration_seconds,
-            percentage_complete=progress.percentage_complete,
-            current_chapter_id=progress.current_chapter_id,
-            current_chapter_position=progress.current_chapter_position,
-            is_completed=progress.is_completed,
-            last_played_at=progress.last_played_at,
-            created_at=progress.created_at,
-            updated_at=progress.updated_at,
-        )
-        for progress in progress_records
-    ]
+    return PLAYBACK_PROGRESS_ADAPTER.validate_python(progress_records, from_attributes=True)
 
 
 # Helper functions
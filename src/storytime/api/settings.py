@@ -1,5 +1,6 @@
 import logging
 import os
+import tempfile
 from functools import lru_cache
 from typing import Literal
 
@@ -29,6 +30,60 @@ class Settings(BaseSettings):
     )
     redis_url: str | None = Field(default=None, description="Redis URL", alias="REDIS_URL")
 
+    migration_mode: Literal["async", "sync", "skip"] = Field(
+        default="skip",
+        description="Run alembic upgrade at API startup: in a background thread, blocking, or not",
+    )
+
+    # Gemini
+    gemini_max_concurrency: int = Field(
+        default=4, description="Maximum concurrent Gemini requests issued by one operation"
+    )
+
+    # LLM response cache
+    llm_cache_enabled: bool = Field(
+        default=True, description="Reuse stored Gemini responses for identical requests"
+    )
+    llm_cache_path: str = Field(
+        default=os.path.join(tempfile.gettempdir(), "storytime_llm_cache.sqlite3"),
+        description="SQLite file backing the LLM response cache",
+    )
+    llm_cache_max_age_days: int = Field(
+        default=30, ge=1, description="Days a cached LLM response is reused before it is pruned"
+    )
+
+    # Database connection pool
+    db_pool_size: int = Field(default=10, description="Persistent connections kept in the pool")
+    db_max_overflow: int = Field(
+        default=20, description="Extra connections allowed above pool size under burst load"
+    )
+    db_pool_timeout: int = Field(default=30, description="Seconds to wait for a free connection")
+    db_pool_recycle: int = Field(
+        default=1800, description="Seconds after which a pooled connection is replaced"
+    )
+    db_statement_cache_size: int = Field(
+        default=512, description="Prepared statements cached per connection (asyncpg)"
+    )
+    db_echo: bool = Field(default=False, description="Log every SQL statement")
+    db_raise_on_lazy_load: bool = Field(
+        default=False,
+        description="Make job queries raise on any relationship they did not load up front, "
+        "to catch accidental N+1 queries in development",
+    )
+    db_pgbouncer: bool = Field(
+        default=False,
+        description="DATABASE_URL points at PgBouncer in transaction mode; disables the "
+        "local pool and prepared statements",
+    )
+
+    # Password hashing (bcrypt)
+    password_hash_rounds: int | None = Field(
+        default=None, description="bcrypt cost factor; calibrated at startup when unset"
+    )
+    password_hash_target_ms: int = Field(
+        default=200, description="Target duration of one password hash when calibrating"
+    )
+
     # JWT Authentication
     jwt_secret_key: str = Field(..., description="JWT Secret Key")
 
@@ -9,7 +9,7 @@ from sqlalchemy.ext.asyncio import AsyncSession
 
 from storytime.api.auth import get_current_user
 from storytime.database import JobStatus, PlaybackProgress, User, get_db
-from storytime.infrastructure.spaces import SpacesClient
+from storytime.infrastructure.spaces import get_spaces_client
 from storytime.models import AudioMetadataResponse, ResumeInfoResponse, StreamingUrlResponse
 
 from .utils import get_user_job
@@ -45,7 +45,7 @@ async def get_streaming_url(
                     child_job = await get_user_job(child_job_id, current_user.id, db)
                     if child_job.output_file_key and child_job.status == JobStatus.COMPLETED:
                         # Generate streaming URL for the child job's audio
-                        spaces_client = SpacesClient()
+                        spaces_client = get_spaces_client()
                         streaming_url = await spaces_client.get_streaming_url(
                             key=child_job.output_file_key, expires_in=3600
                         )
@@ -65,7 +65,7 @@ async def get_streaming_url(
         raise HTTPException(status_code=404, detail="No audio output available for this job")
 
     # Generate streaming URL with appropriate headers
-    spaces_client = SpacesClient()
+    spaces_client = get_spaces_client()
     streaming_url = await spaces_client.get_streaming_url(
         key=job.output_file_key,
         expires_in=3600,  # 1 hour default
@@ -135,7 +135,7 @@ async def get_playlist(
     # For single-file audio, generate simple playlist
     if not job.result_data or "chapters" not in job.result_data:
         # Single file playlist
-        spaces_client = SpacesClient()
+        spaces_client = get_spaces_client()
         streaming_url = await spaces_client.get_streaming_url(
             key=job.output_file_key, expires_in=3600
         )
@@ -151,7 +151,7 @@ async def get_playlist(
     if not chapters:
         raise HTTPException(status_code=404, detail="No chapter information available")
 
-    spaces_client = SpacesClient()
+    spaces_client = get_spaces_client()
     playlist = "#EXTM3U\n"
 
     for chapter in chapters:
@@ -1,16 +1,38 @@
 import logging
 
-from fastapi import HTTPException
+from fastapi import HTTPException, Response
+from pydantic import BaseModel
 from sqlalchemy import and_, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from storytime.database import Job
+from storytime.database import Job, is_valid_id
 
 logger = logging.getLogger(__name__)
 
 
+def model_response(model: BaseModel) -> Response:
+    """Serialize an already-built response model straight to a JSON response.
+
+    FastAPI would otherwise dump the model and validate the result against the route's
+    response_model again; routes keep response_model for the OpenAPI schema only.
+    """
+    return Response(model.model_dump_json(by_alias=True), media_type="application/json")
+
+
+def check_job_id(job_id: str) -> None:
+    """Raise the job-not-found HTTPException for an id that is not a UUID.
+
+    Ids are native UUID columns, so a malformed id can never match a row; rejecting it
+    here keeps it from reaching Postgres as a type error.
+    """
+    if not is_valid_id(job_id):
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found or access denied")
+
+
 async def get_user_job(job_id: str, user_id: str, db: AsyncSession) -> Job:
     """Return the job if it belongs to the user or raise HTTPException."""
+    check_job_id(job_id)
+
     result = await db.execute(select(Job).where(and_(Job.id == job_id, Job.user_id == user_id)))
     job = result.scalar_one_or_none()
 
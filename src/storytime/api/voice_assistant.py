@@ -3,19 +3,20 @@
 import asyncio
 import logging
 import os
+from typing import TYPE_CHECKING
 
 from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 
 from ..database import AsyncSessionLocal, Job, User
-from ..voice_assistant.pipecat_assistant import (
-    StandardPipecatManager,
-    StandardPipecatVoiceAssistant,
-)
-from ..voice_assistant.pipecat_mcp_integration import create_mcp_integration
 from .auth import create_access_token, get_current_user
 from .settings import get_settings
 
+if TYPE_CHECKING:
+    # Pipecat pulls in the VAD model runtime and the realtime transports; it is imported
+    # when an assistant is actually started, not every time the API boots
+    from ..voice_assistant.pipecat_assistant import StandardPipecatManager
+
 logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/v1/voice-assistant", tags=["voice-assistant"])
@@ -29,11 +30,12 @@ class VoiceAssistantStartRequest(BaseModel):
 
 
 # Global manager for the standard Pipecat assistant
-_assistant_manager: StandardPipecatManager | None = None
+_assistant_manager: "StandardPipecatManager | None" = None
 _mcp_functions: dict[str, callable] = {}
 _mcp_client = None
-_current_user: User | None = None
-_user_jwt_token: str | None = None
+# There is one assistant per process (it owns the Pipecat port), so concurrent start and
+# stop requests take turns instead of racing to build or tear it down
+_assistant_lock = asyncio.Lock()
 
 
 def _get_websocket_url(request: Request) -> str:
@@ -137,15 +139,25 @@ async def _initialize_assistant(
     job_id: str | None = None,
 ):
     """Initialize the Pipecat voice assistant with MCP integration."""
-    global _assistant_manager, _mcp_functions, _mcp_client, _current_user, _user_jwt_token
+    async with _assistant_lock:
+        if _assistant_manager and _assistant_manager.is_running:
+            logger.info("Standard Pipecat assistant already running")
+            return
+
+        await _start_assistant(user, jwt_token, mode, job_id)
 
-    if _assistant_manager and _assistant_manager.is_running:
-        logger.info("Standard Pipecat assistant already running")
-        return
 
-    # Store user context globally
-    _current_user = user
-    _user_jwt_token = jwt_token
+async def _start_assistant(
+    user: User | None, jwt_token: str | None, mode: str | None, job_id: str | None
+):
+    """Build and start the assistant; the caller holds _assistant_lock."""
+    global _assistant_manager, _mcp_functions, _mcp_client
+
+    from ..voice_assistant.pipecat_assistant import (
+        StandardPipecatManager,
+        StandardPipecatVoiceAssistant,
+    )
+    from ..voice_assistant.pipecat_mcp_integration import create_mcp_integration
 
     settings = get_settings()
 
@@ -240,9 +252,10 @@ async def stop_assistant():
     """Stop the standard Pipecat voice assistant."""
     global _assistant_manager
 
-    if _assistant_manager:
-        await _assistant_manager.stop()
-        _assistant_manager = None
+    async with _assistant_lock:
+        if _assistant_manager:
+            await _assistant_manager.stop()
+            _assistant_manager = None
 
     return {"status": "stopped", "message": "Standard Pipecat assistant stopped successfully"}
 
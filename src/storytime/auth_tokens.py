@@ -0,0 +1,89 @@
+"""JWT helpers shared by the API and the MCP server: issuing, parsing and verifying tokens."""
+
+import base64
+import time
+from datetime import timedelta
+
+import jwt
+import orjson
+
+from storytime.api.settings import get_settings
+
+settings = get_settings()
+
+ACCESS_TOKEN_LIFETIME = 24 * 60 * 60  # seconds
+
+
+def create_access_token(data: dict, expires_delta: timedelta | None = None):
+    """Create a JWT access token."""
+    # exp as epoch seconds, which is what PyJWT would convert a datetime to anyway
+    lifetime = int(expires_delta.total_seconds()) if expires_delta else ACCESS_TOKEN_LIFETIME
+    to_encode = {**data, "exp": int(time.time()) + lifetime}
+    encoded_jwt = jwt.encode(to_encode, settings.jwt_secret_key, algorithm="HS256")
+    return encoded_jwt
+
+
+# Decoded tokens by raw token string. Clients resend the same token on every request, so
+# this skips the base64 decode and HMAC check for all but the first one.
+TOKEN_CACHE_TTL = 60  # seconds a verified payload is reused
+TOKEN_CACHE_SIZE = 10_000
+_token_cache: dict[str, tuple[dict, float]] = {}
+
+
+def bearer_token(authorization: str | None) -> str | None:
+    """Return the token from an ``Authorization: Bearer <token>`` value, or None.
+
+    The scheme is matched case-insensitively, as RFC 7235 requires.
+    """
+    if not authorization:
+        return None
+    scheme, _, token = authorization.partition(" ")
+    if scheme.lower() != "bearer" or not token:
+        return None
+    return token
+
+
+def _reject_malformed_or_expired(token: str, now: float) -> None:
+    """Raise for tokens that are not three segments or whose exp has passed.
+
+    Reads the payload without verifying it, so stale and garbage tokens are turned away
+    before the HMAC; anything that passes still goes through full verification.
+    """
+    segments = token.split(".")
+    if len(segments) != 3 or not all(segments):
+        raise jwt.DecodeError("Not enough segments")
+    payload = segments[1]
+    try:
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+    except ValueError as e:  # binascii.Error and orjson.JSONDecodeError
+        raise jwt.DecodeError("Invalid payload padding or JSON") from e
+    exp = claims.get("exp") if isinstance(claims, dict) else None
+    if isinstance(exp, int | float) and exp <= now:
+        raise jwt.ExpiredSignatureError("Signature has expired")
+
+
+def decode_access_token(token: str) -> dict:
+    """Decode and verify a JWT, reusing the payload of a recently verified identical token.
+
+    Raises InvalidTokenError exactly as jwt.decode does. A cached payload is dropped once
+    its own exp has passed, so expiry still takes effect within the cache TTL.
+    """
+    now = time.time()
+    cached = _token_cache.get(token)
+    if cached is not None:
+        payload, valid_until = cached
+        if now < valid_until:
+            return payload
+        del _token_cache[token]
+
+    _reject_malformed_or_expired(token, now)
+    payload = jwt.decode(token, settings.jwt_secret_key, algorithms=["HS256"])
+
+    valid_until = now + TOKEN_CACHE_TTL
+    if isinstance(payload.get("exp"), int | float):
+        valid_until = min(valid_until, payload["exp"])
+    if len(_token_cache) >= TOKEN_CACHE_SIZE:
+        # Evict the oldest entry; dicts iterate in insertion order
+        del _token_cache[next(iter(_token_cache))]
+    _token_cache[token] = (payload, valid_until)
+    return payload
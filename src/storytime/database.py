@@ -1,26 +1,34 @@
 import logging
+import os
+import time
 import uuid
 from collections.abc import AsyncGenerator
 from datetime import datetime
+from enum import Enum
 from typing import Any
 
 from passlib.context import CryptContext
 from sqlalchemy import (
-    JSON,
+    CheckConstraint,
     DateTime,
-    Enum,
     Float,
     ForeignKey,
     Index,
     Integer,
+    SmallInteger,
     String,
     Text,
+    TypeDecorator,
     UniqueConstraint,
+    Uuid,
+    text,
 )
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import Mapped, declarative_base, mapped_column, relationship
+from sqlalchemy.pool import NullPool
 
-from storytime.api.settings import get_settings
+from storytime.api.settings import Settings, get_settings
 from storytime.models import JobStatus, StepStatus
 
 Base = declarative_base()
@@ -28,6 +36,117 @@ Base = declarative_base()
 # Password hashing context
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
+# bcrypt cost factors calibration chooses between; 12 is passlib's default, so calibration
+# only ever makes new hashes stronger
+BCRYPT_MIN_ROUNDS = 12
+BCRYPT_MAX_ROUNDS = 16
+
+
+def calibrate_password_hashing(target_ms: float, rounds: int | None = None) -> int:
+    """Set the bcrypt cost used for new password hashes and return it.
+
+    Without explicit rounds, one hash is timed at BCRYPT_MIN_ROUNDS and the cost is raised
+    while the doubled time (each round doubles bcrypt's work) stays within target_ms.
+    Existing hashes keep verifying at the cost they were created with.
+    """
+    if rounds is None:
+        start = time.perf_counter()
+        pwd_context.handler().using(rounds=BCRYPT_MIN_ROUNDS).hash("calibration")
+        elapsed_ms = (time.perf_counter() - start) * 1000
+        rounds = BCRYPT_MIN_ROUNDS
+        while rounds < BCRYPT_MAX_ROUNDS and elapsed_ms * 2 <= target_ms:
+            rounds += 1
+            elapsed_ms *= 2
+    pwd_context.update(bcrypt__rounds=rounds)
+    return rounds
+
+
+class SmallIntEnum(TypeDecorator):
+    """Store a string enum as a SMALLINT code; the code is the member's index in ``members``."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    def __init__(self, members: tuple[Enum, ...]):
+        super().__init__()
+        self.members = members
+        self._enum_class = type(members[0])
+        self._codes = {member: code for code, member in enumerate(members)}
+
+    def process_bind_param(self, value: Any, dialect: Any) -> int | None:
+        if value is None:
+            return None
+        return self._codes[self._enum_class(value)]
+
+    def process_result_value(self, value: int | None, dialect: Any) -> Enum | None:
+        if value is None:
+            return None
+        return self.members[value]
+
+
+class BasisPoints(TypeDecorator):
+    """Store a 0.0-1.0 fraction as SMALLINT basis points (0-10000)."""
+
+    impl = SmallInteger
+    cache_ok = True
+
+    SCALE = 10000
+
+    def process_bind_param(self, value: float | None, dialect: Any) -> int | None:
+        if value is None:
+            return None
+        return round(min(max(value, 0.0), 1.0) * self.SCALE)
+
+    def process_result_value(self, value: int | None, dialect: Any) -> float | None:
+        if value is None:
+            return None
+        return value / self.SCALE
+
+
+# Native 16-byte UUID columns that still read and write as plain strings in Python
+UUIDString = Uuid(as_uuid=False)
+
+
+def new_id() -> str:
+    """Generate a primary key value as a time-ordered UUIDv7.
+
+    The leading 48-bit millisecond timestamp makes new rows land at the right edge of the
+    primary key index instead of on random pages; the remaining bits are random.
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10))
+    value = value & ~(0xF << 76) | 0x7 << 76  # version 7
+    value = value & ~(0x3 << 62) | 0x2 << 62  # RFC 4122 variant
+    return str(uuid.UUID(int=value))
+
+
+def is_valid_id(value: str) -> bool:
+    """Return True if value can be a primary key: a UUID string.
+
+    Ids are native UUID columns, so anything else can never match a row and would reach
+    Postgres as a type error; callers treat it as not found instead.
+    """
+    try:
+        uuid.UUID(value)
+    except (TypeError, ValueError, AttributeError):
+        return False
+    return True
+
+
+# Persisted status codes. Append new members only; existing rows rely on these positions.
+JOB_STATUS_CODES = (
+    JobStatus.PENDING,
+    JobStatus.PROCESSING,
+    JobStatus.COMPLETED,
+    JobStatus.FAILED,
+    JobStatus.CANCELLED,
+)
+STEP_STATUS_CODES = (
+    StepStatus.PENDING,
+    StepStatus.RUNNING,
+    StepStatus.COMPLETED,
+    StepStatus.FAILED,
+)
+
 
 # Simplified: Only single-voice TTS processing
 
@@ -35,20 +154,24 @@ pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 class User(Base):
     __tablename__ = "users"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    email: Mapped[str] = mapped_column(String, unique=True, nullable=False, index=True)
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=new_id)
+    email: Mapped[str] = mapped_column(String, nullable=False)
     hashed_password: Mapped[str] = mapped_column(String, nullable=False)
+    openai_vector_store_id: Mapped[str | None] = mapped_column(
+        String, nullable=True
+    )  # User's OpenAI vector store for content search and Q&A
+    # No updated_at: rows are written once at signup and again only to attach a vector store
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
-    )
 
     # Relationships
     jobs = relationship("Job", back_populates="user")
     progress_records = relationship("PlaybackProgress", back_populates="user")
-    vector_store = relationship("UserVectorStore", back_populates="user", uselist=False)
+    vector_store_files = relationship("VectorStoreFile", back_populates="user")
     tutor_conversations = relationship("TutorConversation", back_populates="user")
 
+    # Emails are unique and looked up case-insensitively
+    __table_args__ = (Index("ix_users_email_lower", text("lower(email)"), unique=True),)
+
     def verify_password(self, password: str) -> bool:
         """Verify a password against the hash."""
         return pwd_context.verify(password, self.hashed_password)
@@ -58,17 +181,20 @@ class User(Base):
         """Hash a password for storing."""
         return pwd_context.hash(password)
 
+    @staticmethod
+    def dummy_verify_password() -> bool:
+        """Spend the time of a failed verify_password; always returns False."""
+        return pwd_context.dummy_verify()
+
 
 class Job(Base):
     """Simple text-to-audio job entity."""
 
     __tablename__ = "jobs"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False, index=True)
-    parent_id: Mapped[str | None] = mapped_column(
-        String, ForeignKey("jobs.id"), nullable=True, index=True
-    )
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=new_id)
+    user_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False)
+    parent_id: Mapped[str | None] = mapped_column(UUIDString, ForeignKey("jobs.id"), nullable=True)
 
     # Job configuration
     title: Mapped[str] = mapped_column(String, nullable=False)
@@ -76,17 +202,17 @@ class Job(Base):
 
     # Processing state
     status: Mapped[JobStatus] = mapped_column(
-        Enum(JobStatus), nullable=False, default=JobStatus.PENDING, index=True
+        SmallIntEnum(JOB_STATUS_CODES), nullable=False, default=JobStatus.PENDING
     )
-    progress: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)  # 0.0 to 1.0
+    progress: Mapped[float] = mapped_column(BasisPoints, nullable=False, default=0.0)  # 0.0 to 1.0
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
-    # Configuration and results (JSON fields)
+    # Configuration and results (JSONB fields)
     config: Mapped[dict[str, Any] | None] = mapped_column(
-        JSON, nullable=True
+        JSONB, nullable=True
     )  # Job-specific parameters
     result_data: Mapped[dict[str, Any] | None] = mapped_column(
-        JSON, nullable=True
+        JSONB, nullable=True
     )  # Workflow outputs
 
     # File references
@@ -99,7 +225,7 @@ class Job(Base):
     )  # OpenAI vector store file ID
 
     # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow, index=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
     updated_at: Mapped[datetime] = mapped_column(
         DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
     )
@@ -115,11 +241,42 @@ class Job(Base):
         cascade="all, delete-orphan",
         lazy="selectin",
     )
-    steps = relationship("JobStep", back_populates="job", cascade="all, delete-orphan")
+    steps = relationship(
+        "JobStep",
+        back_populates="job",
+        cascade="all, delete-orphan",
+        order_by="JobStep.step_order",
+    )
     progress_records = relationship("PlaybackProgress", back_populates="job")
     vector_store_file = relationship("VectorStoreFile", back_populates="job", uselist=False)
     tutor_conversations = relationship("TutorConversation", back_populates="job")
 
+    # Indexes matching the job list query shapes
+    __table_args__ = (
+        CheckConstraint(f"status BETWEEN 0 AND {len(JOB_STATUS_CODES) - 1}", name="ck_jobs_status"),
+        CheckConstraint("progress BETWEEN 0 AND 10000", name="ck_jobs_progress"),
+        Index("ix_jobs_user_created_id", "user_id", text("created_at DESC"), text("id DESC")),
+        Index(
+            "ix_jobs_user_status_created_id",
+            "user_id",
+            "status",
+            text("created_at DESC"),
+            text("id DESC"),
+        ),
+        Index(
+            "ix_jobs_active",
+            "status",
+            "created_at",
+            postgresql_where=text("status IN (0, 1)"),  # PENDING, PROCESSING
+        ),
+        # Only child jobs are ever looked up by parent; root jobs stay out of the index
+        Index(
+            "ix_jobs_parent_id_partial",
+            "parent_id",
+            postgresql_where=text("parent_id IS NOT NULL"),
+        ),
+    )
+
     @property
     def duration(self) -> float | None:
         """Calculate job duration in seconds if completed."""
@@ -133,8 +290,10 @@ class JobStep(Base):
 
     __tablename__ = "job_steps"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    job_id: Mapped[str] = mapped_column(String, ForeignKey("jobs.id"), nullable=False, index=True)
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=new_id)
+    job_id: Mapped[str] = mapped_column(
+        UUIDString, ForeignKey("jobs.id"), nullable=False, index=True
+    )
 
     # Step identification
     step_name: Mapped[str] = mapped_column(
@@ -144,14 +303,14 @@ class JobStep(Base):
 
     # Step state
     status: Mapped[StepStatus] = mapped_column(
-        Enum(StepStatus), nullable=False, default=StepStatus.PENDING
+        SmallIntEnum(STEP_STATUS_CODES), nullable=False, default=StepStatus.PENDING
     )
-    progress: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)  # 0.0 to 1.0
+    progress: Mapped[float] = mapped_column(BasisPoints, nullable=False, default=0.0)  # 0.0 to 1.0
     error_message: Mapped[str | None] = mapped_column(Text, nullable=True)
 
     # Step-specific data
     step_metadata: Mapped[dict[str, Any] | None] = mapped_column(
-        JSON, nullable=True
+        JSONB, nullable=True
     )  # Step-specific information
 
     # Timestamps
@@ -165,6 +324,13 @@ class JobStep(Base):
     # Relationships
     job = relationship("Job", back_populates="steps")
 
+    __table_args__ = (
+        CheckConstraint(
+            f"status BETWEEN 0 AND {len(STEP_STATUS_CODES) - 1}", name="ck_job_steps_status"
+        ),
+        CheckConstraint("progress BETWEEN 0 AND 10000", name="ck_job_steps_progress"),
+    )
+
     @property
     def duration(self) -> float | None:
         """Calculate step duration in seconds if completed."""
@@ -178,9 +344,11 @@ class PlaybackProgress(Base):
 
     __tablename__ = "playback_progress"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False, index=True)
-    job_id: Mapped[str] = mapped_column(String, ForeignKey("jobs.id"), nullable=False, index=True)
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=new_id)
+    user_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False)
+    job_id: Mapped[str] = mapped_column(
+        UUIDString, ForeignKey("jobs.id"), nullable=False, index=True
+    )
 
     # Progress tracking
     position_seconds: Mapped[float] = mapped_column(Float, nullable=False, default=0.0)
@@ -188,7 +356,7 @@ class PlaybackProgress(Base):
         Float, nullable=True
     )  # Cached total duration
     percentage_complete: Mapped[float] = mapped_column(
-        Float, nullable=False, default=0.0
+        BasisPoints, nullable=False, default=0.0
     )  # 0.0 to 1.0
 
     # Chapter tracking (for multi-chapter books)
@@ -213,7 +381,10 @@ class PlaybackProgress(Base):
     # Constraints
     __table_args__ = (
         UniqueConstraint("user_id", "job_id", name="unique_user_job_progress"),
-        Index("idx_progress_user_updated", "user_id", "updated_at"),
+        Index("idx_progress_user_last_played", "user_id", text("last_played_at DESC")),
+        CheckConstraint(
+            "percentage_complete BETWEEN 0 AND 10000", name="ck_playback_progress_percentage"
+        ),
     )
 
     @property
@@ -242,53 +413,28 @@ class PlaybackProgress(Base):
             self.percentage_complete = 0.0
 
 
-class UserVectorStore(Base):
-    """User's OpenAI vector store for content search and Q&A."""
-
-    __tablename__ = "user_vector_stores"
-
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False, index=True)
-    openai_vector_store_id: Mapped[str] = mapped_column(String, nullable=False)
-
-    # Timestamps
-    created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
-    updated_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, onupdate=datetime.utcnow
-    )
-
-    # Relationships
-    user = relationship(
-        "User", back_populates="vector_store"
-    )  # Will need to add this to User model
-    files = relationship(
-        "VectorStoreFile", back_populates="vector_store", cascade="all, delete-orphan"
-    )
-
-    # Constraints
-    __table_args__ = (UniqueConstraint("user_id", name="unique_user_vector_store"),)
-
-
 class VectorStoreFile(Base):
     """Files stored in user's vector store with job associations."""
 
     __tablename__ = "vector_store_files"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_vector_store_id: Mapped[str] = mapped_column(
-        String, ForeignKey("user_vector_stores.id"), nullable=False
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=new_id)
+    user_id: Mapped[str] = mapped_column(
+        UUIDString, ForeignKey("users.id"), nullable=False, index=True
+    )
+    job_id: Mapped[str] = mapped_column(
+        UUIDString, ForeignKey("jobs.id"), nullable=False, index=True
     )
-    job_id: Mapped[str] = mapped_column(String, ForeignKey("jobs.id"), nullable=False, index=True)
     openai_file_id: Mapped[str] = mapped_column(String, nullable=False)
 
     # Metadata for OpenAI file (title, type, etc.)
-    file_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSON, nullable=True)
+    file_metadata: Mapped[dict[str, Any] | None] = mapped_column(JSONB, nullable=True)
 
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(DateTime, default=datetime.utcnow)
 
     # Relationships
-    vector_store = relationship("UserVectorStore", back_populates="files")
+    user = relationship("User", back_populates="vector_store_files")
     job = relationship(
         "Job", back_populates="vector_store_file"
     )  # Will need to add this to Job model
@@ -299,9 +445,11 @@ class TutorConversation(Base):
 
     __tablename__ = "tutor_conversations"
 
-    id: Mapped[str] = mapped_column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
-    user_id: Mapped[str] = mapped_column(String, ForeignKey("users.id"), nullable=False, index=True)
-    job_id: Mapped[str] = mapped_column(String, ForeignKey("jobs.id"), nullable=False, index=True)
+    id: Mapped[str] = mapped_column(UUIDString, primary_key=True, default=new_id)
+    user_id: Mapped[str] = mapped_column(UUIDString, ForeignKey("users.id"), nullable=False)
+    job_id: Mapped[str] = mapped_column(
+        UUIDString, ForeignKey("jobs.id"), nullable=False, index=True
+    )
 
     # Conversation metadata
     session_type: Mapped[str] = mapped_column(
@@ -313,13 +461,13 @@ class TutorConversation(Base):
 
     # Conversation content
     messages: Mapped[dict[str, Any] | None] = mapped_column(
-        JSON, nullable=True
+        JSONB, nullable=True
     )  # Conversation history
     summary: Mapped[str | None] = mapped_column(Text, nullable=True)  # Post-conversation summary
 
     # Session metadata
     session_metadata: Mapped[dict[str, Any] | None] = mapped_column(
-        JSON, nullable=True
+        JSONB, nullable=True
     )  # Session-specific data
 
     # Timestamps
@@ -340,8 +488,37 @@ class TutorConversation(Base):
     )
 
 
+def _engine_options(settings: Settings) -> dict[str, Any]:
+    """Pool and driver options for the app engine."""
+    if settings.db_pgbouncer:
+        # PgBouncer in transaction mode does the pooling and may hand each transaction a
+        # different server connection, so keep no local pool and no prepared statements
+        return {
+            "poolclass": NullPool,
+            "connect_args": {
+                "statement_cache_size": 0,
+                "prepared_statement_cache_size": 0,
+                "prepared_statement_name_func": lambda: f"__asyncpg_{uuid.uuid4()}__",
+            },
+        }
+    return {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_recycle": settings.db_pool_recycle,
+        "pool_pre_ping": True,
+        # Reuse the most recently returned connection so idle ones can be recycled and the
+        # busy ones keep their server-side plan and catalog caches warm.
+        "pool_use_lifo": True,
+        # Hot queries (user lookup, job fetch) are parsed and planned once per connection
+        "connect_args": {"prepared_statement_cache_size": settings.db_statement_cache_size},
+    }
+
+
 settings = get_settings()
-engine = create_async_engine(settings.database_url, echo=True, future=True)
+engine = create_async_engine(
+    settings.database_url, echo=settings.db_echo, future=True, **_engine_options(settings)
+)
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False)
 
 
@@ -358,5 +535,5 @@ async def create_all():
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.create_all)
     logging.getLogger(__name__).info(
-        "Database tables created (User, Job, JobStep, PlaybackProgress, UserVectorStore, VectorStoreFile, TutorConversation)"
+        "Database tables created (User, Job, JobStep, PlaybackProgress, VectorStoreFile, TutorConversation)"
     )
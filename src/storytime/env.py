@@ -0,0 +1,15 @@
+"""Process-wide .env loading."""
+
+from functools import lru_cache
+
+from dotenv import load_dotenv
+
+
+@lru_cache(maxsize=1)
+def ensure_env() -> None:
+    """Load .env into the environment once per process.
+
+    Modules that read os.environ at import time call this instead of load_dotenv() so the
+    file is located and parsed a single time, however many of them are imported.
+    """
+    load_dotenv()
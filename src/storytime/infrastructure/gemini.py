@@ -0,0 +1,15 @@
+"""Shared Google Gemini client."""
+
+from functools import lru_cache
+
+from google import genai
+
+
+@lru_cache(maxsize=4)
+def get_gemini_client(api_key: str) -> genai.Client:
+    """Return the process-wide Gemini client for this key.
+
+    Services share it so their requests reuse one HTTP connection pool instead of each
+    instance paying for its own TLS handshakes.
+    """
+    return genai.Client(api_key=api_key)
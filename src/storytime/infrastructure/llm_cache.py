@@ -0,0 +1,91 @@
+"""Persistent cache for LLM responses, keyed by a hash of everything that shaped the request."""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import time
+import zlib
+from collections.abc import Iterator
+from contextlib import contextmanager
+from functools import lru_cache
+from typing import Any
+
+from storytime.api.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+
+class LLMCache:
+    """SQLite-backed store of compressed LLM responses.
+
+    Opens a short-lived connection per call so one instance is safe to share across threads
+    and the API and worker processes can use the same file. Calls block on SQLite and on
+    (de)compressing book-sized values, so async code runs them via asyncio.to_thread.
+    Entries older than max_age seconds are treated as misses and pruned on write.
+    """
+
+    def __init__(self, path: str, max_age: int):
+        self.path = path
+        self.max_age = max_age
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache "
+                "(key TEXT PRIMARY KEY, value BLOB NOT NULL, ts INTEGER NOT NULL)"
+            )
+            conn.execute("CREATE INDEX IF NOT EXISTS llm_cache_ts ON llm_cache (ts)")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        conn = sqlite3.connect(self.path, timeout=5)
+        try:
+            with conn:  # commits on success, rolls back on error
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(**parts: Any) -> str:
+        """Hash the request parts (prompt version, model, input, options) into a cache key."""
+        payload = json.dumps(parts, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+    def get(self, key: str) -> str | None:
+        """Return the cached response for key, or None on a miss."""
+        try:
+            with self._connect() as conn:
+                row = conn.execute(
+                    "SELECT value FROM llm_cache WHERE key = ? AND ts >= ?",
+                    (key, int(time.time()) - self.max_age),
+                ).fetchone()
+            return zlib.decompress(row[0]).decode("utf-8") if row is not None else None
+        except (sqlite3.Error, zlib.error, UnicodeDecodeError) as e:
+            logger.warning(f"LLM cache read failed: {e}")
+            return None
+
+    def set(self, key: str, value: str) -> None:
+        """Store a response under key, dropping entries that have outlived max_age."""
+        now = int(time.time())
+        try:
+            with self._connect() as conn:
+                conn.execute("DELETE FROM llm_cache WHERE ts < ?", (now - self.max_age,))
+                conn.execute(
+                    "INSERT OR REPLACE INTO llm_cache (key, value, ts) VALUES (?, ?, ?)",
+                    (key, zlib.compress(value.encode("utf-8")), now),
+                )
+        except sqlite3.Error as e:
+            logger.warning(f"LLM cache write failed: {e}")
+
+
+@lru_cache
+def get_llm_cache() -> LLMCache | None:
+    """Return the shared cache, or None when LLM_CACHE_ENABLED is off."""
+    settings = get_settings()
+    if not settings.llm_cache_enabled:
+        return None
+    try:
+        return LLMCache(settings.llm_cache_path, settings.llm_cache_max_age_days * 86400)
+    except sqlite3.Error as e:
+        logger.warning(f"LLM cache unavailable at {settings.llm_cache_path}: {e}")
+        return None
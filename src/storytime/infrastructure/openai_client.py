@@ -0,0 +1,15 @@
+"""Shared OpenAI client."""
+
+from functools import lru_cache
+
+from openai import OpenAI
+
+
+@lru_cache(maxsize=4)
+def get_openai_client(api_key: str) -> OpenAI:
+    """Return the process-wide OpenAI client for this key.
+
+    The client is thread-safe and pools its HTTP connections, so request handlers, MCP tools
+    and TTS share one instead of building a client (and a TLS session) per call.
+    """
+    return OpenAI(api_key=api_key)
@@ -1,10 +1,11 @@
-import json
+import codecs
 import logging
 import os
-import tempfile
+from functools import lru_cache
 from typing import Any
 
 import aioboto3
+import orjson
 from botocore.client import Config
 
 DO_SPACES_KEY = os.getenv("DO_SPACES_KEY")
@@ -14,6 +15,8 @@ DO_SPACES_BUCKET = os.getenv("DO_SPACES_BUCKET")
 DO_SPACES_ENDPOINT = os.getenv(
     "DO_SPACES_ENDPOINT", f"https://{DO_SPACES_REGION}.digitaloceanspaces.com"
 )
+# Bytes read from an object body per await when streaming a download
+DOWNLOAD_CHUNK_SIZE = 256 * 1024
 
 
 class SpacesClient:
@@ -32,14 +35,21 @@ class SpacesClient:
         }
 
     async def download_text_file(self, key: str) -> str:
-        """Download a text file and return its content."""
+        """Download a text file and return its content.
+
+        The body is decoded chunk by chunk as it arrives, so the whole object is never held
+        as bytes and text at once. Bytes that are not valid UTF-8 (user uploads) become
+        U+FFFD instead of failing the job with a UnicodeDecodeError.
+        """
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        parts: list[str] = []
         async with self._session.client(**self._client_params) as s3:
-            with tempfile.NamedTemporaryFile(mode="w+", delete=False) as tmp_file:
-                await s3.download_file(self.bucket, key, tmp_file.name)
-                with open(tmp_file.name, encoding="utf-8") as f:
-                    content = f.read()
-                os.unlink(tmp_file.name)
-                return content
+            response = await s3.get_object(Bucket=self.bucket, Key=key)
+            async with response["Body"] as body:
+                async for chunk in body.iter_chunks(DOWNLOAD_CHUNK_SIZE):
+                    parts.append(decoder.decode(chunk))
+        parts.append(decoder.decode(b"", final=True))
+        return "".join(parts)
 
     async def upload_text_file(self, key: str, text_content: str) -> bool:
         """Upload text content to spaces."""
@@ -79,7 +89,7 @@ class SpacesClient:
     async def upload_json_file(self, key: str, data: dict[str, Any]) -> bool:
         """Upload JSON data to spaces."""
         try:
-            json_data = json.dumps(data, indent=2).encode("utf-8")
+            json_data = orjson.dumps(data, option=orjson.OPT_INDENT_2)
             async with self._session.client(**self._client_params) as s3:
                 await s3.put_object(
                     Bucket=self.bucket,
@@ -123,3 +133,13 @@ class SpacesClient:
                 },
                 ExpiresIn=expires_in,
             )
+
+
+@lru_cache(maxsize=1)
+def get_spaces_client() -> SpacesClient:
+    """Return the process-wide Spaces client.
+
+    Its boto session caches the parsed S3 service model and endpoint data, which a fresh
+    SpacesClient would load again; the client holds no per-request state.
+    """
+    return SpacesClient()
@@ -8,7 +8,7 @@ from typing import Literal
 ResponseFormat = Literal["mp3", "opus", "aac", "flac", "wav", "pcm"]
 
 
-@dataclass
+@dataclass(slots=True)
 class Voice:
     """Represents a voice option for a TTS provider."""
 
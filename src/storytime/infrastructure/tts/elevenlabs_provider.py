@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import logging
 import os
 from pathlib import Path
 
-from dotenv import load_dotenv
 from elevenlabs import ElevenLabs
 from elevenlabs import Voice as ElevenVoice
 
+from storytime.env import ensure_env
 from storytime.infrastructure.tts.base import ResponseFormat, TTSProvider, Voice
 
-load_dotenv()
+ensure_env()
+logger = logging.getLogger(__name__)
 
 
 class ElevenLabsProvider(TTSProvider):
@@ -40,7 +42,7 @@ class ElevenLabsProvider(TTSProvider):
         """Synthesize audio using ElevenLabs API (2.x)."""
         model_id = "eleven_multilingual_v2"
         if format != "mp3":
-            print(f"Warning: ElevenLabs primarily uses MP3. Format '{format}' may not be optimal.")
+            logger.warning("ElevenLabs primarily uses MP3. Format '%s' may not be optimal.", format)
 
         audio_stream = self.client.text_to_speech.stream(
             text=text,
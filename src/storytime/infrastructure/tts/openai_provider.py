@@ -1,15 +1,17 @@
 from __future__ import annotations
 
+import logging
 import os
 from pathlib import Path
 
-from dotenv import load_dotenv
-from openai import OpenAI  # Main client
+from storytime.env import ensure_env
 
-# Internal - base class and voice model
+# Internal - shared client, base class and voice model
+from storytime.infrastructure.openai_client import get_openai_client
 from storytime.infrastructure.tts.base import ResponseFormat, TTSProvider, Voice
 
-load_dotenv()
+ensure_env()
+logger = logging.getLogger(__name__)
 
 
 class OpenAIProvider(TTSProvider):
@@ -24,7 +26,7 @@ class OpenAIProvider(TTSProvider):
         key = api_key or os.getenv("OPENAI_API_KEY")
         if not key:
             raise ValueError("OpenAI API key not found. Set OPENAI_API_KEY or pass api_key.")
-        self.client = OpenAI(api_key=key)
+        self.client = get_openai_client(key)
 
     def list_voices(self) -> list[Voice]:
         """OpenAI has fixed voices, map them to our internal `Voice` model."""
@@ -72,9 +74,9 @@ class OpenAIProvider(TTSProvider):
     ) -> None:
         """Synthesize audio using OpenAI TTS API."""
 
-        # OpenAI TTS API does not support style parameter
+        # OpenAI TTS API does not support style parameter; runs once per chunk, so debug only
         if style:
-            print("Note: Style parameter is not supported by OpenAI TTS API and will be ignored.")
+            logger.debug("Style parameter is not supported by OpenAI TTS API and will be ignored")
 
         # Prepare API call parameters (no style parameter for OpenAI)
         api_params = {
@@ -1,9 +1,29 @@
 from __future__ import annotations
 
+import time
+
 from storytime.infrastructure.tts.base import TTSProvider, Voice
 
+# How long a provider's voice listing is reused before it is fetched again (seconds)
+VOICE_CACHE_TTL = 24 * 60 * 60
+
+# provider name -> (monotonic fetch time, voices)
+_voice_cache: dict[str, tuple[float, list[Voice]]] = {}
+
+
+def get_voices(
+    provider: TTSProvider, *, max_age: float = VOICE_CACHE_TTL, force: bool = False
+) -> list[Voice]:
+    """Return the list of voices from *provider*.
 
-def get_voices(provider: TTSProvider) -> list[Voice]:
-    """Return the list of voices from *provider*."""
+    Listing voices can be an HTTPS round-trip (ElevenLabs) and a TTSGenerator is built per
+    job, so a listing younger than *max_age* seconds is reused; pass ``force=True`` to
+    fetch a fresh one.
+    """
+    cached = _voice_cache.get(provider.name)
+    if not force and cached and time.monotonic() - cached[0] < max_age:
+        return list(cached[1])
 
-    return provider.list_voices()
+    voices = provider.list_voices()
+    _voice_cache[provider.name] = (time.monotonic(), voices)
+    return list(voices)
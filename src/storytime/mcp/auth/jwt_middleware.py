@@ -3,16 +3,18 @@
 import logging
 from dataclasses import dataclass
 
-import jwt
 from jwt import InvalidTokenError
-from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from storytime.api.settings import get_settings
-from storytime.database import AsyncSessionLocal, User
+from storytime.auth_tokens import bearer_token, decode_access_token
+from storytime.database import AsyncSessionLocal, User, is_valid_id
 
 logger = logging.getLogger(__name__)
 
+# Mock user issued by the demo OAuth flow. A real UUID, since user ids are native uuid
+# columns compared against Job.user_id and friends.
+DEMO_USER_ID = "00000000-0000-0000-0000-000000000123"
+
 
 @dataclass
 class MCPAuthContext:
@@ -46,33 +48,31 @@ async def authenticate_mcp_request(authorization_header: str) -> MCPAuthContext
         return None
 
     # Extract token from "Bearer <token>" format
-    if not authorization_header.startswith("Bearer "):
+    token = bearer_token(authorization_header)
+    if token is None:
         logger.debug("Invalid authorization header format")
         return None
 
-    token = authorization_header[7:]  # Remove "Bearer " prefix
-
     try:
         # Validate OAuth JWT token
-        settings = get_settings()
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=["HS256"])
+        payload = decode_access_token(token)
         user_id: str | None = payload.get("sub")
         client_id: str | None = payload.get("client_id")
         scope: str | None = payload.get("scope")
 
-        if user_id is None:
-            logger.debug("Invalid token payload: missing user_id")
+        if user_id is None or not is_valid_id(user_id):
+            logger.debug("Invalid token payload: missing or malformed user_id")
             return None
 
     except InvalidTokenError as e:
-        logger.debug(f"Invalid JWT token: {e}")
+        logger.debug("Invalid JWT token: %s", e)
         return None
 
     # Get user from database
     db_session = AsyncSessionLocal()
     try:
         # For demo purposes, handle mock user
-        if user_id == "demo_user_123":
+        if user_id == DEMO_USER_ID:
             # Create mock user for demo
             from datetime import datetime
 
@@ -87,12 +87,11 @@ async def authenticate_mcp_request(authorization_header: str) -> MCPAuthContext
             )
 
         # Real user lookup
-        result = await db_session.execute(select(User).where(User.id == user_id))
-        user = result.scalar_one_or_none()
+        user = await db_session.get(User, user_id)
 
         if user is None:
             await db_session.close()
-            logger.debug(f"User not found: {user_id}")
+            logger.debug("User not found: %s", user_id)
             return None
 
         return MCPAuthContext(user=user, db_session=db_session, client_id=client_id, scope=scope)
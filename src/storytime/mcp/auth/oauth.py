@@ -2,6 +2,7 @@
 
 import secrets
 import string
+import time
 import uuid
 from datetime import datetime, timedelta
 
@@ -11,9 +12,10 @@ from fastapi.responses import RedirectResponse
 from pydantic import BaseModel, HttpUrl
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from storytime.api.auth import get_db
 from storytime.api.settings import get_settings
-from storytime.database import User
+from storytime.auth_tokens import bearer_token, decode_access_token
+from storytime.database import User, get_db
+from storytime.mcp.auth.jwt_middleware import DEMO_USER_ID
 
 
 class OAuthClientRegistration(BaseModel):
@@ -85,7 +87,11 @@ class AuthorizationCode(BaseModel):
     scope: str | None = None
 
 
-# In-memory storage for demo (replace with Redis/database in production)
+# In-memory storage for demo (replace with Redis/database in production). Registration is
+# unauthenticated and codes are often never exchanged, so both stores are capped: clients
+# are kept least-recently-used first, codes oldest first.
+OAUTH_CLIENTS_SIZE = 1024
+AUTHORIZATION_CODES_SIZE = 1024
 _registered_clients: dict[str, OAuthClient] = {}
 _authorization_codes: dict[str, AuthorizationCode] = {}
 
@@ -109,6 +115,32 @@ def generate_authorization_code() -> str:
     return secrets.token_urlsafe(32)
 
 
+def _get_client(client_id: str) -> OAuthClient | None:
+    """Return a registered client, marking it most recently used."""
+    client = _registered_clients.pop(client_id, None)
+    if client is not None:
+        _registered_clients[client_id] = client
+    return client
+
+
+def _store_client(client: OAuthClient) -> None:
+    """Register a client, evicting the least recently used one when the store is full."""
+    if len(_registered_clients) >= OAUTH_CLIENTS_SIZE:
+        del _registered_clients[next(iter(_registered_clients))]
+    _registered_clients[client.client_id] = client
+
+
+def _store_authorization_code(auth_code: AuthorizationCode) -> None:
+    """Store a code, first dropping expired ones and then the oldest if still full."""
+    if len(_authorization_codes) >= AUTHORIZATION_CODES_SIZE:
+        now = datetime.utcnow()
+        for code in [c for c, data in _authorization_codes.items() if data.expires_at < now]:
+            del _authorization_codes[code]
+        if len(_authorization_codes) >= AUTHORIZATION_CODES_SIZE:
+            del _authorization_codes[next(iter(_authorization_codes))]
+    _authorization_codes[auth_code.code] = auth_code
+
+
 def verify_pkce_challenge(code_verifier: str, code_challenge: str, method: str = "S256") -> bool:
     """Verify PKCE code challenge."""
     import base64
@@ -151,7 +183,7 @@ async def register_client(registration: OAuthClientRegistration) -> OAuthClient:
         token_endpoint_auth_method=registration.token_endpoint_auth_method,
     )
 
-    _registered_clients[client_id] = client
+    _store_client(client)
 
     return client
 
@@ -170,11 +202,10 @@ async def authorize(
     """OAuth authorization endpoint."""
 
     # Validate client
-    if client_id not in _registered_clients:
+    client = _get_client(client_id)
+    if client is None:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid client_id")
 
-    client = _registered_clients[client_id]
-
     # Validate redirect URI
     if redirect_uri not in [str(uri) for uri in client.redirect_uris]:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid redirect_uri")
@@ -189,22 +220,24 @@ async def authorize(
     # In production, this would redirect to a user consent page
 
     # For now, create a mock user session (in production, get from session)
-    mock_user_id = "demo_user_123"  # This would come from authenticated session
+    mock_user_id = DEMO_USER_ID  # This would come from authenticated session
 
     # Generate authorization code
     auth_code = generate_authorization_code()
     expires_at = datetime.utcnow() + timedelta(minutes=10)
 
     # Store authorization code
-    _authorization_codes[auth_code] = AuthorizationCode(
-        code=auth_code,
-        client_id=client_id,
-        user_id=mock_user_id,
-        redirect_uri=redirect_uri,
-        expires_at=expires_at,
-        code_challenge=code_challenge,
-        code_challenge_method=code_challenge_method,
-        scope=scope,
+    _store_authorization_code(
+        AuthorizationCode(
+            code=auth_code,
+            client_id=client_id,
+            user_id=mock_user_id,
+            redirect_uri=redirect_uri,
+            expires_at=expires_at,
+            code_challenge=code_challenge,
+            code_challenge_method=code_challenge_method,
+            scope=scope,
+        )
     )
 
     # Redirect back to client with code
@@ -234,13 +267,12 @@ async def token_exchange(
         )
 
     # Validate client
-    if client_id not in _registered_clients:
+    client = _get_client(client_id)
+    if client is None:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED, detail="Invalid client credentials"
         )
 
-    client = _registered_clients[client_id]
-
     # Validate client secret (if required)
     if (
         client.token_endpoint_auth_method == "client_secret_basic"
@@ -284,13 +316,14 @@ async def token_exchange(
     # In production, use auth_code_data.user_id to get real user
     user_id = auth_code_data.user_id
 
-    # Create JWT access token
+    # Create JWT access token; claims as epoch seconds, as PyJWT would encode them
+    now = int(time.time())
     token_data = {
         "sub": user_id,
         "client_id": client_id,
         "scope": auth_code_data.scope,
-        "iat": datetime.utcnow(),
-        "exp": datetime.utcnow() + timedelta(hours=1),
+        "iat": now,
+        "exp": now + 3600,
     }
 
     access_token = jwt.encode(token_data, settings.jwt_secret_key, algorithm="HS256")
@@ -322,13 +355,12 @@ async def oauth_metadata():
 
 async def extract_user_from_mcp_token(authorization: str, db: AsyncSession) -> User | None:
     """Extract user from MCP OAuth token."""
-    if not authorization or not authorization.startswith("Bearer "):
+    token = bearer_token(authorization)
+    if token is None:
         return None
 
-    token = authorization[7:]  # Remove "Bearer " prefix
-
     try:
-        payload = jwt.decode(token, settings.jwt_secret_key, algorithms=["HS256"])
+        payload = decode_access_token(token)
         user_id = payload.get("sub")
         if not user_id:
             return None
@@ -338,7 +370,7 @@ async def extract_user_from_mcp_token(authorization: str, db: AsyncSession) -> U
         # return result.scalar_one_or_none()
 
         # Mock user for demo
-        if user_id == "demo_user_123":
+        if user_id == DEMO_USER_ID:
             return User(
                 id=user_id,
                 email="demo@storytime.com",
@@ -4,10 +4,10 @@ import logging
 from typing import Any
 
 from fastmcp import Context, FastMCP
-from openai import OpenAI
 from pydantic import BaseModel
 
 from storytime.api.settings import get_settings
+from storytime.infrastructure.openai_client import get_openai_client
 from storytime.mcp.auth.jwt_middleware import authenticate_mcp_request, close_auth_context
 from storytime.services.responses_api_service import ResponsesAPIVectorStoreService
 
@@ -91,7 +91,7 @@ def create_mcp_app() -> FastMCP:
                         ]
                     }
 
-                openai_client = OpenAI(api_key=settings.openai_api_key)
+                openai_client = get_openai_client(settings.openai_api_key)
                 service = ResponsesAPIVectorStoreService(openai_client, auth_context.db_session)
 
                 # Search user's library
@@ -7,11 +7,11 @@ from typing import Any
 from uuid import uuid4
 
 from fastapi import APIRouter, Query, Request, Response
-from openai import OpenAI
 from pydantic import BaseModel
 from sse_starlette import EventSourceResponse
 
 from storytime.api.settings import get_settings
+from storytime.infrastructure.openai_client import get_openai_client
 from storytime.mcp.auth.jwt_middleware import authenticate_mcp_request, close_auth_context
 from storytime.mcp.tools.opening_lecture import opening_lecture
 from storytime.mcp.tools.tutor_chat import tutor_chat
@@ -349,7 +349,7 @@ async def handle_search_library_tool(arguments: dict[str, Any], request: Request
                 ]
             }
 
-        openai_client = OpenAI(api_key=settings.openai_api_key)
+        openai_client = get_openai_client(settings.openai_api_key)
         service = ResponsesAPIVectorStoreService(openai_client, auth_context.db_session)
 
         # Parse search parameters
@@ -475,7 +475,7 @@ async def handle_search_job_tool(arguments: dict[str, Any], request: Request) ->
                 ]
             }
 
-        openai_client = OpenAI(api_key=settings.openai_api_key)
+        openai_client = get_openai_client(settings.openai_api_key)
         service = ResponsesAPIVectorStoreService(openai_client, auth_context.db_session)
 
         # Parse search parameters
@@ -604,7 +604,7 @@ async def handle_ask_job_question_tool(
                 ]
             }
 
-        openai_client = OpenAI(api_key=settings.openai_api_key)
+        openai_client = get_openai_client(settings.openai_api_key)
         service = ResponsesAPIVectorStoreService(openai_client, auth_context.db_session)
 
         # Parse question parameters
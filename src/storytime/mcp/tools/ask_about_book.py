@@ -3,9 +3,8 @@
 import logging
 from typing import Any
 
-from openai import OpenAI
-
 from storytime.api.settings import get_settings
+from storytime.infrastructure.openai_client import get_openai_client
 from storytime.mcp.auth import MCPAuthContext
 from storytime.services.responses_api_service import ResponsesAPIVectorStoreService
 
@@ -34,7 +33,7 @@ async def ask_about_book(
         if not settings.openai_api_key:
             return {"success": False, "error": "OpenAI API key not configured", "answer": ""}
 
-        openai_client = OpenAI(api_key=settings.openai_api_key)
+        openai_client = get_openai_client(settings.openai_api_key)
         vector_service = ResponsesAPIVectorStoreService(openai_client, context.db_session)
 
         # Ask question using existing service
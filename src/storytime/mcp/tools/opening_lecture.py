@@ -6,7 +6,7 @@ from typing import Any
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from storytime.database import Job
+from storytime.database import Job, is_valid_id
 
 logger = logging.getLogger(__name__)
 
@@ -30,10 +30,12 @@ async def opening_lecture(db_session: AsyncSession, user_id: str, job_id: str) -
     try:
         logger.info(f"Fetching opening lecture for job {job_id} by user {user_id}")
 
-        # Query for the job with user verification
-        stmt = select(Job).where(Job.id == job_id, Job.user_id == user_id)
-        result = await db_session.execute(stmt)
-        job = result.scalar_one_or_none()
+        # Query for the job with user verification; a malformed id cannot match any job
+        job = None
+        if is_valid_id(job_id):
+            stmt = select(Job).where(Job.id == job_id, Job.user_id == user_id)
+            result = await db_session.execute(stmt)
+            job = result.scalar_one_or_none()
 
         if not job:
             logger.warning(f"Job {job_id} not found or not accessible by user {user_id}")
@@ -4,11 +4,11 @@ import logging
 from datetime import datetime
 from typing import Any
 
-from openai import OpenAI
 from sqlalchemy import select
 
 from storytime.api.settings import get_settings
-from storytime.database import Job, TutorConversation
+from storytime.database import Job, TutorConversation, is_valid_id
+from storytime.infrastructure.openai_client import get_openai_client
 from storytime.mcp.auth import MCPAuthContext
 from storytime.mcp.tools.opening_lecture import opening_lecture
 from storytime.services.responses_api_service import ResponsesAPIVectorStoreService
@@ -34,11 +34,13 @@ async def tutor_chat(
         if not context:
             return {"success": False, "error": "Authentication context required", "response": ""}
 
-        # Get job and verify ownership
-        result = await context.db_session.execute(
-            select(Job).where(Job.id == job_id, Job.user_id == context.user.id)
-        )
-        job = result.scalar_one_or_none()
+        # Get job and verify ownership; a malformed id cannot match any job
+        job = None
+        if is_valid_id(job_id):
+            result = await context.db_session.execute(
+                select(Job).where(Job.id == job_id, Job.user_id == context.user.id)
+            )
+            job = result.scalar_one_or_none()
 
         if not job:
             return {"success": False, "error": "Job not found or access denied", "response": ""}
@@ -147,7 +149,7 @@ You can interrupt me at any time to ask questions or dive deeper into the conten
         if not settings.openai_api_key:
             return {"success": False, "error": "OpenAI API key not configured", "response": ""}
 
-        openai_client = OpenAI(api_key=settings.openai_api_key)
+        openai_client = get_openai_client(settings.openai_api_key)
         vector_service = ResponsesAPIVectorStoreService(openai_client, context.db_session)
 
         # Build tutoring question with embedded instructions (grug-brain approach)
@@ -1,18 +1,68 @@
 """X-ray lookup MCP tool for contextual content queries (Kindle X-ray style)."""
 
 import logging
+import re
 from typing import Any
 
-from openai import OpenAI
 from sqlalchemy import select
 
 from storytime.api.settings import get_settings
-from storytime.database import Job, PlaybackProgress
+from storytime.database import Job, PlaybackProgress, is_valid_id
+from storytime.infrastructure.openai_client import get_openai_client
 from storytime.mcp.auth import MCPAuthContext
 from storytime.services.progress_aware_search import ProgressAwareSearchService
 
 logger = logging.getLogger(__name__)
 
+# Lookup types in priority order, each with the query keywords that identify it
+LOOKUP_TYPE_KEYWORDS: dict[str, tuple[str, ...]] = {
+    "character": ("who is", "who's", "character", "person"),
+    "concept": ("what is", "what's", "what does", "define"),
+    "setting": ("where", "location", "place", "setting"),
+    "time": ("when", "time", "date", "period"),
+    "explanation": ("why", "how", "explain", "meaning", "significance"),
+    "event": ("what happened", "what's happening", "event", "scene"),
+}
+LOOKUP_TYPES = list(LOOKUP_TYPE_KEYWORDS)
+LOOKUP_PRIORITY = {
+    keyword: priority
+    for priority, keywords in enumerate(LOOKUP_TYPE_KEYWORDS.values())
+    for keyword in keywords
+}
+# A lookahead so matches may overlap; alternatives are in priority order, so each
+# position reports its highest-priority keyword
+LOOKUP_KEYWORDS = re.compile(f"(?=({'|'.join(map(re.escape, LOOKUP_PRIORITY))}))")
+
+# Keywords that often indicate future events
+SPOILER_KEYWORDS = re.compile(
+    "|".join(
+        [
+            "ending",
+            "end",
+            "finale",
+            "conclusion",
+            "resolution",
+            "dies",
+            "death",
+            "killed",
+            "married",
+            "marries",
+            "reveal",
+            "revealed",
+            "turns out",
+            "actually",
+            "twist",
+            "surprise",
+            "secret",
+            "hidden",
+            "later",
+            "eventually",
+            "finally",
+            "ultimately",
+        ]
+    )
+)
+
 
 async def xray_lookup(job_id: str, query: str, context: MCPAuthContext = None) -> dict[str, Any]:
     """Provide contextual content lookup (Kindle X-ray style).
@@ -29,11 +79,13 @@ async def xray_lookup(job_id: str, query: str, context: MCPAuthContext = None) -
         if not context:
             return {"success": False, "error": "Authentication context required", "answer": ""}
 
-        # Get job and verify ownership
-        result = await context.db_session.execute(
-            select(Job).where(Job.id == job_id, Job.user_id == context.user.id)
-        )
-        job = result.scalar_one_or_none()
+        # Get job and verify ownership; a malformed id cannot match any job
+        job = None
+        if is_valid_id(job_id):
+            result = await context.db_session.execute(
+                select(Job).where(Job.id == job_id, Job.user_id == context.user.id)
+            )
+            job = result.scalar_one_or_none()
 
         if not job:
             return {"success": False, "error": "Job not found or access denied", "answer": ""}
@@ -58,7 +110,7 @@ async def xray_lookup(job_id: str, query: str, context: MCPAuthContext = None) -
         if not settings.openai_api_key:
             return {"success": False, "error": "OpenAI API key not configured", "answer": ""}
 
-        openai_client = OpenAI(api_key=settings.openai_api_key)
+        openai_client = get_openai_client(settings.openai_api_key)
         progress_service = ProgressAwareSearchService(openai_client, context.db_session)
 
         # Use progress-aware service to answer question with automatic filtering
@@ -104,59 +156,16 @@ async def xray_lookup(job_id: str, query: str, context: MCPAuthContext = None) -
 
 def _classify_lookup_type(query: str) -> str:
     """Classify the type of X-ray lookup for analytics."""
-    query_lower = query.lower().strip()
-
-    # Simple keyword-based classification
-    if any(word in query_lower for word in ["who is", "who's", "character", "person"]):
-        return "character"
-    elif any(word in query_lower for word in ["what is", "what's", "what does", "define"]):
-        return "concept"
-    elif any(word in query_lower for word in ["where", "location", "place", "setting"]):
-        return "setting"
-    elif any(word in query_lower for word in ["when", "time", "date", "period"]):
-        return "time"
-    elif any(word in query_lower for word in ["why", "how", "explain", "meaning", "significance"]):
-        return "explanation"
-    elif any(
-        word in query_lower for word in ["what happened", "what's happening", "event", "scene"]
-    ):
-        return "event"
-    else:
-        return "general"
+    # One scan of the query: every position reports its highest-priority keyword, and the
+    # highest-priority category found anywhere wins
+    priorities = [LOOKUP_PRIORITY[m.group(1)] for m in LOOKUP_KEYWORDS.finditer(query.lower())]
+    return LOOKUP_TYPES[min(priorities)] if priorities else "general"
 
 
 def _check_for_spoilers(query: str, progress_percentage: float) -> dict[str, Any]:
     """Check if query might contain spoilers based on progress."""
-    query_lower = query.lower()
-
-    # Keywords that often indicate future events
-    spoiler_keywords = [
-        "ending",
-        "end",
-        "finale",
-        "conclusion",
-        "resolution",
-        "dies",
-        "death",
-        "killed",
-        "married",
-        "marries",
-        "reveal",
-        "revealed",
-        "turns out",
-        "actually",
-        "twist",
-        "surprise",
-        "secret",
-        "hidden",
-        "later",
-        "eventually",
-        "finally",
-        "ultimately",
-    ]
-
     # Check if query contains potential spoiler keywords
-    contains_spoiler_keywords = any(keyword in query_lower for keyword in spoiler_keywords)
+    contains_spoiler_keywords = SPOILER_KEYWORDS.search(query.lower()) is not None
 
     # More likely to be spoiler if user is early in the book
     early_in_book = progress_percentage < 0.5
@@ -0,0 +1,181 @@
+"""Helpers for Alembic revisions.
+
+Revisions branch on the introspection helpers instead of wrapping DDL in try/except,
+which on Postgres aborts the surrounding transaction and hides real failures.
+
+Offline (``alembic upgrade --sql``) there is no database to inspect. The index and
+batch helpers then emit plain DDL guarded by IF [NOT] EXISTS, get_foreign_keys falls
+back to the keys the caller expects, and the has_* checks refuse to guess.
+"""
+
+from collections.abc import Iterator, Sequence
+from contextlib import contextmanager
+from typing import Any
+
+import sqlalchemy as sa
+from sqlalchemy.engine.reflection import Inspector
+
+from alembic import context, op
+
+
+def _inspector() -> Inspector:
+    if context.is_offline_mode():
+        raise RuntimeError(
+            "Schema introspection needs a live database; guard offline (--sql) runs "
+            "with IF [NOT] EXISTS DDL instead"
+        )
+    # A fresh inspector per call: reflection results are cached per instance and would
+    # go stale after DDL issued earlier in the same revision.
+    return sa.inspect(op.get_bind())
+
+
+def has_table(table: str) -> bool:
+    """Return True if the table exists."""
+    return _inspector().has_table(table)
+
+
+def has_column(table: str, column: str) -> bool:
+    """Return True if the table has the column."""
+    return column in {c["name"] for c in _inspector().get_columns(table)}
+
+
+def has_index(table: str, index: str) -> bool:
+    """Return True if the table has an index with this name."""
+    return index in {i["name"] for i in _inspector().get_indexes(table)}
+
+
+def has_foreign_key(table: str, name: str) -> bool:
+    """Return True if the table has a foreign key constraint with this name."""
+    return name in {fk["name"] for fk in _inspector().get_foreign_keys(table)}
+
+
+def get_foreign_keys(table: str, expected: Sequence[tuple[str, str]] = ()) -> list[dict]:
+    """Return the reflected foreign keys of the table.
+
+    Offline the keys are built from ``expected`` instead: (column, referred table) pairs
+    the revision history created, named the way Postgres names an unnamed key.
+    """
+    if context.is_offline_mode():
+        return [
+            {
+                "name": f"{table}_{column}_fkey",
+                "constrained_columns": [column],
+                "referred_table": referred_table,
+                "referred_columns": ["id"],
+            }
+            for column, referred_table in expected
+        ]
+    return _inspector().get_foreign_keys(table)
+
+
+def _index_is_valid(table: str, index: str) -> bool | None:
+    """Return whether the index is usable by the planner, or None if it does not exist."""
+    return (
+        op.get_bind()
+        .execute(
+            sa.text(
+                "SELECT i.indisvalid FROM pg_index i "
+                "JOIN pg_class c ON c.oid = i.indexrelid "
+                "WHERE c.relname = :index AND i.indrelid = to_regclass(:table)"
+            ),
+            {"index": index, "table": table},
+        )
+        .scalar_one_or_none()
+    )
+
+
+@contextmanager
+def _without_lock_timeout() -> Iterator[None]:
+    """Lift the session lock_timeout that alembic/env.py sets, for one CONCURRENTLY statement.
+
+    CONCURRENTLY waits for every open transaction on the table to finish, which under load
+    easily outlasts the timeout; being cancelled part way leaves an INVALID index behind.
+    It takes no lock that blocks writers while it waits, so waiting it out is harmless.
+    Offline scripts never set a lock_timeout, so there is nothing to lift.
+    """
+    if context.is_offline_mode():
+        yield
+        return
+    connection = op.get_bind()
+    previous = connection.execute(sa.text("SELECT current_setting('lock_timeout')")).scalar_one()
+    connection.execute(sa.text("SET lock_timeout = 0"))
+    try:
+        yield
+    finally:
+        connection.execute(
+            sa.text("SELECT set_config('lock_timeout', :timeout, false)"), {"timeout": previous}
+        )
+
+
+def create_index_concurrently(
+    index: str, table: str, columns: Sequence[str | sa.TextClause], **kw: Any
+) -> None:
+    """Build an index with CREATE INDEX CONCURRENTLY so writes to the table keep flowing.
+
+    Any index added to a table that already holds production data must go through this.
+    CONCURRENTLY cannot run inside a transaction, so this commits the revision's earlier
+    DDL first; keep such revisions to index changes only. An INVALID index left behind by
+    an earlier failed build is dropped and rebuilt rather than counted as done.
+    """
+    if context.is_offline_mode():
+        with op.get_context().autocommit_block():
+            op.create_index(
+                index, table, columns, postgresql_concurrently=True, if_not_exists=True, **kw
+            )
+        return
+    valid = _index_is_valid(table, index)
+    if valid:
+        return
+    with op.get_context().autocommit_block(), _without_lock_timeout():
+        if valid is False:
+            op.drop_index(index, table_name=table, postgresql_concurrently=True)
+        op.create_index(index, table, columns, postgresql_concurrently=True, **kw)
+
+
+def drop_index_concurrently(index: str, table: str) -> None:
+    """Drop an index with DROP INDEX CONCURRENTLY unless it is already gone."""
+    if context.is_offline_mode():
+        with op.get_context().autocommit_block():
+            op.drop_index(index, table_name=table, postgresql_concurrently=True, if_exists=True)
+        return
+    if not has_index(table, index):
+        return
+    with op.get_context().autocommit_block(), _without_lock_timeout():
+        op.drop_index(index, table_name=table, postgresql_concurrently=True)
+
+
+def batched_update(
+    statement: str, params: dict[str, Any] | None = None, batch_size: int = 5000
+) -> int:
+    """Repeat a data-migration statement until it changes no rows; return the total changed.
+
+    The statement must bound itself with ``LIMIT :batch_size``, e.g.::
+
+        WITH batch AS (
+            SELECT id FROM jobs WHERE x IS NULL LIMIT :batch_size FOR UPDATE
+        )
+        UPDATE jobs SET x = ... FROM batch WHERE jobs.id = batch.id
+
+    Do not add SKIP LOCKED: a batch whose remaining rows are all locked by a concurrent
+    writer would change no rows and end the loop with the backfill unfinished. A migration
+    should wait for those rows instead.
+
+    Batches run in autocommit mode so row locks are released between them instead of
+    one statement rewriting the whole table inside the migration transaction. Note that
+    this commits any DDL the revision issued before the call.
+
+    Offline a script cannot loop on the row count, so the statement is emitted once with
+    ``LIMIT NULL``, which Postgres treats as no limit, and 0 is returned.
+    """
+    if context.is_offline_mode():
+        op.execute(sa.text(statement).bindparams(**{**(params or {}), "batch_size": None}))
+        return 0
+    bind_params = {**(params or {}), "batch_size": batch_size}
+    total = 0
+    with op.get_context().autocommit_block():
+        connection = op.get_bind()
+        while True:
+            rowcount = connection.execute(sa.text(statement), bind_params).rowcount
+            if not rowcount:
+                return total
+            total += rowcount
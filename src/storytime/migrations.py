@@ -0,0 +1,71 @@
+"""Run Alembic migrations from the API process at startup."""
+
+import logging
+import threading
+from pathlib import Path
+
+from alembic.config import Config
+from sqlalchemy import create_engine, pool, text
+
+from alembic import command
+from storytime.api.settings import get_settings
+
+logger = logging.getLogger(__name__)
+
+# alembic.ini lives at the repository root (/app in the container)
+ALEMBIC_INI = Path(__file__).resolve().parents[2] / "alembic.ini"
+
+# Session-level advisory lock shared by every process that may try to migrate
+MIGRATION_LOCK_SQL = "SELECT pg_try_advisory_lock(hashtext('alembic'))"
+MIGRATION_UNLOCK_SQL = "SELECT pg_advisory_unlock(hashtext('alembic'))"
+
+# pending | running | succeeded | skipped | failed
+migration_state: dict[str, str | None] = {"status": "pending", "error": None}
+_start_lock = threading.Lock()
+
+
+def _sync_database_url() -> str:
+    settings = get_settings()
+    if settings.alembic_database_url:
+        return settings.alembic_database_url
+    return settings.database_url.replace("postgresql+asyncpg", "postgresql+psycopg2")
+
+
+def run_migrations() -> None:
+    """Upgrade the database to head unless another process already holds the migration lock."""
+    migration_state.update(status="running", error=None)
+    engine = create_engine(_sync_database_url(), poolclass=pool.NullPool)
+    try:
+        with engine.connect() as connection:
+            if not connection.execute(text(MIGRATION_LOCK_SQL)).scalar():
+                logger.info("Another process is running migrations; skipping")
+                migration_state["status"] = "skipped"
+                return
+            connection.commit()
+            try:
+                config = Config(str(ALEMBIC_INI))
+                # Share this connection with env.py and keep the app's logging config intact
+                config.attributes["connection"] = connection
+                config.attributes["configure_logger"] = False
+                command.upgrade(config, "head")
+            finally:
+                connection.execute(text(MIGRATION_UNLOCK_SQL))
+                connection.commit()
+        migration_state["status"] = "succeeded"
+        logger.info("Database migrations complete")
+    except Exception as e:
+        migration_state.update(status="failed", error=str(e))
+        logger.error(f"Database migrations failed: {e}", exc_info=True)
+    finally:
+        engine.dispose()
+
+
+def start_background_migrations() -> threading.Thread | None:
+    """Run migrations in a daemon thread so the API can serve requests meanwhile."""
+    with _start_lock:
+        if migration_state["status"] != "pending":
+            return None
+        migration_state["status"] = "running"
+    thread = threading.Thread(target=run_migrations, name="alembic-upgrade", daemon=True)
+    thread.start()
+    return thread
@@ -4,7 +4,7 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import AnyHttpUrl, BaseModel, Field
+from pydantic import AnyHttpUrl, BaseModel, Field, TypeAdapter
 
 try:  # Pydantic v2
     from pydantic import model_validator
@@ -160,6 +160,11 @@ class JobStepResponse(BaseModel):
     duration: float | None = None
 
 
+# Validates a whole list of JobStep rows in one pydantic-core call instead of building
+# each JobStepResponse field by field in Python.
+JOB_STEPS_ADAPTER = TypeAdapter(list[JobStepResponse])
+
+
 class JobResponse(BaseModel):
     """Response model for text-to-audio jobs."""
 
@@ -199,10 +204,13 @@ class JobListResponse(BaseModel):
     """Response model for paginated job lists."""
 
     jobs: list[JobResponse]
-    total: int
+    total: int | None = Field(None, description="Matching jobs; only set with include_total")
     page: int
     page_size: int
-    total_pages: int
+    total_pages: int | None = Field(None, description="Only set with include_total")
+    next_cursor: str | None = Field(
+        None, description="Pass as cursor to fetch the following page; null on the last page"
+    )
 
 
 class JobFilters(BaseModel):
@@ -256,6 +264,10 @@ class PlaybackProgressResponse(BaseModel):
     updated_at: datetime
 
 
+# Validates a list of PlaybackProgress rows in one pydantic-core call.
+PLAYBACK_PROGRESS_ADAPTER = TypeAdapter(list[PlaybackProgressResponse])
+
+
 class ResumeInfoResponse(BaseModel):
     """Response model for resume information."""
 
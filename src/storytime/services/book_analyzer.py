@@ -8,7 +8,7 @@ from typing import ClassVar
 logger = logging.getLogger(__name__)
 
 
-@dataclass
+@dataclass(slots=True)
 class ChapterInfo:
     """Information about a detected chapter."""
 
@@ -54,6 +54,16 @@ class BookAnalyzer:
     MAX_CHAPTER_WORDS = 15000  # Very long chapters should be split
     IDEAL_CHAPTER_WORDS = 5000  # Target for content-based splitting
 
+    ROMAN_VALUES: ClassVar[dict[str, int]] = {
+        "I": 1,
+        "V": 5,
+        "X": 10,
+        "L": 50,
+        "C": 100,
+        "D": 500,
+        "M": 1000,
+    }
+
     def __init__(self):
         self.compiled_patterns = [
             (re.compile(pattern, re.MULTILINE), pattern_type)
@@ -76,36 +86,33 @@ class BookAnalyzer:
             # Fall back to content-based splitting
             chapters = self._content_based_split(text)
 
-        # Calculate word counts for each chapter
-        for chapter in chapters:
-            chapter_text = text[chapter.start_position : chapter.end_position]
-            chapter.word_count = len(chapter_text.split())
-
+        # Every path above has already set word_count while sizing the chapters
         logger.info(f"Analysis complete: {len(chapters)} chapters detected")
         return chapters
 
     def _detect_chapter_markers(self, text: str) -> list[ChapterInfo]:
         """Detect chapters using explicit markers."""
-        chapters = []
-        seen_positions = set()
+        # Chapters keyed by start position: one dict both drops a marker found again by a
+        # later, less specific pattern and yields the positions to order by
+        chapters_by_position: dict[int, ChapterInfo] = {}
 
         # Find all chapter markers in the text
         for pattern, pattern_type in self.compiled_patterns:
+            is_special = pattern_type == "special"
             for match in pattern.finditer(text):
                 start_pos = match.start()
 
                 # Skip if we've already found a chapter at this position
-                if start_pos in seen_positions:
+                if start_pos in chapters_by_position:
                     continue
 
-                seen_positions.add(start_pos)
                 title = match.group(0).strip()
 
                 chapter_info = ChapterInfo(
                     title=title,
                     start_position=start_pos,
                     end_position=start_pos,  # Will be updated later
-                    is_special=(pattern_type == "special"),
+                    is_special=is_special,
                 )
 
                 # Try to extract chapter number
@@ -118,10 +125,10 @@ class BookAnalyzer:
                     except (ValueError, IndexError):
                         pass
 
-                chapters.append(chapter_info)
+                chapters_by_position[start_pos] = chapter_info
 
         # Sort chapters by position
-        chapters.sort(key=lambda c: c.start_position)
+        chapters = [chapters_by_position[pos] for pos in sorted(chapters_by_position)]
 
         # Update end positions
         for i in range(len(chapters)):
@@ -140,6 +147,8 @@ class BookAnalyzer:
             chapter_text = text[chapter.start_position : chapter.end_position]
             word_count = len(chapter_text.split())
 
+            chapter.word_count = word_count
+
             # Skip very short chapters (likely false positives)
             if word_count < self.MIN_CHAPTER_WORDS and not chapter.is_special:
                 logger.warning(f"Skipping short chapter '{chapter.title}' with {word_count} words")
@@ -161,40 +170,41 @@ class BookAnalyzer:
     def _split_long_chapter(
         self, text: str, start_position: int, original_title: str
     ) -> list[ChapterInfo]:
-        """Split a long chapter into smaller parts."""
-        parts = []
-        words = text.split()
+        """Split a long chapter into roughly equal parts, cutting at paragraph breaks."""
+        # Word spans in the original text, so cut points map straight back to positions
+        # (rejoining split() words would collapse the paragraph breaks being searched for)
+        words = [m.span() for m in re.finditer(r"\S+", text)]
         total_words = len(words)
 
         # Calculate number of parts needed
         num_parts = (total_words // self.IDEAL_CHAPTER_WORDS) + 1
         words_per_part = total_words // num_parts
 
-        current_pos = 0
+        # Word index each part starts at: the paragraph break nearest before the ideal cut,
+        # looking back at most half a part, or the ideal cut itself if there is none
+        cuts = [0]
+        for i in range(1, num_parts):
+            ideal = i * words_per_part
+            cut = ideal
+            for k in range(ideal, max(cuts[-1] + 1, ideal - words_per_part // 2), -1):
+                if text.count("\n", words[k - 1][1], words[k][0]) >= 2:
+                    cut = k
+                    break
+            cuts.append(cut)
+        cuts.append(total_words)
+
+        parts = []
         for i in range(num_parts):
-            # Find a good breaking point (end of paragraph)
-            start_word = i * words_per_part
-            end_word = min((i + 1) * words_per_part, total_words)
-
-            # Reconstruct text for this part
-            part_words = words[start_word:end_word]
-            part_text = " ".join(part_words)
-
-            # Find the last paragraph break
-            last_para = part_text.rfind("\n\n")
-            if last_para > 0 and i < num_parts - 1:
-                part_text = part_text[:last_para]
-                # Adjust end_word
-                end_word = start_word + len(part_text.split())
-
-            part = ChapterInfo(
-                title=f"{original_title} - Part {i + 1}",
-                start_position=start_position + current_pos,
-                end_position=start_position + current_pos + len(part_text),
-                word_count=len(part_text.split()),
+            start = words[cuts[i]][0] if i else 0
+            end = words[cuts[i + 1]][0] if i < num_parts - 1 else len(text)
+            parts.append(
+                ChapterInfo(
+                    title=f"{original_title} - Part {i + 1}",
+                    start_position=start_position + start,
+                    end_position=start_position + end,
+                    word_count=cuts[i + 1] - cuts[i],
+                )
             )
-            parts.append(part)
-            current_pos += len(part_text) + 2  # +2 for paragraph break
 
         return parts
 
@@ -205,55 +215,53 @@ class BookAnalyzer:
         # Split by multiple newlines (potential section breaks)
         sections = re.split(r"\n{3,}", text)
 
-        current_chapter_text = ""
+        # Track the current chapter by running length and word counts; rebuilding and
+        # re-splitting the whole chapter text for every section is quadratic
+        current_len = 0
+        current_words = 0
         current_position = 0
         chapter_num = 1
 
+        def make_chapter() -> ChapterInfo:
+            return ChapterInfo(
+                title=f"Chapter {chapter_num}",
+                start_position=current_position,
+                end_position=current_position + current_len,
+                chapter_number=chapter_num,
+                word_count=current_words,
+            )
+
         for section in sections:
             section = section.strip()
             if not section:
                 continue
 
             # Check if adding this section would make the chapter too long
-            combined_text = (
-                current_chapter_text + "\n\n" + section if current_chapter_text else section
-            )
-            word_count = len(combined_text.split())
+            section_words = len(section.split())
 
-            if word_count > self.IDEAL_CHAPTER_WORDS and current_chapter_text:
+            if current_words + section_words > self.IDEAL_CHAPTER_WORDS and current_len:
                 # Save current chapter
-                chapter = ChapterInfo(
-                    title=f"Chapter {chapter_num}",
-                    start_position=current_position,
-                    end_position=current_position + len(current_chapter_text),
-                    chapter_number=chapter_num,
-                    word_count=len(current_chapter_text.split()),
-                )
-                chapters.append(chapter)
+                chapters.append(make_chapter())
 
                 # Start new chapter
                 chapter_num += 1
-                current_position += len(current_chapter_text) + 3  # +3 for newlines
-                current_chapter_text = section
+                current_position += current_len + 3  # +3 for newlines
+                current_len = len(section)
+                current_words = section_words
             else:
-                current_chapter_text = combined_text
+                # Sections are rejoined with "\n\n"
+                current_len += len(section) + (2 if current_len else 0)
+                current_words += section_words
 
         # Don't forget the last chapter
-        if current_chapter_text:
-            chapter = ChapterInfo(
-                title=f"Chapter {chapter_num}",
-                start_position=current_position,
-                end_position=current_position + len(current_chapter_text),
-                chapter_number=chapter_num,
-                word_count=len(current_chapter_text.split()),
-            )
-            chapters.append(chapter)
+        if current_len:
+            chapters.append(make_chapter())
 
         return chapters
 
     def _roman_to_int(self, roman: str) -> int:
         """Convert Roman numerals to integers."""
-        roman_values = {"I": 1, "V": 5, "X": 10, "L": 50, "C": 100, "D": 500, "M": 1000}
+        roman_values = self.ROMAN_VALUES  # Local lookup inside the loop
 
         total = 0
         prev_value = 0
@@ -1,16 +1,209 @@
 """Content analysis service using Google Gemini for job type detection."""
 
+import asyncio
 import logging
+from contextlib import aclosing
+from functools import lru_cache
 from typing import Any
 
-from google import genai
 from pydantic import BaseModel
 
 from storytime.api.settings import get_settings
+from storytime.infrastructure.gemini import get_gemini_client
+from storytime.infrastructure.llm_cache import LLMCache, get_llm_cache
 from storytime.models import JobType
 
 logger = logging.getLogger(__name__)
 
+# Gemini's job_type answer -> JobType; anything unrecognised is processed as TEXT_TO_AUDIO
+JOB_TYPES: dict[str, JobType] = {job_type.value: job_type for job_type in JobType}
+
+# Prompt budget: how much of the content each request quotes
+ANALYSIS_EXCERPT_CHARS = 3000
+TUTORING_EXCERPT_CHARS = 4000
+
+# Static prompt sections, built once; each request only formats its content section
+ANALYSIS_PROMPT_HEAD = """### ROLE AND OBJECTIVE
+You are a content analysis expert specializing in determining optimal processing approaches for text-to-speech conversion. Your goal is to analyze content and determine whether it should be processed as a simple text-to-audio job or as a full book with chapter splitting.
+
+### INSTRUCTIONS
+Analyze the provided content and determine the appropriate job type based on these criteria:
+
+**TEXT_TO_AUDIO (Simple Processing):**
+- Short articles, blog posts, essays (typically under 10,000 words)
+- Single-topic content without clear chapter structure
+- News articles, reviews, documentation
+- Content that reads better as a single continuous audio file
+- Academic papers, research documents
+
+**BOOK_PROCESSING (Chapter Splitting):**
+- Full-length books with clear chapter divisions
+- Long-form content with distinct sections/chapters (typically over 15,000 words)
+- Content with "Chapter 1", "Chapter 2" or similar markers
+- Multi-part stories or serialized content
+- Textbooks with numbered sections
+- Content that benefits from being split into manageable audio segments
+
+### RESPONSE FORMAT
+You must respond with a JSON object containing exactly these fields:
+```json
+{
+    "job_type": "text_to_audio" or "book_processing",
+    "confidence": 0.0-1.0,
+    "reasoning": "Brief explanation of your decision",
+    "estimated_chapters": null or number (only if book_processing),
+    "content_characteristics": ["list", "of", "key", "characteristics", "observed"]
+}
+```"""
+TUTORING_PROMPT_HEAD = """### ROLE
+You are an expert tutor and content analyst. Your job is to analyze content and extract key information needed for tutoring conversations.
+
+### TASK
+Analyze the provided content and extract tutoring-relevant information. Focus on creating a foundation for Socratic dialogue and engaged learning.
+
+### RESPONSE FORMAT
+Respond with a JSON object containing exactly these fields:
+```json
+{
+    "themes": ["list of 3-5 main themes or concepts"],
+    "characters": [{"name": "Character Name", "role": "brief description"}],
+    "setting": {"time": "time period", "place": "location/setting"},
+    "discussion_questions": ["list of 3-5 thought-provoking questions for Socratic dialogue"],
+    "content_type": "fiction|non-fiction|academic|poetry|biography|history|science|philosophy|etc"
+}
+```
+
+### GUIDELINES
+- **Themes**: Extract core concepts, ideas, or topics (not just plot points)
+- **Characters**: For fiction, list main characters. For non-fiction, list key figures/people mentioned
+- **Setting**: Time period and place. For non-fiction, consider historical/intellectual context
+- **Discussion Questions**: Create open-ended questions that promote deep thinking and analysis
+- **Content Type**: Categorize to help tailor tutoring approach"""
+TUTORING_AND_LECTURE_PROMPT_HEAD = """### ROLE
+You are an expert tutor and educational content designer. Your job is to analyze content for tutoring conversations and to write an engaging 2-3 minute opening lecture that introduces it and prepares students for Socratic dialogue.
+
+### TASK 1: TUTORING ANALYSIS
+- **Themes**: 3-5 core concepts, ideas, or topics (not just plot points)
+- **Characters**: For fiction, list main characters. For non-fiction, list key figures/people mentioned
+- **Setting**: Time period and place. For non-fiction, consider historical/intellectual context
+- **Discussion Questions**: 3-5 open-ended questions that promote deep thinking and analysis
+- **Content Type**: Categorize to help tailor tutoring approach
+
+### TASK 2: OPENING LECTURE
+- Create a warm, welcoming introduction that hooks student interest
+- Provide a clear overview of key concepts without spoiling details
+- Set learning expectations and objectives
+- Generate 3-4 engagement questions to prime student thinking
+- Keep the tone conversational and accessible, about 2-3 minutes of speaking time (300-450 words)
+- DO NOT include detailed analysis or answers - focus on setting up curiosity
+- DO NOT spoil plot points or key revelations if this is narrative content
+
+### RESPONSE FORMAT
+Respond with a JSON object containing exactly these fields:
+```json
+{
+    "tutoring": {
+        "themes": ["list of 3-5 main themes or concepts"],
+        "characters": [{"name": "Character Name", "role": "brief description"}],
+        "setting": {"time": "time period", "place": "location/setting"},
+        "discussion_questions": ["list of 3-5 thought-provoking questions for Socratic dialogue"],
+        "content_type": "fiction|non-fiction|academic|poetry|biography|history|science|philosophy|etc"
+    },
+    "opening_lecture": {
+        "introduction": "string - warm, engaging opening that hooks interest (100-150 words)",
+        "key_concepts_overview": "string - brief overview of main concepts to explore (100-150 words)",
+        "learning_objectives": "string - what students will gain from the session (50-100 words)",
+        "engagement_questions": ["array of 3-4 open-ended questions to prime thinking"],
+        "lecture_duration_minutes": "integer - estimated speaking time (2-4 minutes)",
+        "extension_topics": ["array of 2-4 topics for deeper exploration if requested"]
+    }
+}
+```"""
+OPENING_LECTURE_PROMPT_HEAD = """### ROLE AND OBJECTIVE
+You are an expert educational content designer and tutor. Your goal is to create an engaging 2-3 minute opening lecture that introduces content to students and prepares them for Socratic dialogue.
+
+### INSTRUCTIONS / RESPONSE RULES
+- Create a warm, welcoming introduction that hooks student interest
+- Provide a clear overview of key concepts without spoiling details
+- Set learning expectations and objectives
+- Generate 3-4 engagement questions to prime student thinking
+- Keep the tone conversational and accessible
+- Aim for 2-3 minutes of speaking time (approximately 300-450 words)
+- DO NOT include detailed analysis or answers - focus on setting up curiosity
+- DO NOT spoil plot points or key revelations if this is narrative content"""
+OPENING_LECTURE_PROMPT_TAIL = """### EXAMPLES
+Example JSON response structure:
+```json
+{
+    "introduction": "Welcome! Today we're diving into fascinating content that explores...",
+    "key_concepts_overview": "We'll be examining three main areas: first, the concept of...",
+    "learning_objectives": "By the end of our discussion, you'll be able to...",
+    "engagement_questions": ["What do you already know about...?", "How might this relate to...?"],
+    "lecture_duration_minutes": 3,
+    "extension_topics": ["Advanced concept A", "Historical context B"]
+}
+```
+
+### REASONING STEPS
+Think step by step:
+1. Identify the most compelling hook from the content
+2. Determine 2-3 core concepts that are accessible entry points
+3. Consider what learning outcomes are realistic for a tutoring session
+4. Craft questions that activate prior knowledge and curiosity
+5. Identify natural extension points for deeper exploration
+
+### OUTPUT FORMATTING CONSTRAINTS
+Respond with a JSON object containing exactly these fields:
+```json
+{
+    "introduction": "string - warm, engaging opening that hooks interest (100-150 words)",
+    "key_concepts_overview": "string - brief overview of main concepts to explore (100-150 words)", 
+    "learning_objectives": "string - what students will gain from the session (50-100 words)",
+    "engagement_questions": ["array of 3-4 open-ended questions to prime thinking"],
+    "lecture_duration_minutes": "integer - estimated speaking time (2-4 minutes)",
+    "extension_topics": ["array of 2-4 topics for deeper exploration if requested"]
+}
+```
+
+### CONTENT ANALYSIS
+Generate the opening lecture JSON:"""
+
+
+def _excerpt(content: str, limit: int) -> str:
+    """Return the first limit characters of content, marked when it was cut."""
+    if len(content) <= limit:
+        return content
+    return content[:limit] + "\n\n[Content truncated for analysis...]"
+
+
+def _find_object_end(text: str, start: int) -> int:
+    """Return the index just past the brace matching text[start], or -1 if it never closes.
+
+    One pass that tracks nesting depth and skips string literals, so braces inside strings
+    and anything after the object (closing fence, trailing prose) are ignored.
+    """
+    depth = 0
+    in_string = False
+    escaped = False
+    for i in range(start, len(text)):
+        char = text[i]
+        if in_string:
+            if escaped:
+                escaped = False
+            elif char == "\\":
+                escaped = True
+            elif char == '"':
+                in_string = False
+        elif char == '"':
+            in_string = True
+        elif char in "{[":
+            depth += 1
+        elif char in "}]":
+            depth -= 1
+            if depth == 0:
+                return i + 1
+    return -1
+
 
 class ContentAnalysisResult(BaseModel):
     """Structured output from Gemini content analysis."""
@@ -43,12 +236,24 @@ class OpeningLectureResult(BaseModel):
     extension_topics: list[str]  # Topics for deeper exploration if requested
 
 
+class TutoringAndLectureResult(BaseModel):
+    """Tutoring analysis and opening lecture produced by a single Gemini request."""
+
+    tutoring: TutoringAnalysisResult
+    opening_lecture: OpeningLectureResult
+
+
 class ContentAnalyzer:
     """Service for analyzing content to determine optimal job type."""
 
-    def __init__(self):
-        """Initialize the content analysis service with Google Gemini."""
+    def __init__(self, use_cache: bool = True):
+        """Initialize the content analysis service with Google Gemini.
+
+        Args:
+            use_cache: Reuse earlier Gemini responses for identical prompts (LLM cache)
+        """
         settings = get_settings()
+        self.cache = get_llm_cache() if use_cache else None
 
         if not settings.google_api_key:
             logger.warning("GOOGLE_API_KEY not set - content analysis will be disabled")
@@ -56,10 +261,51 @@ class ContentAnalyzer:
             return
 
         # Initialize Google Gemini client
-        self.client = genai.Client(api_key=settings.google_api_key)
+        self.client = get_gemini_client(settings.google_api_key)
         self.model_name = "gemini-2.0-flash-exp"  # Using Flash for faster response
         logger.info("Gemini content analysis service initialized")
 
+    async def _generate_text(self, prompt: str) -> str | None:
+        """Return Gemini's response text for prompt, reusing a cached response when possible.
+
+        Every prompt here is a pure function of the content, so identical prompts (re-runs,
+        retries, re-analysis of the same upload) can share one answer. Only responses that
+        contain a complete JSON object are cached, so empty or truncated ones are retried.
+        """
+        key = LLMCache.make_key(model=self.model_name, prompt=prompt)
+        if self.cache and (cached := await asyncio.to_thread(self.cache.get, key)) is not None:
+            logger.info("Using cached Gemini response")
+            return cached
+
+        # Stream the response and scan it as it arrives: once the JSON object closes, the
+        # rest (closing fence, trailing commentary) is never waited for
+        parts: list[str] = []
+        object_start = -1
+        stream = await self.client.aio.models.generate_content_stream(
+            model=self.model_name, contents=prompt
+        )
+        async with aclosing(stream):
+            async for chunk in stream:
+                if not chunk.text:
+                    continue
+                parts.append(chunk.text)
+                text = "".join(parts)
+                if object_start < 0:
+                    object_start = text.find("{")
+                if object_start >= 0 and (end := _find_object_end(text, object_start)) > 0:
+                    parts = [text[:end]]
+                    break
+
+        response_text = "".join(parts) or None
+        if self.cache and response_text:
+            try:
+                self._extract_json_text(response_text)
+            except ValueError:
+                pass
+            else:
+                await asyncio.to_thread(self.cache.set, key, response_text)
+        return response_text
+
     async def analyze_content(self, content: str, title: str | None = None) -> JobType:
         """
         Analyze content to determine the appropriate job type.
@@ -89,18 +335,15 @@ class ContentAnalyzer:
 
             logger.info("Calling Gemini API for content analysis...")
 
-            # Generate response from Gemini
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt
-            )
+            # Generate response from Gemini (or the LLM cache)
+            response_text = await self._generate_text(prompt)
 
-            if not response.text:
+            if not response_text:
                 logger.warning("Gemini returned empty response, defaulting to TEXT_TO_AUDIO")
                 return JobType.TEXT_TO_AUDIO
 
             # Parse the structured response
-            result = self._parse_analysis_result(response.text)
+            result = self._parse_analysis_result(response_text)
 
             logger.info(
                 f"Content analysis completed: {result.job_type} "
@@ -108,10 +351,7 @@ class ContentAnalyzer:
             )
 
             # Convert string result to JobType enum
-            if result.job_type.lower() == "book_processing":
-                return JobType.BOOK_PROCESSING
-            else:
-                return JobType.TEXT_TO_AUDIO
+            return JOB_TYPES.get(result.job_type.lower(), JobType.TEXT_TO_AUDIO)
 
         except Exception as e:
             logger.error(f"Content analysis failed: {e}", exc_info=True)
@@ -123,47 +363,17 @@ class ContentAnalyzer:
 
         title_context = f"\n**Title:** {title}" if title else ""
 
-        # Truncate content for analysis (first 3000 characters should be enough)
-        analysis_content = content[:3000]
-        if len(content) > 3000:
-            analysis_content += "\n\n[Content truncated for analysis...]"
-
-        prompt = f"""### ROLE AND OBJECTIVE
-You are a content analysis expert specializing in determining optimal processing approaches for text-to-speech conversion. Your goal is to analyze content and determine whether it should be processed as a simple text-to-audio job or as a full book with chapter splitting.
-
-### INSTRUCTIONS
-Analyze the provided content and determine the appropriate job type based on these criteria:
-
-**TEXT_TO_AUDIO (Simple Processing):**
-- Short articles, blog posts, essays (typically under 10,000 words)
-- Single-topic content without clear chapter structure
-- News articles, reviews, documentation
-- Content that reads better as a single continuous audio file
-- Academic papers, research documents
-
-**BOOK_PROCESSING (Chapter Splitting):**
-- Full-length books with clear chapter divisions
-- Long-form content with distinct sections/chapters (typically over 15,000 words)
-- Content with "Chapter 1", "Chapter 2" or similar markers
-- Multi-part stories or serialized content
-- Textbooks with numbered sections
-- Content that benefits from being split into manageable audio segments
+        # The first ANALYSIS_EXCERPT_CHARS are enough to judge the structure
+        analysis_content = _excerpt(content, ANALYSIS_EXCERPT_CHARS)
+        # Estimate the word count from the excerpt instead of splitting a whole book
+        excerpt = content[:ANALYSIS_EXCERPT_CHARS]
+        word_estimate = len(excerpt.split()) * len(content) // max(len(excerpt), 1)
 
-### RESPONSE FORMAT
-You must respond with a JSON object containing exactly these fields:
-```json
-{{
-    "job_type": "text_to_audio" or "book_processing",
-    "confidence": 0.0-1.0,
-    "reasoning": "Brief explanation of your decision",
-    "estimated_chapters": null or number (only if book_processing),
-    "content_characteristics": ["list", "of", "key", "characteristics", "observed"]
-}}
-```
+        prompt = f"""{ANALYSIS_PROMPT_HEAD}
 
 ### CONTENT TO ANALYZE{title_context}
 
-**Content Length:** {len(content):,} characters (~{len(content.split()):,} words)
+**Content Length:** {len(content):,} characters (~{word_estimate:,} words)
 
 **Content:**
 ```
@@ -176,39 +386,15 @@ Analyze this content and respond with the JSON structure above."""
 
     def _parse_analysis_result(self, response_text: str) -> ContentAnalysisResult:
         """Parse the structured response from Gemini."""
-        import json
-
         try:
-            # Try to extract JSON from the response
-            response_text = response_text.strip()
-
-            # Look for JSON block markers
-            if "```json" in response_text:
-                start = response_text.find("```json") + 7
-                end = response_text.find("```", start)
-                json_text = response_text[start:end].strip()
-            elif "```" in response_text:
-                start = response_text.find("```") + 3
-                end = response_text.find("```", start)
-                json_text = response_text[start:end].strip()
-            else:
-                # Try to find JSON-like content
-                start = response_text.find("{")
-                end = response_text.rfind("}") + 1
-                if start != -1 and end != 0:
-                    json_text = response_text[start:end]
-                else:
-                    raise ValueError("No JSON structure found in response")
+            json_text = self._extract_json_text(response_text)
 
-            # Parse the JSON
-            result_data = json.loads(json_text)
-
-            # Validate and create the result
-            return ContentAnalysisResult(**result_data)
+            # Parse and validate in one pass
+            return ContentAnalysisResult.model_validate_json(json_text)
 
         except Exception as e:
             logger.warning(f"Failed to parse Gemini response as JSON: {e}")
-            logger.debug(f"Raw response: {response_text[:500]}...")
+            logger.debug("Raw response: %.500s...", response_text)
 
             # Fallback analysis based on text content
             return self._fallback_analysis(response_text)
@@ -286,13 +472,13 @@ Analyze this content and respond with the JSON structure above."""
 
         try:
             prompt = self._build_tutoring_prompt(content, title)
-            response = self.model.generate_content(prompt)
+            response_text = await self._generate_text(prompt)
 
-            if not response.text:
+            if not response_text:
                 logger.warning("Gemini returned empty response for tutoring analysis")
                 return self._fallback_tutoring_analysis()
 
-            result = self._parse_tutoring_result(response.text)
+            result = self._parse_tutoring_result(response_text)
             logger.info(
                 f"Tutoring analysis completed: {len(result.themes)} themes, {len(result.characters)} characters"
             )
@@ -307,35 +493,9 @@ Analyze this content and respond with the JSON structure above."""
 
         title_context = f"\n**Title:** {title}" if title else ""
 
-        # Use first 4000 characters for tutoring analysis
-        analysis_content = content[:4000]
-        if len(content) > 4000:
-            analysis_content += "\n\n[Content truncated for analysis...]"
-
-        prompt = f"""### ROLE
-You are an expert tutor and content analyst. Your job is to analyze content and extract key information needed for tutoring conversations.
-
-### TASK
-Analyze the provided content and extract tutoring-relevant information. Focus on creating a foundation for Socratic dialogue and engaged learning.
-
-### RESPONSE FORMAT
-Respond with a JSON object containing exactly these fields:
-```json
-{{
-    "themes": ["list of 3-5 main themes or concepts"],
-    "characters": [{{"name": "Character Name", "role": "brief description"}}],
-    "setting": {{"time": "time period", "place": "location/setting"}},
-    "discussion_questions": ["list of 3-5 thought-provoking questions for Socratic dialogue"],
-    "content_type": "fiction|non-fiction|academic|poetry|biography|history|science|philosophy|etc"
-}}
-```
+        analysis_content = _excerpt(content, TUTORING_EXCERPT_CHARS)
 
-### GUIDELINES
-- **Themes**: Extract core concepts, ideas, or topics (not just plot points)
-- **Characters**: For fiction, list main characters. For non-fiction, list key figures/people mentioned
-- **Setting**: Time period and place. For non-fiction, consider historical/intellectual context
-- **Discussion Questions**: Create open-ended questions that promote deep thinking and analysis
-- **Content Type**: Categorize to help tailor tutoring approach
+        prompt = f"""{TUTORING_PROMPT_HEAD}
 
 ### CONTENT TO ANALYZE{title_context}
 
@@ -352,31 +512,9 @@ Provide the JSON analysis:"""
 
     def _parse_tutoring_result(self, response_text: str) -> TutoringAnalysisResult:
         """Parse tutoring analysis response from Gemini."""
-        import json
-
         try:
-            # Extract JSON from response
-            response_text = response_text.strip()
-
-            if "```json" in response_text:
-                start = response_text.find("```json") + 7
-                end = response_text.find("```", start)
-                json_text = response_text[start:end].strip()
-            elif "```" in response_text:
-                start = response_text.find("```") + 3
-                end = response_text.find("```", start)
-                json_text = response_text[start:end].strip()
-            else:
-                start = response_text.find("{")
-                end = response_text.rfind("}") + 1
-                if start != -1 and end != 0:
-                    json_text = response_text[start:end]
-                else:
-                    raise ValueError("No JSON structure found")
-
-            result_data = json.loads(json_text)
-            return TutoringAnalysisResult(**result_data)
-
+            json_text = self._extract_json_text(response_text)
+            return TutoringAnalysisResult.model_validate_json(json_text)
         except Exception as e:
             logger.warning(f"Failed to parse tutoring analysis JSON: {e}")
             return self._fallback_tutoring_analysis()
@@ -395,6 +533,85 @@ Provide the JSON analysis:"""
             content_type="general",
         )
 
+    async def analyze_for_tutoring_and_lecture(
+        self, content: str, title: str | None = None
+    ) -> tuple[TutoringAnalysisResult, OpeningLectureResult]:
+        """
+        Produce the tutoring analysis and the opening lecture with one Gemini request.
+
+        Both outputs read the same content excerpt, so asking for them together sends the
+        content once instead of twice. Falls back to the separate calls if the combined
+        response cannot be parsed.
+
+        Args:
+            content: The text content to analyze
+            title: Optional title to help with analysis
+
+        Returns:
+            Tuple of (TutoringAnalysisResult, OpeningLectureResult)
+        """
+        if not self.client or not content or len(content.strip()) < 100:
+            # The separate methods already handle these cases with their own fallbacks
+            tutoring = await self.analyze_for_tutoring(content, title)
+            return tutoring, await self.analyze_for_opening_lecture(content, title, tutoring)
+
+        logger.info(f"Analyzing content for tutoring and lecture: {len(content)} characters")
+
+        try:
+            prompt = self._build_tutoring_and_lecture_prompt(content, title)
+            response_text = await self._generate_text(prompt)
+            if not response_text:
+                raise ValueError("Gemini returned empty response")
+
+            result = TutoringAndLectureResult.model_validate_json(
+                self._extract_json_text(response_text)
+            )
+            logger.info(
+                f"Tutoring analysis and opening lecture completed: "
+                f"{len(result.tutoring.themes)} themes, "
+                f"{result.opening_lecture.lecture_duration_minutes} minute lecture"
+            )
+            return result.tutoring, result.opening_lecture
+
+        except Exception as e:
+            logger.warning(f"Combined tutoring request failed, using separate requests: {e}")
+            tutoring = await self.analyze_for_tutoring(content, title)
+            return tutoring, await self.analyze_for_opening_lecture(content, title, tutoring)
+
+    def _build_tutoring_and_lecture_prompt(self, content: str, title: str | None) -> str:
+        """Build one prompt asking for both the tutoring analysis and the opening lecture."""
+
+        title_context = f"\n**Title:** {title}" if title else ""
+
+        analysis_content = _excerpt(content, TUTORING_EXCERPT_CHARS)
+
+        prompt = f"""{TUTORING_AND_LECTURE_PROMPT_HEAD}
+
+### CONTENT TO ANALYZE{title_context}
+
+**Content Length:** {len(content):,} characters
+
+**Content:**
+```
+{analysis_content}
+```
+
+Provide the JSON response:"""
+
+        return prompt
+
+    @staticmethod
+    def _extract_json_text(response_text: str) -> str:
+        """Return the JSON object in a Gemini response, ignoring any fence or prose around it."""
+        # Every response schema is a single object starting at the first "{"
+        start = response_text.find("{")
+        if start == -1:
+            raise ValueError("No JSON structure found in response")
+        end = _find_object_end(response_text, start)
+        if end == -1:
+            raise ValueError("Gemini response was truncated before the JSON object closed")
+        return response_text[start:end]
+
     async def analyze_for_opening_lecture(
         self,
         content: str,
@@ -427,13 +644,13 @@ Provide the JSON analysis:"""
 
         try:
             prompt = self._build_opening_lecture_prompt(content, title, tutoring_analysis)
-            response = self.model.generate_content(prompt)
+            response_text = await self._generate_text(prompt)
 
-            if not response.text:
+            if not response_text:
                 logger.warning("Gemini returned empty response for opening lecture")
                 return self._fallback_opening_lecture(title)
 
-            result = self._parse_opening_lecture_result(response.text)
+            result = self._parse_opening_lecture_result(response_text)
             logger.info(
                 f"Opening lecture generated: {result.lecture_duration_minutes} minutes, {len(result.engagement_questions)} questions"
             )
@@ -461,23 +678,9 @@ Provide the JSON analysis:"""
 - Setting: {tutoring_analysis.setting.get("time", "unknown")} / {tutoring_analysis.setting.get("place", "unknown")}
 """
 
-        # Use first 3000 characters for lecture generation
-        analysis_content = content[:3000]
-        if len(content) > 3000:
-            analysis_content += "\n\n[Content truncated for analysis...]"
+        analysis_content = _excerpt(content, ANALYSIS_EXCERPT_CHARS)
 
-        prompt = f"""### ROLE AND OBJECTIVE
-You are an expert educational content designer and tutor. Your goal is to create an engaging 2-3 minute opening lecture that introduces content to students and prepares them for Socratic dialogue.
-
-### INSTRUCTIONS / RESPONSE RULES
-- Create a warm, welcoming introduction that hooks student interest
-- Provide a clear overview of key concepts without spoiling details
-- Set learning expectations and objectives
-- Generate 3-4 engagement questions to prime student thinking
-- Keep the tone conversational and accessible
-- Aim for 2-3 minutes of speaking time (approximately 300-450 words)
-- DO NOT include detailed analysis or answers - focus on setting up curiosity
-- DO NOT spoil plot points or key revelations if this is narrative content
+        prompt = f"""{OPENING_LECTURE_PROMPT_HEAD}
 
 ### CONTEXT{title_context}
 **Content Length:** {len(content):,} characters{tutoring_context}
@@ -487,72 +690,15 @@ You are an expert educational content designer and tutor. Your goal is to create
 {analysis_content}
 ```
 
-### EXAMPLES
-Example JSON response structure:
-```json
-{{
-    "introduction": "Welcome! Today we're diving into fascinating content that explores...",
-    "key_concepts_overview": "We'll be examining three main areas: first, the concept of...",
-    "learning_objectives": "By the end of our discussion, you'll be able to...",
-    "engagement_questions": ["What do you already know about...?", "How might this relate to...?"],
-    "lecture_duration_minutes": 3,
-    "extension_topics": ["Advanced concept A", "Historical context B"]
-}}
-```
-
-### REASONING STEPS
-Think step by step:
-1. Identify the most compelling hook from the content
-2. Determine 2-3 core concepts that are accessible entry points
-3. Consider what learning outcomes are realistic for a tutoring session
-4. Craft questions that activate prior knowledge and curiosity
-5. Identify natural extension points for deeper exploration
-
-### OUTPUT FORMATTING CONSTRAINTS
-Respond with a JSON object containing exactly these fields:
-```json
-{{
-    "introduction": "string - warm, engaging opening that hooks interest (100-150 words)",
-    "key_concepts_overview": "string - brief overview of main concepts to explore (100-150 words)", 
-    "learning_objectives": "string - what students will gain from the session (50-100 words)",
-    "engagement_questions": ["array of 3-4 open-ended questions to prime thinking"],
-    "lecture_duration_minutes": "integer - estimated speaking time (2-4 minutes)",
-    "extension_topics": ["array of 2-4 topics for deeper exploration if requested"]
-}}
-```
-
-### CONTENT ANALYSIS
-Generate the opening lecture JSON:"""
+{OPENING_LECTURE_PROMPT_TAIL}"""
 
         return prompt
 
     def _parse_opening_lecture_result(self, response_text: str) -> OpeningLectureResult:
         """Parse opening lecture response from Gemini."""
-        import json
-
         try:
-            # Extract JSON from response
-            response_text = response_text.strip()
-
-            if "```json" in response_text:
-                start = response_text.find("```json") + 7
-                end = response_text.find("```", start)
-                json_text = response_text[start:end].strip()
-            elif "```" in response_text:
-                start = response_text.find("```") + 3
-                end = response_text.find("```", start)
-                json_text = response_text[start:end].strip()
-            else:
-                start = response_text.find("{")
-                end = response_text.rfind("}") + 1
-                if start != -1 and end != 0:
-                    json_text = response_text[start:end]
-                else:
-                    raise ValueError("No JSON structure found")
-
-            result_data = json.loads(json_text)
-            return OpeningLectureResult(**result_data)
-
+            json_text = self._extract_json_text(response_text)
+            return OpeningLectureResult.model_validate_json(json_text)
         except Exception as e:
             logger.warning(f"Failed to parse opening lecture JSON: {e}")
             return self._fallback_opening_lecture()
@@ -578,3 +724,9 @@ Generate the opening lecture JSON:"""
                 "Personal connections",
             ],
         )
+
+
+@lru_cache(maxsize=1)
+def get_content_analyzer() -> ContentAnalyzer:
+    """Return the process-wide ContentAnalyzer; it keeps no per-request state."""
+    return ContentAnalyzer()
@@ -1,18 +1,18 @@
 """Unified job processor handling both simple and book jobs."""
 
+import asyncio
 import logging
 from datetime import datetime
 from typing import Any
-from uuid import uuid4
 
 from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from storytime.database import Job, JobStatus, JobStep, StepStatus
+from storytime.database import Job, JobStatus, JobStep, StepStatus, new_id
 from storytime.infrastructure.spaces import SpacesClient
-from storytime.models import JobResponse, JobStepResponse
+from storytime.models import JOB_STEPS_ADAPTER, JobResponse
 from storytime.services.book_analyzer import BookAnalyzer, ChapterInfo
-from storytime.services.content_analyzer import ContentAnalyzer
+from storytime.services.content_analyzer import ContentAnalyzer, get_content_analyzer
 from storytime.services.preprocessing_service import PreprocessingService
 from storytime.services.tts_generator import TTSGenerator
 from storytime.services.vector_store_manager import VectorStoreManager
@@ -20,6 +20,9 @@ from storytime.services.web_scraping import WebScrapingService
 
 logger = logging.getLogger(__name__)
 
+# Chapter text uploads to Spaces in flight at once while splitting a book
+CHAPTER_UPLOAD_CONCURRENCY = 8
+
 
 class JobProcessor:
     """Process both simple text jobs and full book jobs."""
@@ -39,7 +42,7 @@ class JobProcessor:
         self.tts_generator = tts_generator or TTSGenerator()
         self.preprocessing_service = preprocessing_service or PreprocessingService()
         self.web_scraping_service = web_scraping_service or WebScrapingService()
-        self.content_analyzer = content_analyzer or ContentAnalyzer()
+        self.content_analyzer = content_analyzer or get_content_analyzer()
         self.book_analyzer = BookAnalyzer()
         self.vector_store_manager = vector_store_manager
 
@@ -171,7 +174,9 @@ class JobProcessor:
         )
 
         try:
-            chapters = self.book_analyzer.analyze_book(book_text)
+            # Regex scanning a whole book is pure CPU; keep it off the event loop so step
+            # updates and other coroutines on this loop are not stalled behind it
+            chapters = await asyncio.to_thread(self.book_analyzer.analyze_book, book_text)
             await self._update_job_step(
                 analyze_step.id,
                 StepStatus.COMPLETED,
@@ -323,14 +328,19 @@ class JobProcessor:
             )
 
             tutoring_result = None  # Initialize tutoring_result for later use
+            opening_lecture_result = None
             try:
                 await self._update_job_step(
                     tutoring_step.id, StepStatus.RUNNING, started_at=datetime.utcnow()
                 )
 
-                # Run tutoring analysis (grug-brain simple version)
+                # Run tutoring analysis (grug-brain simple version); the opening lecture
+                # comes back from the same Gemini request and is stored in the next step
                 logger.info(f"Running tutoring analysis for job {job.id}")
-                tutoring_result = await self.content_analyzer.analyze_for_tutoring(
+                (
+                    tutoring_result,
+                    opening_lecture_result,
+                ) = await self.content_analyzer.analyze_for_tutoring_and_lecture(
                     text_content, job.title
                 )
 
@@ -387,10 +397,14 @@ class JobProcessor:
                     opening_lecture_step.id, StepStatus.RUNNING, started_at=datetime.utcnow()
                 )
 
-                # Generate opening lecture using tutoring analysis context
-                opening_lecture_result = await self.content_analyzer.analyze_for_opening_lecture(
-                    text_content, job.title, tutoring_result
-                )
+                # Generate opening lecture using tutoring analysis context, unless the
+                # tutoring step already produced it
+                if opening_lecture_result is None:
+                    opening_lecture_result = (
+                        await self.content_analyzer.analyze_for_opening_lecture(
+                            text_content, job.title, tutoring_result
+                        )
+                    )
 
                 # Store opening lecture in job config
                 if not job.config:
@@ -584,8 +598,7 @@ class JobProcessor:
     # Database helper methods
     async def _get_job(self, job_id: str) -> Job | None:
         """Get job by ID."""
-        result = await self.db_session.execute(select(Job).where(Job.id == job_id))
-        return result.scalar_one_or_none()
+        return await self.db_session.get(Job, job_id)
 
     async def _update_job_status(
         self,
@@ -691,8 +704,7 @@ class JobProcessor:
     async def _get_job_response(self, job_id: str) -> JobResponse:
         """Get job with steps as response model."""
         # Get job
-        result = await self.db_session.execute(select(Job).where(Job.id == job_id))
-        job = result.scalar_one_or_none()
+        job = await self.db_session.get(Job, job_id)
 
         if not job:
             raise ValueError(f"Job {job_id} not found")
@@ -703,23 +715,7 @@ class JobProcessor:
         )
         steps = steps_result.scalars().all()
 
-        step_responses = [
-            JobStepResponse(
-                id=step.id,
-                step_name=step.step_name,
-                step_order=step.step_order,
-                status=step.status,
-                progress=step.progress,
-                error_message=step.error_message,
-                step_metadata=step.step_metadata,
-                created_at=step.created_at,
-                updated_at=step.updated_at,
-                started_at=step.started_at,
-                completed_at=step.completed_at,
-                duration=step.duration,
-            )
-            for step in steps
-        ]
+        step_responses = JOB_STEPS_ADAPTER.validate_python(steps, from_attributes=True)
 
         return JobResponse(
             id=job.id,
@@ -763,21 +759,34 @@ class JobProcessor:
     async def _split_and_save_chapters(
         self, job_id: str, book_text: str, chapters: list[ChapterInfo]
     ) -> list[dict[str, Any]]:
-        chapter_files = []
-        for i, chapter in enumerate(chapters):
-            chapter_text = book_text[chapter.start_position : chapter.end_position]
-            chapter_number = chapter.chapter_number or (i + 1)
-            file_key = f"jobs/{job_id}/chapters/chapter_{chapter_number:03d}.txt"
-            await self.spaces_client.upload_text_file(file_key, chapter_text)
-            chapter_files.append(
-                {
-                    "chapter_number": chapter_number,
-                    "title": chapter.title,
-                    "file_key": file_key,
-                    "word_count": chapter.word_count,
-                    "is_special": chapter.is_special,
-                }
+        # The chapter list is final, so build the metadata in one pass and upload the
+        # chapter texts concurrently; gather keeps the uploads aligned with chapter_files
+        chapter_files = [
+            {
+                "chapter_number": chapter.chapter_number or (i + 1),
+                "title": chapter.title,
+                "file_key": (
+                    f"jobs/{job_id}/chapters/chapter_{chapter.chapter_number or (i + 1):03d}.txt"
+                ),
+                "word_count": chapter.word_count,
+                "is_special": chapter.is_special,
+            }
+            for i, chapter in enumerate(chapters)
+        ]
+        semaphore = asyncio.Semaphore(CHAPTER_UPLOAD_CONCURRENCY)
+
+        async def upload(chapter: ChapterInfo, file_key: str) -> None:
+            async with semaphore:
+                await self.spaces_client.upload_text_file(
+                    file_key, book_text[chapter.start_position : chapter.end_position]
+                )
+
+        await asyncio.gather(
+            *(
+                upload(chapter, chapter_file["file_key"])
+                for chapter, chapter_file in zip(chapters, chapter_files, strict=True)
             )
+        )
         return chapter_files
 
     async def _create_chapter_jobs(
@@ -788,7 +797,7 @@ class JobProcessor:
 
         for chapter_file in chapter_files:
             child_job = Job(
-                id=str(uuid4()),
+                id=new_id(),
                 user_id=parent_job.user_id,
                 parent_id=parent_job.id,
                 title=f"{parent_job.title} - {chapter_file['title']}",
@@ -799,6 +808,9 @@ class JobProcessor:
                     "chapter_number": chapter_file["chapter_number"],
                     "voice_config": voice_config,
                     "job_type": "text_to_audio",  # Child jobs are always simple text-to-audio
+                    # The parent already cleaned the whole book in windows that span chapter
+                    # boundaries; a second Gemini pass per chapter would repeat that work
+                    "preprocessing": {"enabled": False},
                 },
                 input_file_key=chapter_file["file_key"],
             )
@@ -807,13 +819,16 @@ class JobProcessor:
 
         await self.db_session.commit()
 
+        from celery import group
+
         from storytime.worker.tasks import process_job
 
-        for child_id in child_job_ids:
-            try:
-                process_job.delay(child_id)
-            except Exception as e:  # pragma: no cover - scheduling may fail in tests
-                logger.warning(f"Could not schedule child job {child_id}: {e}")
+        # One group publishes every chapter over a single broker connection instead of a
+        # round-trip per child job
+        try:
+            group(process_job.s(child_id) for child_id in child_job_ids).apply_async()
+        except Exception as e:  # pragma: no cover - scheduling may fail in tests
+            logger.warning(f"Could not schedule child jobs {child_job_ids}: {e}")
 
         return child_job_ids
 
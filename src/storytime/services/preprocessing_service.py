@@ -1,14 +1,122 @@
 """Text preprocessing service using Google Gemini for TTS content cleanup."""
 
+import asyncio
 import logging
+import re
+from functools import lru_cache
 from typing import Any
 
-from google import genai
+from google.genai import types
 
 from storytime.api.settings import get_settings
+from storytime.infrastructure.gemini import get_gemini_client
+from storytime.infrastructure.llm_cache import LLMCache, get_llm_cache
 
 logger = logging.getLogger(__name__)
 
+# Bump whenever the prompt below or the windowing changes so cached responses are invalidated
+PROMPT_VERSION = 3
+
+# Gemini Flash stops after 8,192 output tokens and the cleaned text is about as long as its
+# input, so text is sent in windows whose output fits that budget (~4 characters per token,
+# with a quarter kept as headroom). A truncated window is halved and retried.
+OUTPUT_TOKEN_BUDGET = 8192
+CHARS_PER_TOKEN = 4
+MAX_WINDOW_CHARS = OUTPUT_TOKEN_BUDGET * CHARS_PER_TOKEN * 3 // 4
+MIN_WINDOW_CHARS = 2000
+
+# A failed window request (e.g. a 429 when several windows run at once) is retried after
+# 2, then 4 seconds; a window that still fails keeps its original text.
+GEMINI_ATTEMPTS = 3
+
+# Preprocessing instructions, sent as the system instruction and split around the
+# option-dependent rules. Each request's user message carries only one window of text.
+PROMPT_HEAD = """### ROLE AND OBJECTIVE
+You are a professional text editor specializing in preparing literary content for audiobook production. Your goal is to clean and optimize text while preserving the author's original intent and narrative flow.
+
+### INSTRUCTIONS / RESPONSE RULES
+- ALWAYS preserve the core literary content and author's voice
+- REMOVE publication metadata, copyright notices, and publisher information
+- REMOVE table of contents, index, and navigation elements
+- REMOVE footnote markers and academic citations (but preserve essential footnote content inline if critical to understanding)
+- REMOVE repetitive headers/footers and page numbers
+- CLEAN UP formatting artifacts like excessive whitespace, random characters, or OCR errors
+- PRESERVE chapter titles, section breaks, and narrative structure
+- PRESERVE dialogue, character names, and essential story elements
+- DO NOT summarize, paraphrase, or change the author's original words
+- DO NOT remove legitimate literary content like epigraphs, dedications, or author's notes that are part of the work"""
+PRESERVE_STRUCTURE_RULE = "\n- MAINTAIN the original chapter structure and literary formatting"
+AGGRESSIVE_CLEANUP_RULE = (
+    "\n- BE MORE AGGRESSIVE in removing potentially irrelevant metadata and formatting"
+)
+PROMPT_TAIL = """
+
+### CONTEXT
+This text will be converted to audio for audiobook production. Listeners should hear only the literary content, not publishing metadata or formatting artifacts.
+
+### REASONING STEPS
+Think step by step:
+1. Identify what type of content this is (novel, non-fiction, etc.)
+2. Scan for publication metadata and formatting artifacts
+3. Preserve the literary structure while removing non-literary elements
+4. Ensure the cleaned text flows naturally for audio narration
+
+### OUTPUT FORMATTING CONSTRAINTS
+Return only the cleaned text content. Do not add explanations, summaries, or metadata about your changes.
+
+### INPUT
+Each message contains one section of the text to process, between ``` fences."""
+
+# The input is fenced, so the model sometimes echoes the fences around its answer; they
+# must not reach TTS. Only a fence at the very start or end of the response is removed.
+RESPONSE_FENCE = re.compile(r"\A\s*```[\w-]*[ \t]*\n?|\n?[ \t]*```\s*\Z")
+
+
+@lru_cache(maxsize=4)
+def _generation_config(
+    preserve_structure: bool, aggressive_cleanup: bool
+) -> types.GenerateContentConfig:
+    """Build the request config holding the instructions; one entry per option combination.
+
+    The instructions stay byte-identical across every window and job, so Gemini can serve
+    them from its implicit prefix cache instead of re-processing them on each request.
+    """
+    parts = [PROMPT_HEAD]
+    if preserve_structure:
+        parts.append(PRESERVE_STRUCTURE_RULE)
+    if aggressive_cleanup:
+        parts.append(AGGRESSIVE_CLEANUP_RULE)
+    parts.append(PROMPT_TAIL)
+    return types.GenerateContentConfig(system_instruction="".join(parts))
+
+
+def _split_windows(text: str, window_chars: int) -> list[str]:
+    """Pack whole paragraphs into windows of at most window_chars characters.
+
+    A paragraph longer than a window is cut at the last whitespace before the limit.
+    """
+    windows: list[str] = []
+    current: list[str] = []
+    current_len = 0
+    for paragraph in text.split("\n\n"):
+        while len(paragraph) > window_chars:
+            cut = paragraph.rfind(" ", 0, window_chars)
+            if cut <= 0:
+                cut = window_chars
+            if current:
+                windows.append("\n\n".join(current))
+                current, current_len = [], 0
+            windows.append(paragraph[:cut])
+            paragraph = paragraph[cut:].lstrip()
+        if current and current_len + 2 + len(paragraph) > window_chars:
+            windows.append("\n\n".join(current))
+            current, current_len = [], 0
+        current_len += len(paragraph) + (2 if current else 0)
+        current.append(paragraph)
+    if current:
+        windows.append("\n\n".join(current))
+    return [window for window in windows if window.strip()]
+
 
 class PreprocessingService:
     """Service for preprocessing text content using Google Gemini before TTS conversion."""
@@ -16,6 +124,8 @@ class PreprocessingService:
     def __init__(self):
         """Initialize the preprocessing service with Google Gemini."""
         settings = get_settings()
+        # Shrinks when a window's output is truncated and stays small for later texts
+        self._window_chars = MAX_WINDOW_CHARS
 
         if not settings.google_api_key:
             logger.warning("GOOGLE_API_KEY not set - preprocessing will be skipped")
@@ -23,7 +133,7 @@ class PreprocessingService:
             return
 
         # Initialize Google Gemini client
-        self.client = genai.Client(api_key=settings.google_api_key)
+        self.client = get_gemini_client(settings.google_api_key)
         self.model_name = "gemini-2.0-flash-exp"  # Using Flash for faster response
         logger.info("Gemini preprocessing service initialized")
 
@@ -57,32 +167,41 @@ class PreprocessingService:
             return text_content
 
         logger.info(f"Starting text preprocessing, input length: {len(text_content)} characters")
-        logger.info(f"First 200 chars of input: {text_content[:200]}...")
+        logger.debug("First 200 chars of input: %.200s...", text_content)
+
+        # Set preprocessing.use_cache to false to force a fresh Gemini call
+        cache = get_llm_cache() if preprocessing_config.get("use_cache", True) else None
+        cache_key = LLMCache.make_key(
+            v=PROMPT_VERSION,
+            model=self.model_name,
+            preserve_structure=preprocessing_config.get("preserve_structure", True),
+            aggressive_cleanup=preprocessing_config.get("aggressive_cleanup", False),
+            text=text_content,
+        )
+        if cache and (cached := await asyncio.to_thread(cache.get, cache_key)) is not None:
+            logger.info(f"Preprocessing cache hit, output length: {len(cached)} characters")
+            return cached
 
         try:
-            # Build the preprocessing prompt
-            prompt = self._build_preprocessing_prompt(text_content, preprocessing_config)
-
-            logger.info("Calling Gemini API for text preprocessing...")
-
-            # Generate response from Gemini
-            response = self.client.models.generate_content(
-                model=self.model_name,
-                contents=prompt
+            cleaned_text, complete = await self._preprocess_windows(
+                text_content, preprocessing_config
             )
-
-            if not response.text:
+            if not cleaned_text:
                 logger.warning("Gemini returned empty response, using original text")
                 return text_content
 
-            cleaned_text = response.text.strip()
-
             logger.info(
                 f"Text preprocessing completed successfully: "
                 f"{len(text_content)} -> {len(cleaned_text)} characters "
                 f"(removed {len(text_content) - len(cleaned_text)} chars, {((len(text_content) - len(cleaned_text)) / len(text_content) * 100):.1f}%)"
             )
-            logger.info(f"First 200 chars of output: {cleaned_text[:200]}...")
+            logger.debug("First 200 chars of output: %.200s...", cleaned_text)
+
+            # A window that kept its original text would otherwise be replayed as cleaned
+            if cache and complete:
+                await asyncio.to_thread(cache.set, cache_key, cleaned_text)
+            elif cache:
+                logger.info("Not caching preprocessing result: some windows were not cleaned")
 
             return cleaned_text
 
@@ -91,58 +210,97 @@ class PreprocessingService:
             logger.info("Falling back to original text content")
             return text_content
 
-    def _build_preprocessing_prompt(self, text_content: str, config: dict[str, Any]) -> str:
-        """Build the preprocessing prompt for Gemini."""
-
-        # Extract configuration options
-        preserve_structure = config.get("preserve_structure", True)
-        aggressive_cleanup = config.get("aggressive_cleanup", False)
-
-        # Build the prompt following best practices
-        prompt = """### ROLE AND OBJECTIVE
-You are a professional text editor specializing in preparing literary content for audiobook production. Your goal is to clean and optimize text while preserving the author's original intent and narrative flow.
-
-### INSTRUCTIONS / RESPONSE RULES
-- ALWAYS preserve the core literary content and author's voice
-- REMOVE publication metadata, copyright notices, and publisher information
-- REMOVE table of contents, index, and navigation elements
-- REMOVE footnote markers and academic citations (but preserve essential footnote content inline if critical to understanding)
-- REMOVE repetitive headers/footers and page numbers
-- CLEAN UP formatting artifacts like excessive whitespace, random characters, or OCR errors
-- PRESERVE chapter titles, section breaks, and narrative structure
-- PRESERVE dialogue, character names, and essential story elements
-- DO NOT summarize, paraphrase, or change the author's original words
-- DO NOT remove legitimate literary content like epigraphs, dedications, or author's notes that are part of the work"""
-
-        if preserve_structure:
-            prompt += "\n- MAINTAIN the original chapter structure and literary formatting"
+    async def _preprocess_windows(
+        self, text_content: str, config: dict[str, Any]
+    ) -> tuple[str, bool]:
+        """Clean the text in concurrent windows, halving a window's size on truncation.
 
-        if aggressive_cleanup:
-            prompt += (
-                "\n- BE MORE AGGRESSIVE in removing potentially irrelevant metadata and formatting"
-            )
-
-        prompt += f"""
-
-### CONTEXT
-This text will be converted to audio for audiobook production. Listeners should hear only the literary content, not publishing metadata or formatting artifacts.
-
-### REASONING STEPS
-Think step by step:
-1. Identify what type of content this is (novel, non-fiction, etc.)
-2. Scan for publication metadata and formatting artifacts
-3. Preserve the literary structure while removing non-literary elements
-4. Ensure the cleaned text flows naturally for audio narration
-
-### OUTPUT FORMATTING CONSTRAINTS
-Return only the cleaned text content. Do not add explanations, summaries, or metadata about your changes.
-
-### TEXT TO PROCESS
-```
-{text_content}
-```"""
-
-        return prompt
+        Returns the text and whether every window was cleaned; a window that was not keeps
+        its original text.
+        """
+        semaphore = asyncio.Semaphore(get_settings().gemini_max_concurrency)
+        fallbacks = 0
+
+        async def clean(window: str) -> str:
+            nonlocal fallbacks
+            try:
+                text, truncated = await self._generate_with_retry(window, config, semaphore)
+            except Exception as e:
+                # Keep the windows that did clean instead of failing the whole text
+                logger.error(f"Preprocessing failed for a {len(window)} character window: {e}")
+                fallbacks += 1
+                return window
+
+            if truncated and len(window) > MIN_WINDOW_CHARS:
+                window_chars = max(MIN_WINDOW_CHARS, len(window) // 2)
+                self._window_chars = min(self._window_chars, window_chars)
+                logger.warning(
+                    f"Preprocessing output truncated for a {len(window)} character window, "
+                    f"retrying in windows of {window_chars}"
+                )
+                sub_windows = _split_windows(window, window_chars)
+                return "\n\n".join(await asyncio.gather(*(clean(w) for w in sub_windows)))
+
+            if truncated or not text:
+                # Never drop narration: keep this window as it was
+                logger.warning(f"Keeping original text for a {len(window)} character window")
+                fallbacks += 1
+                return window
+            return text
+
+        windows = _split_windows(text_content, self._window_chars)
+        logger.info(f"Calling Gemini API for text preprocessing ({len(windows)} windows)...")
+        # gather returns results in window order regardless of completion order
+        cleaned_text = "\n\n".join(await asyncio.gather(*(clean(w) for w in windows)))
+        return cleaned_text, fallbacks == 0
+
+    async def _generate_with_retry(
+        self, window: str, config: dict[str, Any], semaphore: asyncio.Semaphore
+    ) -> tuple[str, bool]:
+        """Call _generate_cleaned_text, retrying failures with exponential backoff."""
+        for attempt in range(1, GEMINI_ATTEMPTS):
+            try:
+                async with semaphore:
+                    return await self._generate_cleaned_text(window, config)
+            except Exception as e:
+                wait_time = 2**attempt  # 2, 4 seconds
+                logger.warning(
+                    f"Preprocessing window failed (attempt {attempt}/{GEMINI_ATTEMPTS}), "
+                    f"retrying in {wait_time}s: {e}"
+                )
+                # Back off outside the semaphore so other windows can use the slot
+                await asyncio.sleep(wait_time)
+        async with semaphore:
+            return await self._generate_cleaned_text(window, config)
+
+    async def _generate_cleaned_text(self, window: str, config: dict[str, Any]) -> tuple[str, bool]:
+        """Stream Gemini's cleanup of one window; return the text and whether it was truncated."""
+        # Stream the response: the cleaned text is about as long as the input, so reading
+        # it as it is generated keeps the event loop free and avoids one long idle wait
+        parts: list[str] = []
+        finish_reason = None
+        prompt, generation_config = self._build_preprocessing_request(window, config)
+        stream = await self.client.aio.models.generate_content_stream(
+            model=self.model_name, contents=prompt, config=generation_config
+        )
+        async for chunk in stream:
+            if chunk.text:
+                parts.append(chunk.text)
+            if chunk.candidates and chunk.candidates[0].finish_reason:
+                finish_reason = chunk.candidates[0].finish_reason
+
+        cleaned_text = RESPONSE_FENCE.sub("", "".join(parts), count=2).strip()
+        return cleaned_text, finish_reason == types.FinishReason.MAX_TOKENS
+
+    def _build_preprocessing_request(
+        self, text_content: str, config: dict[str, Any]
+    ) -> tuple[str, types.GenerateContentConfig]:
+        """Build the per-window prompt and the shared config carrying the instructions."""
+        generation_config = _generation_config(
+            bool(config.get("preserve_structure", True)),
+            bool(config.get("aggressive_cleanup", False)),
+        )
+        return f"### TEXT TO PROCESS\n```\n{text_content}\n```", generation_config
 
     def is_available(self) -> bool:
         """Check if the preprocessing service is available."""
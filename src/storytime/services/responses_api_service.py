@@ -84,12 +84,15 @@ class ResponsesAPIVectorStoreService:
             # Get job information for context
             from sqlalchemy import select
 
-            from storytime.database import Job
-
-            result = await self.db_session.execute(
-                select(Job).where(Job.id == job_id, Job.user_id == user_id)
-            )
-            job = result.scalar_one_or_none()
+            from storytime.database import Job, is_valid_id
+
+            # A malformed id cannot match any job
+            job = None
+            if is_valid_id(job_id):
+                result = await self.db_session.execute(
+                    select(Job).where(Job.id == job_id, Job.user_id == user_id)
+                )
+                job = result.scalar_one_or_none()
 
             if not job:
                 return {"success": False, "error": "Job not found or access denied", "answer": ""}
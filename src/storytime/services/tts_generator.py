@@ -1,12 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
+import re
 import tempfile
 
-from dotenv import load_dotenv
 from pydub import AudioSegment
 
+from storytime.env import ensure_env
+
 # Provider imports are now from the new infrastructure paths
 from storytime.infrastructure.tts import (  # __init__ re-exports these
     ElevenLabsProvider,
@@ -18,9 +21,21 @@ from storytime.infrastructure.voice_utils import get_voices
 
 # Simplified for single-voice TTS only
 
-load_dotenv()
+ensure_env()
 logger = logging.getLogger(__name__)
 
+# Upper bound on concurrent TTS API calls for one chunked text; keep under the provider's rate limit
+TTS_MAX_CONCURRENCY = int(os.getenv("TTS_MAX_CONCURRENCY", "4"))
+
+# Paragraph breaks, and sentence ends: whitespace after . ! or ? (optionally closed by a quote
+# or bracket) that precedes a capital, quote or bracket, so "e.g. this", decimals and common
+# honorifics stay intact; punctuation stays attached to its sentence
+PARAGRAPH_SPLIT = re.compile(r"\n\s*\n")
+SENTENCE_SPLIT = re.compile(
+    r"(?:(?<=[.!?])|(?<=[.!?][\"')\]]))(?<!\bMr\.)(?<!\bMrs\.)(?<!\bMs\.)(?<!\bDr\.)(?<!\bSt\.)"
+    r"\s+(?=[A-Z\"'(\[])"
+)
+
 
 class TTSGenerator:
     """Simple TTS generator for single-voice text-to-audio conversion."""
@@ -34,8 +49,8 @@ class TTSGenerator:
         self.provider: TTSProvider = provider
         self.provider_name: str = getattr(provider, "name", "openai")
 
-        # Cache voices for simple voice selection
-        self._voices: list[Voice] = get_voices(self.provider)
+        # Cache voices for simple voice selection, indexed by ID for membership checks
+        self._voices: dict[str, Voice] = {voice.id: voice for voice in get_voices(self.provider)}
 
     async def generate_simple_audio(
         self, text: str, voice_config: dict[str, any] | None = None
@@ -47,6 +62,8 @@ class TTSGenerator:
         voice_id = voice_config.get("voice_id")
         if not voice_id:
             voice_id = "alloy"  # Default to alloy voice for simplicity
+        if voice_id not in self._voices:
+            logger.warning(f"Voice '{voice_id}' is not listed by {self.provider_name}")
 
         # Check if text needs chunking (OpenAI has 4096 char limit)
         max_chars = self._get_provider_char_limit()
@@ -70,7 +87,9 @@ class TTSGenerator:
     async def _generate_single_chunk(self, text: str, voice_id: str) -> bytes:
         """Generate audio for a single text chunk."""
         with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp_file:
-            self.provider.synth(
+            # Provider SDKs are blocking; run them off the event loop
+            await asyncio.to_thread(
+                self.provider.synth,
                 text=text,
                 voice=voice_id,
                 style="Generate clear, natural speech suitable for audiobook narration with appropriate pacing and expression.",
@@ -92,63 +111,50 @@ class TTSGenerator:
         chunks = self._chunk_text(text, max_chars)
         logger.info(f"Split text into {len(chunks)} chunks for TTS processing")
 
+        # Identical chunks (refrains, repeated epigraphs) are synthesized once and their
+        # audio file reused; unique_chunks maps each distinct chunk to its temp file index
+        unique_chunks: dict[str, int] = {}
+        for chunk in chunks:
+            unique_chunks.setdefault(chunk, len(unique_chunks))
+        if len(unique_chunks) < len(chunks):
+            logger.info(f"Reusing audio for {len(chunks) - len(unique_chunks)} repeated chunks")
+
         # Use file-based concatenation to avoid loading all segments in memory
         temp_files = []
+        semaphore = asyncio.Semaphore(TTS_MAX_CONCURRENCY)
 
-        try:
-            # Generate audio chunks and save to temporary files
-            for i, chunk in enumerate(chunks):
-                logger.debug(f"Processing chunk {i + 1}/{len(chunks)} ({len(chunk)} chars)")
+        async def synth_chunk(i: int, chunk: str) -> None:
+            async with semaphore:
+                logger.debug(
+                    "Processing chunk %d/%d (%d chars)", i + 1, len(unique_chunks), len(chunk)
+                )
                 chunk_audio = await self._generate_single_chunk(chunk, voice_id)
+            with open(temp_files[i], "wb") as f:
+                f.write(chunk_audio)
 
-                # Save chunk to temporary file
-                tmp_file = tempfile.NamedTemporaryFile(suffix=".mp3", delete=False)
-                tmp_file.write(chunk_audio)
-                tmp_file.flush()
-                tmp_file.close()
-                temp_files.append(tmp_file.name)
+        try:
+            # Reserve paths up front so segment order matches chunk order
+            for _ in unique_chunks:
+                with tempfile.NamedTemporaryFile(suffix=".mp3", delete=False) as tmp_file:
+                    temp_files.append(tmp_file.name)
+
+            # Chunks are independent API calls, so synthesize them concurrently. Wait for all
+            # of them before raising so none is still writing when the temp files are removed.
+            results = await asyncio.gather(
+                *(synth_chunk(i, chunk) for chunk, i in unique_chunks.items()),
+                return_exceptions=True,
+            )
+            for result in results:
+                if isinstance(result, BaseException):
+                    raise result
 
-            # Memory-efficient concatenation using file operations
+            # Memory-efficient concatenation using file operations. Decoding and re-encoding
+            # MP3 is CPU-bound, so it runs in a worker thread instead of stalling the loop.
+            segment_files = [temp_files[unique_chunks[chunk]] for chunk in chunks]
             logger.info(
-                f"Concatenating {len(temp_files)} audio segments using memory-efficient method"
+                f"Concatenating {len(segment_files)} audio segments using memory-efficient method"
             )
-
-            # Create output file
-            output_file = tempfile.NamedTemporaryFile(suffix=".mp3", delete=False)
-            output_file.close()
-
-            # Load and concatenate one segment at a time
-            combined_audio = None
-            for i, temp_file_path in enumerate(temp_files):
-                logger.debug(f"Loading segment {i + 1}/{len(temp_files)}")
-                segment = AudioSegment.from_mp3(temp_file_path)
-
-                if combined_audio is None:
-                    combined_audio = segment
-                else:
-                    combined_audio += segment
-
-                # Free memory by deleting the segment reference
-                del segment
-
-                # For very large files, save intermediate results to disk
-                if i > 0 and i % 10 == 0:
-                    logger.debug(f"Saving intermediate result after {i + 1} segments")
-                    combined_audio.export(output_file.name, format="mp3")
-                    # Reload to free memory
-                    combined_audio = AudioSegment.from_mp3(output_file.name)
-
-            # Export final result
-            combined_audio.export(output_file.name, format="mp3")
-
-            # Read the final result
-            with open(output_file.name, "rb") as f:
-                result = f.read()
-
-            # Clean up output file
-            os.unlink(output_file.name)
-
-            return result
+            return await asyncio.to_thread(self._concatenate_segments, segment_files)
 
         finally:
             # Clean up all temporary files
@@ -159,74 +165,118 @@ class TTSGenerator:
                 except Exception as e:
                     logger.warning(f"Failed to delete temp file {temp_file_path}: {e}")
 
+    @staticmethod
+    def _concatenate_segments(segment_files: list[str]) -> bytes:
+        """Join MP3 segment files in order and return the encoded result."""
+        # Create output file
+        output_file = tempfile.NamedTemporaryFile(suffix=".mp3", delete=False)
+        output_file.close()
+
+        # Load and concatenate one segment at a time
+        combined_audio = None
+        for i, temp_file_path in enumerate(segment_files):
+            logger.debug("Loading segment %d/%d", i + 1, len(segment_files))
+            segment = AudioSegment.from_mp3(temp_file_path)
+
+            if combined_audio is None:
+                combined_audio = segment
+            else:
+                combined_audio += segment
+
+            # Free memory by deleting the segment reference
+            del segment
+
+            # For very large files, save intermediate results to disk
+            if i > 0 and i % 10 == 0:
+                logger.debug("Saving intermediate result after %d segments", i + 1)
+                combined_audio.export(output_file.name, format="mp3")
+                # Reload to free memory
+                combined_audio = AudioSegment.from_mp3(output_file.name)
+
+        # Export final result
+        combined_audio.export(output_file.name, format="mp3")
+
+        # Read the final result
+        with open(output_file.name, "rb") as f:
+            result = f.read()
+
+        # Clean up output file
+        os.unlink(output_file.name)
+
+        return result
+
     def _chunk_text(self, text: str, max_chars: int) -> list[str]:
         """Split text into chunks that respect sentence boundaries when possible."""
         if len(text) <= max_chars:
             return [text]
 
         chunks = []
-        current_chunk = ""
-
-        # Split on sentences first
-        sentences = text.replace("\n\n", " [PARAGRAPH] ").split(". ")
-
-        for sentence in sentences:
-            sentence = sentence.strip()
-            if not sentence:
-                continue
-
-            # Restore paragraph breaks
-            sentence = sentence.replace("[PARAGRAPH]", "\n\n")
-
-            # Add period back if it was removed (except for last sentence)
-            if (
-                not sentence.endswith(".")
-                and not sentence.endswith("!")
-                and not sentence.endswith("?")
-            ):
-                sentence += "."
+        # Build each chunk as a list of sentences with a running length instead of
+        # re-copying the chunk string to test every sentence against the limit
+        current_parts: list[str] = []
+        current_len = 0
 
+        for sentence in self._split_sentences(text):
             # Check if adding this sentence would exceed the limit
-            test_chunk = current_chunk + (" " if current_chunk else "") + sentence
+            test_len = current_len + (1 if current_parts else 0) + len(sentence)
 
-            if len(test_chunk) <= max_chars:
-                current_chunk = test_chunk
+            if test_len <= max_chars:
+                current_parts.append(sentence)
+                current_len = test_len
             else:
                 # Current chunk is full, start a new one
-                if current_chunk:
-                    chunks.append(current_chunk.strip())
+                if current_parts:
+                    chunks.append(" ".join(current_parts).strip())
 
                 # If single sentence is too long, split it further
                 if len(sentence) > max_chars:
                     word_chunks = self._chunk_by_words(sentence, max_chars)
                     chunks.extend(word_chunks[:-1])  # Add all but the last
-                    current_chunk = word_chunks[-1]  # Start new chunk with last part
-                else:
-                    current_chunk = sentence
+                    sentence = word_chunks[-1]  # Start new chunk with last part
+                current_parts = [sentence]
+                current_len = len(sentence)
 
         # Add the final chunk
-        if current_chunk:
-            chunks.append(current_chunk.strip())
+        if current_parts:
+            chunks.append(" ".join(current_parts).strip())
 
         return chunks
 
+    @staticmethod
+    def _split_sentences(text: str) -> list[str]:
+        """Split text into sentences; each paragraph after the first starts with a break."""
+        sentences = []
+        for paragraph in PARAGRAPH_SPLIT.split(text):
+            paragraph = paragraph.strip()
+            if not paragraph:
+                continue
+            paragraph_sentences = SENTENCE_SPLIT.split(paragraph)
+            if sentences:
+                # Keep the paragraph break for narration pacing; stripped at chunk edges
+                paragraph_sentences[0] = "\n\n" + paragraph_sentences[0]
+            sentences.extend(paragraph_sentences)
+        return sentences
+
     def _chunk_by_words(self, text: str, max_chars: int) -> list[str]:
         """Split text by words when sentence-based chunking isn't sufficient."""
         words = text.split()
         chunks = []
-        current_chunk = ""
+        current_words: list[str] = []
+        current_len = 0
 
         for word in words:
-            test_chunk = current_chunk + (" " if current_chunk else "") + word
+            test_len = current_len + (1 if current_words else 0) + len(word)
 
-            if len(test_chunk) <= max_chars:
-                current_chunk = test_chunk
+            if test_len <= max_chars:
+                current_words.append(word)
+                current_len = test_len
             else:
-                if current_chunk:
-                    chunks.append(current_chunk)
-                current_chunk = word
+                if current_words:
+                    chunks.append(" ".join(current_words))
+                current_words = [word]
+                current_len = len(word)
 
-        if current_chunk:
-            chunks.append(current_chunk)
+        if current_words:
+            chunks.append(" ".join(current_words))
 
         return chunks
@@ -4,10 +4,10 @@ import logging
 from datetime import datetime
 
 from openai import OpenAI
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from storytime.database import Job, User, UserVectorStore, VectorStoreFile
+from storytime.database import Job, User, VectorStoreFile
 
 logger = logging.getLogger(__name__)
 
@@ -19,52 +19,51 @@ class VectorStoreManager:
         self.openai_client = openai_client
         self.db_session = db_session
 
-    async def get_or_create_user_vector_store(self, user_id: str) -> UserVectorStore:
-        """Get existing or create new vector store for user."""
+    async def get_or_create_user_vector_store(self, user_id: str) -> str:
+        """Get existing or create new vector store for user; return its OpenAI ID."""
         # Check if user already has a vector store
-        result = await self.db_session.execute(
-            select(UserVectorStore).where(UserVectorStore.user_id == user_id)
-        )
-        user_vector_store = result.scalar_one_or_none()
+        user = await self.db_session.get(User, user_id)
+        if user is None:
+            raise ValueError(f"User {user_id} not found")
 
-        if user_vector_store:
+        if user.openai_vector_store_id:
             logger.info(
-                f"Found existing vector store for user {user_id}: {user_vector_store.openai_vector_store_id}"
+                f"Found existing vector store for user {user_id}: {user.openai_vector_store_id}"
             )
-            return user_vector_store
+            return user.openai_vector_store_id
 
         # Create new vector store in OpenAI
         logger.info(f"Creating new vector store for user {user_id}")
-
-        # Get user info for naming
-        user_result = await self.db_session.execute(select(User).where(User.id == user_id))
-        user = user_result.scalar_one()
-
-        # Create vector store in OpenAI
         vector_store = self.openai_client.vector_stores.create(
             name=f"Storytime Library - {user.email}",
             metadata={"user_id": user_id, "created_by": "storytime"},
         )
 
-        # Save to database
-        user_vector_store = UserVectorStore(
-            user_id=user_id,
-            openai_vector_store_id=vector_store.id,
-            created_at=datetime.utcnow(),
-            updated_at=datetime.utcnow(),
+        # Save to database unless a concurrent job got there first
+        result = await self.db_session.execute(
+            update(User)
+            .where(User.id == user_id, User.openai_vector_store_id.is_(None))
+            .values(openai_vector_store_id=vector_store.id)
         )
-
-        self.db_session.add(user_vector_store)
         await self.db_session.commit()
-        await self.db_session.refresh(user_vector_store)
 
+        if result.rowcount == 0:
+            await self.db_session.refresh(user)
+            logger.info(
+                f"User {user_id} already has vector store {user.openai_vector_store_id}; "
+                f"deleting duplicate {vector_store.id}"
+            )
+            self.openai_client.vector_stores.delete(vector_store.id)
+            return user.openai_vector_store_id
+
+        await self.db_session.refresh(user)
         logger.info(f"Created vector store for user {user_id}: {vector_store.id}")
-        return user_vector_store
+        return vector_store.id
 
     async def upload_job_content(self, user_id: str, job: Job, content: str) -> VectorStoreFile:
         """Upload job content to user's vector store."""
         # Get or create user's vector store
-        user_vector_store = await self.get_or_create_user_vector_store(user_id)
+        vector_store_id = await self.get_or_create_user_vector_store(user_id)
 
         # Check if job content is already uploaded
         result = await self.db_session.execute(
@@ -91,7 +90,7 @@ class VectorStoreManager:
 
         # Add file to vector store
         self.openai_client.vector_stores.files.create(
-            vector_store_id=user_vector_store.openai_vector_store_id, file_id=file.id
+            vector_store_id=vector_store_id, file_id=file.id
         )
 
         # Create file metadata
@@ -106,7 +105,7 @@ class VectorStoreManager:
 
         # Save to database
         vector_store_file = VectorStoreFile(
-            user_vector_store_id=user_vector_store.id,
+            user_id=user_id,
             job_id=job.id,
             openai_file_id=file.id,
             file_metadata=file_metadata,
@@ -127,14 +126,14 @@ class VectorStoreManager:
     async def get_user_vector_store_id(self, user_id: str) -> str | None:
         """Get user's OpenAI vector store ID."""
         result = await self.db_session.execute(
-            select(UserVectorStore.openai_vector_store_id).where(UserVectorStore.user_id == user_id)
+            select(User.openai_vector_store_id).where(User.id == user_id)
         )
         return result.scalar_one_or_none()
 
     async def get_job_files_in_vector_store(self, user_id: str) -> list[VectorStoreFile]:
         """Get all files for a user's vector store."""
         result = await self.db_session.execute(
-            select(VectorStoreFile).join(UserVectorStore).where(UserVectorStore.user_id == user_id)
+            select(VectorStoreFile).where(VectorStoreFile.user_id == user_id)
         )
         return result.scalars().all()
 
@@ -8,9 +8,10 @@ from typing import Any, Dict, Optional
 from io import BytesIO
 
 from playwright.async_api import async_playwright, Page
-from google import genai
 from google.genai import types
 
+from storytime.infrastructure.gemini import get_gemini_client
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,7 +25,7 @@ class WebScrapingService:
             raise ValueError("GOOGLE_API_KEY environment variable is required for web scraping")
 
         # Initialize Gemini client
-        self.client = genai.Client(api_key=self.google_api_key)
+        self.client = get_gemini_client(self.google_api_key)
 
         # Configuration
         self.timeout = int(os.getenv("SCRAPING_TIMEOUT", 30))
@@ -322,8 +323,9 @@ class WebScrapingService:
                         logger.info(f"Batch {batch_num} retry {attempt} after {wait_time}s delay")
                         await asyncio.sleep(wait_time)
 
-                    # Call Gemini Flash for this batch
-                    response = self.client.models.generate_content(
+                    # Call Gemini Flash for this batch; the async client lets the
+                    # semaphore-bounded batches actually overlap
+                    response = await self.client.aio.models.generate_content(
                         model=self.model,
                         contents=contents,
                     )
@@ -393,11 +395,11 @@ class WebScrapingService:
         word_count = len(content.split())
 
         if char_count < self.min_chars:
-            logger.debug(f"Content too short: {char_count} chars (min: {self.min_chars})")
+            logger.debug("Content too short: %d chars (min: %d)", char_count, self.min_chars)
             return False
 
         if word_count < self.min_words:
-            logger.debug(f"Too few words: {word_count} words (min: {self.min_words})")
+            logger.debug("Too few words: %d words (min: %d)", word_count, self.min_words)
             return False
 
         # Check for truncation indicators
@@ -411,7 +413,7 @@ class WebScrapingService:
         content_lower = content.lower()
         for indicator in truncation_indicators:
             if indicator.lower() in content_lower[-500:]:  # Check last 500 chars
-                logger.debug(f"Content appears truncated (found: {indicator})")
+                logger.debug("Content appears truncated (found: %s)", indicator)
                 return False
 
         return True
@@ -4,11 +4,14 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
+import logging
 from collections.abc import AsyncIterator
 from typing import Any
 
 import httpx
+import orjson
+
+logger = logging.getLogger(__name__)
 
 
 class MCPClient:
@@ -52,12 +55,12 @@ class MCPClient:
                         elif current_event == "message":
                             # This is a JSON-RPC message
                             try:
-                                payload = json.loads(data)
+                                payload = orjson.loads(data)
                                 await self._message_queue.put(payload)
-                            except json.JSONDecodeError:
+                            except orjson.JSONDecodeError:
                                 continue
             except Exception as e:
-                print(f"SSE listening error: {e}")
+                logger.warning("SSE listening error: %s", e)
 
         self._sse_task = asyncio.create_task(_listen())
 
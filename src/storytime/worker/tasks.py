@@ -1,11 +1,10 @@
 import asyncio
 import logging
 
-from openai import OpenAI
-
 from storytime.api.settings import get_settings
 from storytime.database import AsyncSessionLocal
-from storytime.infrastructure.spaces import SpacesClient
+from storytime.infrastructure.openai_client import get_openai_client
+from storytime.infrastructure.spaces import get_spaces_client
 from storytime.services.job_processor import JobProcessor
 from storytime.services.vector_store_manager import VectorStoreManager
 
@@ -32,13 +31,13 @@ async def _process_job_async(self, job_id):
     async with AsyncSessionLocal() as session:
         try:
             # Create job processor with vector store manager
-            spaces_client = SpacesClient()
+            spaces_client = get_spaces_client()
 
             # Get settings and create vector store manager if OpenAI key is available
             settings = get_settings()
             vector_store_manager = None
             if settings.openai_api_key:
-                openai_client = OpenAI(api_key=settings.openai_api_key)
+                openai_client = get_openai_client(settings.openai_api_key)
                 vector_store_manager = VectorStoreManager(openai_client, session)
             else:
                 logging.warning(
@@ -1,13 +1,27 @@
 #!/usr/bin/env python3
 """Test the new web scraping implementation."""
 
-import requests
+import importlib.util
+import logging
 import json
 import time
+from pathlib import Path
+
+import httpx
+import jwt
+
+logging.basicConfig(level=logging.INFO, format="%(message)s")
+logger = logging.getLogger("test_scraping")
 
 # API endpoint
 BASE_URL = "http://localhost:8000"
 
+# One keep-alive connection for the login, submit and every status poll; multiplexed
+# over HTTP/2 when the optional h2 package is installed and the server supports it
+session = httpx.Client(
+    base_url=BASE_URL, http2=importlib.util.find_spec("h2") is not None, timeout=30.0
+)
+
 # Test article URL (use the one that was previously failing)
 TEST_URL = "https://www.newyorker.com/magazine/2025/09/30/the-self-driving-car-wars"
 
@@ -17,80 +31,103 @@ login_data = {
     "password": "testpass123"  # Replace with your test password
 }
 
-print("Logging in...")
-login_response = requests.post(
-    f"{BASE_URL}/api/v1/auth/login",
-    json=login_data
-)
-
-if login_response.status_code != 200:
-    print(f"Login failed: {login_response.status_code}")
-    print(login_response.text)
-    exit(1)
+# Cached token from a previous run, reused while it is valid for at least another minute
+TOKEN_CACHE = Path(".test_token")
+
+
+def load_cached_token():
+    try:
+        cached = json.loads(TOKEN_CACHE.read_text())
+    except (OSError, ValueError):
+        return None
+    if (cached.get("base_url"), cached.get("email")) != (BASE_URL, login_data["email"]):
+        return None
+    if cached.get("exp", 0) <= time.time() + 60:
+        return None
+    return cached["token"]
+
+
+token = load_cached_token()
+if token:
+    logger.info("Using cached token")
+else:
+    logger.info("Logging in...")
+    login_response = session.post(
+        "/api/v1/auth/login",
+        json=login_data
+    )
 
-auth_data = login_response.json()
-token = auth_data["access_token"]
-headers = {"Authorization": f"Bearer {token}"}
+    if login_response.status_code != 200:
+        logger.error("Login failed: %s\n%s", login_response.status_code, login_response.text)
+        exit(1)
+
+    auth_data = login_response.json()
+    token = auth_data["access_token"]
+    exp = jwt.decode(token, options={"verify_signature": False})["exp"]
+    TOKEN_CACHE.write_text(
+        json.dumps(
+            {"base_url": BASE_URL, "email": login_data["email"], "token": token, "exp": exp}
+        )
+    )
+    logger.info("Logged in successfully")
 
-print(f"Logged in successfully")
+session.headers["Authorization"] = f"Bearer {token}"
 
 # Submit web scraping job
-print(f"\nSubmitting web scraping job for: {TEST_URL}")
+logger.info(f"\nSubmitting web scraping job for: {TEST_URL}")
 job_data = {
     "url": TEST_URL,
     "tts_provider": "openai",
     "voice": "alloy"
 }
 
-job_response = requests.post(
-    f"{BASE_URL}/api/v1/jobs/url",
-    json=job_data,
-    headers=headers
+job_response = session.post(
+    "/api/v1/jobs/url",
+    json=job_data
 )
 
 if job_response.status_code != 200:
-    print(f"Job submission failed: {job_response.status_code}")
-    print(job_response.text)
+    logger.error("Job submission failed: %s\n%s", job_response.status_code, job_response.text)
     exit(1)
 
 job = job_response.json()
 job_id = job["job_id"]
-print(f"Job submitted successfully: {job_id}")
+logger.info(f"Job submitted successfully: {job_id}")
 
 # Monitor job status
-print("\nMonitoring job progress...")
+logger.info("\nMonitoring job progress...")
 while True:
-    status_response = requests.get(
-        f"{BASE_URL}/api/v1/jobs/{job_id}",
-        headers=headers
-    )
+    status_response = session.get(f"/api/v1/jobs/{job_id}")
 
     if status_response.status_code != 200:
-        print(f"Failed to get job status: {status_response.status_code}")
+        logger.error(f"Failed to get job status: {status_response.status_code}")
         break
 
     job_status = status_response.json()
     current_status = job_status["status"]
     current_step = job_status.get("current_step", "")
 
-    print(f"Status: {current_status} - Step: {current_step}")
+    logger.info(f"Status: {current_status} - Step: {current_step}")
 
     if current_status in ["completed", "failed"]:
         if current_status == "completed":
-            print(f"\n✅ Job completed successfully!")
-            print(f"Character count: {job_status.get('metadata', {}).get('character_count', 'N/A')}")
-            print(f"Estimated words: {job_status.get('metadata', {}).get('estimated_words', 'N/A')}")
-            print(f"Total duration: {job_status.get('metadata', {}).get('total_duration', 'N/A')} seconds")
+            metadata = job_status.get('metadata', {})
+            logger.info(
+                "\n✅ Job completed successfully!\n"
+                "Character count: %s\nEstimated words: %s\nTotal duration: %s seconds",
+                metadata.get('character_count', 'N/A'),
+                metadata.get('estimated_words', 'N/A'),
+                metadata.get('total_duration', 'N/A'),
+            )
 
             # Check if we got substantial content (should be ~10,000+ words for a 57 min article)
-            word_count = job_status.get('metadata', {}).get('estimated_words', 0)
+            word_count = metadata.get('estimated_words', 0)
             if word_count > 5000:
-                print(f"\n🎉 SUCCESS: Extracted {word_count} words (expected for long article)")
+                logger.info(f"\n🎉 SUCCESS: Extracted {word_count} words (expected for long article)")
             else:
-                print(f"\n⚠️  WARNING: Only extracted {word_count} words (expected much more)")
+                logger.warning(f"\n⚠️  WARNING: Only extracted {word_count} words (expected much more)")
         else:
-            print(f"\n❌ Job failed!")
-            print(f"Error: {job_status.get('error', 'Unknown error')}")
+            logger.error("\n❌ Job failed!\nError: %s", job_status.get('error', 'Unknown error'))
         break
 
     time.sleep(2)
\ No newline at end of file
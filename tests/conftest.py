@@ -0,0 +1,7 @@
+"""Shared pytest setup."""
+
+import os
+
+# Settings are read when storytime.database is imported; the engine only connects on use
+os.environ.setdefault("JWT_SECRET_KEY", "test-secret")
+os.environ.setdefault("DATABASE_URL", "postgresql+asyncpg://storytime@localhost/storytime")
@@ -0,0 +1,33 @@
+"""Tests for the shared JWT helpers."""
+
+from datetime import timedelta
+
+import pytest
+from jwt import ExpiredSignatureError, InvalidTokenError
+
+from storytime.auth_tokens import bearer_token, create_access_token, decode_access_token
+
+
+def test_bearer_token():
+    assert bearer_token("Bearer abc") == "abc"
+    assert bearer_token("bearer abc") == "abc"
+    assert bearer_token("Basic abc") is None
+    assert bearer_token("Bearer") is None
+    assert bearer_token(None) is None
+
+
+def test_decode_round_trip():
+    token = create_access_token({"sub": "user-1"})
+
+    assert decode_access_token(token)["sub"] == "user-1"
+    # Served from the token cache the second time
+    assert decode_access_token(token)["sub"] == "user-1"
+
+
+def test_decode_rejects_malformed_and_expired_tokens():
+    with pytest.raises(InvalidTokenError):
+        decode_access_token("not-a-jwt")
+
+    expired = create_access_token({"sub": "user-1"}, expires_delta=timedelta(seconds=-1))
+    with pytest.raises(ExpiredSignatureError):
+        decode_access_token(expired)
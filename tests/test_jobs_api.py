@@ -0,0 +1,75 @@
+"""Tests for the job list endpoint's cursor pagination."""
+
+import os
+from datetime import datetime, timedelta
+
+import orjson
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from storytime.api.jobs import _after_cursor, _encode_cursor, list_jobs
+from storytime.database import Base, Job, JobStatus, User, new_id
+
+TEST_DATABASE_URL = os.getenv("TEST_DATABASE_URL")
+
+
+def test_cursor_binds_take_column_types():
+    job = Job(id=new_id(), created_at=datetime(2025, 1, 1, 12, 0, 0))
+    clause = _after_cursor(_encode_cursor(job))
+
+    # A VARCHAR id bind fails on Postgres with "operator does not exist: uuid < character varying"
+    bind_types = [type(bind.type) for bind in clause.right.clauses]
+
+    assert bind_types == [type(Job.created_at.type), type(Job.id.type)]
+
+
+@pytest.mark.asyncio
+@pytest.mark.skipif(not TEST_DATABASE_URL, reason="TEST_DATABASE_URL (Postgres) not set")
+async def test_list_jobs_second_page_via_next_cursor():
+    engine = create_async_engine(TEST_DATABASE_URL)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+
+    try:
+        session_factory = async_sessionmaker(engine, expire_on_commit=False)
+        async with session_factory() as db:
+            user = User(id=new_id(), email="cursor@example.com", hashed_password="x")
+            start = datetime(2025, 1, 1)
+            jobs = [
+                Job(
+                    id=new_id(),
+                    user_id=user.id,
+                    title=f"Job {i}",
+                    status=JobStatus.COMPLETED,
+                    created_at=start + timedelta(minutes=i),
+                )
+                for i in range(3)
+            ]
+            db.add(user)
+            db.add_all(jobs)
+            await db.commit()
+
+            async def fetch(cursor: str | None) -> dict:
+                response = await list_jobs(
+                    page=1,
+                    page_size=2,
+                    cursor=cursor,
+                    status=None,
+                    include_total=False,
+                    current_user=user,
+                    db=db,
+                )
+                return orjson.loads(response.body)
+
+            first = await fetch(None)
+            second = await fetch(first["next_cursor"])
+
+        newest_first = [job.id for job in reversed(jobs)]
+        assert [job["id"] for job in first["jobs"]] == newest_first[:2]
+        assert [job["id"] for job in second["jobs"]] == newest_first[2:]
+        assert second["next_cursor"] is None
+    finally:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+        await engine.dispose()
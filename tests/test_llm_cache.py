@@ -0,0 +1,40 @@
+"""Tests for the SQLite-backed LLM response cache."""
+
+import sqlite3
+import time
+
+from storytime.infrastructure.llm_cache import LLMCache
+
+
+def test_round_trip(tmp_path):
+    cache = LLMCache(str(tmp_path / "cache.sqlite3"), max_age=60)
+    cache.set("key", "cleaned text")
+
+    assert cache.get("key") == "cleaned text"
+    assert cache.get("other") is None
+
+
+def test_corrupt_value_is_a_miss(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = LLMCache(path, max_age=60)
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "INSERT INTO llm_cache (key, value, ts) VALUES (?, ?, ?)",
+            ("key", b"not zlib", int(time.time())),
+        )
+
+    assert cache.get("key") is None
+
+
+def test_expired_entries_are_missed_and_pruned(tmp_path):
+    path = str(tmp_path / "cache.sqlite3")
+    cache = LLMCache(path, max_age=60)
+    cache.set("old", "stale")
+    with sqlite3.connect(path) as conn:
+        conn.execute("UPDATE llm_cache SET ts = ts - 120 WHERE key = 'old'")
+
+    assert cache.get("old") is None
+    cache.set("new", "fresh")
+    with sqlite3.connect(path) as conn:
+        keys = [row[0] for row in conn.execute("SELECT key FROM llm_cache")]
+    assert keys == ["new"]
@@ -0,0 +1,27 @@
+"""Tests for MCP tool input handling."""
+
+import pytest
+
+from storytime.database import is_valid_id, new_id
+from storytime.mcp.auth.jwt_middleware import DEMO_USER_ID
+from storytime.mcp.tools.opening_lecture import opening_lecture
+
+
+class NoQuerySession:
+    async def execute(self, statement):
+        raise AssertionError("a malformed job id must not reach the database")
+
+
+def test_is_valid_id():
+    assert is_valid_id(new_id())
+    assert is_valid_id(DEMO_USER_ID)
+    assert not is_valid_id("demo_user_123")
+    assert not is_valid_id("")
+
+
+@pytest.mark.asyncio
+async def test_malformed_job_id_is_not_found():
+    result = await opening_lecture(NoQuerySession(), DEMO_USER_ID, "not-a-uuid")
+
+    assert result["success"] is False
+    assert result["error"] == "Job not found or access denied"
@@ -0,0 +1,93 @@
+"""Tests for windowed Gemini preprocessing and its result caching."""
+
+import pytest
+
+from storytime.services import preprocessing_service
+from storytime.services.preprocessing_service import PreprocessingService
+
+
+class FakeCache:
+    def __init__(self):
+        self.values: dict[str, str] = {}
+
+    def get(self, key: str) -> str | None:
+        return self.values.get(key)
+
+    def set(self, key: str, value: str) -> None:
+        self.values[key] = value
+
+
+def make_service(monkeypatch, generate) -> tuple[PreprocessingService, FakeCache]:
+    """Build a service whose Gemini call is replaced by generate(window)."""
+    cache = FakeCache()
+    monkeypatch.setattr(preprocessing_service, "get_llm_cache", lambda: cache)
+    service = PreprocessingService.__new__(PreprocessingService)
+    service.client = object()
+    service.model_name = "test-model"
+    service._window_chars = 4  # one word per window
+
+    async def fake_generate(window, config):
+        return await generate(window)
+
+    service._generate_cleaned_text = fake_generate
+    return service, cache
+
+
+@pytest.mark.asyncio
+async def test_cleaned_text_is_cached(monkeypatch):
+    async def generate(window):
+        return window.upper(), False
+
+    service, cache = make_service(monkeypatch, generate)
+
+    assert await service.preprocess_text("one\n\ntwo") == "ONE\n\nTWO"
+    assert list(cache.values.values()) == ["ONE\n\nTWO"]
+
+
+@pytest.mark.asyncio
+async def test_window_kept_as_original_is_not_cached(monkeypatch):
+    async def generate(window):
+        return ("", False) if window == "two" else (window.upper(), False)
+
+    service, cache = make_service(monkeypatch, generate)
+
+    assert await service.preprocess_text("one\n\ntwo") == "ONE\n\ntwo"
+    assert cache.values == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_window_is_retried(monkeypatch):
+    monkeypatch.setattr(preprocessing_service.asyncio, "sleep", _no_sleep)
+    attempts = {"two": 0}
+
+    async def generate(window):
+        if window == "two":
+            attempts["two"] += 1
+            if attempts["two"] == 1:
+                raise RuntimeError("429 Resource exhausted")
+        return window.upper(), False
+
+    service, cache = make_service(monkeypatch, generate)
+
+    assert await service.preprocess_text("one\n\ntwo") == "ONE\n\nTWO"
+    assert attempts["two"] == 2
+    assert list(cache.values.values()) == ["ONE\n\nTWO"]
+
+
+@pytest.mark.asyncio
+async def test_window_failing_every_attempt_keeps_its_text(monkeypatch):
+    monkeypatch.setattr(preprocessing_service.asyncio, "sleep", _no_sleep)
+
+    async def generate(window):
+        if window == "two":
+            raise RuntimeError("429 Resource exhausted")
+        return window.upper(), False
+
+    service, cache = make_service(monkeypatch, generate)
+
+    assert await service.preprocess_text("one\n\ntwo") == "ONE\n\ntwo"
+    assert cache.values == {}
+
+
+async def _no_sleep(seconds: float) -> None:
+    return None